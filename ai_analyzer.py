@@ -1,235 +1,477 @@
-#!/usr/bin/env python3
-"""
-AI-Powered News Analyzer using ChatGPT/OpenAI API
-Provides high-accuracy fake news detection through AI analysis
-"""
-
-import openai
-import os
-import json
-import time
-from typing import Dict, List, Optional
-
-class AIAnalyzer:
-    def __init__(self, api_key: Optional[str] = None):
-        """Initialize the AI analyzer with OpenAI API"""
-        self.api_key = api_key or os.getenv('OPENAI_API_KEY')
-        self.model = "gpt-3.5-turbo"  # Can be upgraded to gpt-4 for better accuracy
-        
-    def analyze_news_with_ai(self, text: str) -> Dict:
-        """
-        Analyze news text using ChatGPT for fake news detection
-        Returns detailed analysis with confidence scores
-        """
-        if not self.api_key:
-            return {
-                "error": "OpenAI API key not found. Please set OPENAI_API_KEY environment variable.",
-                "available": False
-            }
-        
-        try:
-            # Create a comprehensive prompt for fake news analysis
-            prompt = self._create_analysis_prompt(text)
-            
-            # Get AI analysis using the new OpenAI API
-            from openai import OpenAI
-            client = OpenAI(api_key=self.api_key)
-            
-            response = client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are an expert fact-checker and fake news detector. Analyze the given news article and provide a detailed assessment of its credibility."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                temperature=0.1,  # Low temperature for consistent results
-                max_tokens=500
-            )
-            
-            # Parse the AI response
-            ai_response = response.choices[0].message.content
-            analysis = self._parse_ai_response(ai_response)
-            
-            return {
-                "ai_analysis": analysis,
-                "raw_response": ai_response,
-                "available": True
-            }
-            
-        except Exception as e:
-            return {
-                "error": f"AI analysis failed: {str(e)}",
-                "available": False
-            }
-    
-    def _create_analysis_prompt(self, text: str) -> str:
-        """Create a comprehensive prompt for AI analysis"""
-        return f"""
-Please analyze the following news article for potential fake news indicators. Provide your assessment in the following JSON format:
-
-{{
-    "credibility_score": 0-100,
-    "is_likely_fake": true/false,
-    "confidence": 0-100,
-    "red_flags": ["list", "of", "red", "flags"],
-    "green_flags": ["list", "of", "positive", "indicators"],
-    "reasoning": "detailed explanation",
-    "recommendations": "what to check or verify"
-}}
-
-News Article:
-{text[:2000]}  # Limit text length for API efficiency
-
-Focus on:
-1. Sensational language and emotional manipulation
-2. Lack of credible sources or citations
-3. Conspiracy theory patterns
-4. Miracle cure claims
-5. Authority figure manipulation
-6. Urgency and fear tactics
-7. Contradictions with established facts
-8. Professional journalistic standards
-9. Source credibility
-10. Factual accuracy indicators
-
-Respond only with the JSON analysis.
-"""
-    
-    def _parse_ai_response(self, response: str) -> Dict:
-        """Parse the AI response into structured data"""
-        try:
-            # Try to extract JSON from the response
-            if '{' in response and '}' in response:
-                start = response.find('{')
-                end = response.rfind('}') + 1
-                json_str = response[start:end]
-                return json.loads(json_str)
-            else:
-                # Fallback parsing
-                return self._fallback_parsing(response)
-        except json.JSONDecodeError:
-            return self._fallback_parsing(response)
-    
-    def _fallback_parsing(self, response: str) -> Dict:
-        """Fallback parsing when JSON parsing fails"""
-        # Extract key information from text response
-        response_lower = response.lower()
-        
-        # Determine if likely fake
-        fake_indicators = ['fake', 'false', 'misleading', 'unreliable', 'credible', 'reliable']
-        is_likely_fake = any(indicator in response_lower for indicator in ['fake', 'false', 'misleading', 'unreliable'])
-        
-        # Estimate confidence based on response length and content
-        confidence = min(80, len(response) // 2)
-        
-        return {
-            "credibility_score": 30 if is_likely_fake else 70,
-            "is_likely_fake": is_likely_fake,
-            "confidence": confidence,
-            "red_flags": ["Unable to parse detailed analysis"],
-            "green_flags": ["AI analysis completed"],
-            "reasoning": response,
-            "recommendations": "Verify with multiple sources"
-        }
-    
-    def get_fact_checking_sources(self, topic: str) -> List[str]:
-        """Get recommended fact-checking sources for a topic"""
-        sources = [
-            "Snopes.com",
-            "FactCheck.org",
-            "PolitiFact.com",
-            "Reuters Fact Check",
-            "Associated Press Fact Check",
-            "BBC Reality Check",
-            "Full Fact (UK)",
-            "Science Feedback",
-            "Lead Stories",
-            "NewsGuard"
-        ]
-        return sources[:5]  # Return top 5 sources
-    
-    def analyze_multiple_articles(self, articles: List[str]) -> List[Dict]:
-        """Analyze multiple articles in batch"""
-        results = []
-        for i, article in enumerate(articles):
-            print(f"Analyzing article {i+1}/{len(articles)}...")
-            result = self.analyze_news_with_ai(article)
-            results.append(result)
-            time.sleep(1)  # Rate limiting
-        return results
-
-class HybridAnalyzer:
-    """Combines ML model with AI analysis for maximum accuracy"""
-    
-    def __init__(self, ml_model, ai_analyzer: AIAnalyzer):
-        self.ml_model = ml_model
-        self.ai_analyzer = ai_analyzer
-    
-    def analyze_hybrid(self, text: str) -> Dict:
-        """Combine ML and AI analysis for best results"""
-        
-        # Get ML prediction
-        ml_result = self.ml_model.predict(text)
-        
-        # Get AI analysis
-        ai_result = self.ai_analyzer.analyze_news_with_ai(text)
-        
-        # Combine results
-        if ai_result.get("available", False) and "ai_analysis" in ai_result:
-            ai_analysis = ai_result["ai_analysis"]
-            
-            # Weight the results (AI gets higher weight for accuracy)
-            ml_weight = 0.3
-            ai_weight = 0.7
-            
-            # Calculate hybrid score
-            ml_score = ml_result.get("confidence", 0.5)
-            ai_score = ai_analysis.get("credibility_score", 50) / 100
-            
-            hybrid_score = (ml_score * ml_weight) + (ai_score * ai_weight)
-            
-            # Determine final prediction
-            is_fake = hybrid_score < 0.5
-            
-            return {
-                "prediction": "FAKE" if is_fake else "REAL",
-                "confidence": hybrid_score,
-                "ml_prediction": ml_result,
-                "ai_analysis": ai_analysis,
-                "hybrid_score": hybrid_score,
-                "recommendations": ai_analysis.get("recommendations", "Verify with multiple sources"),
-                "red_flags": ai_analysis.get("red_flags", []),
-                "green_flags": ai_analysis.get("green_flags", [])
-            }
-        else:
-            # Fallback to ML only if AI is not available
-            return {
-                "prediction": ml_result.get("prediction", "UNKNOWN"),
-                "confidence": ml_result.get("confidence", 0.5),
-                "ml_prediction": ml_result,
-                "ai_analysis": {"error": "AI analysis not available"},
-                "hybrid_score": ml_result.get("confidence", 0.5),
-                "recommendations": "Use ML prediction only",
-                "red_flags": [],
-                "green_flags": []
-            }
-
-# Example usage and testing
-if __name__ == "__main__":
-    # Test the AI analyzer
-    analyzer = AIAnalyzer()
-    
-    test_articles = [
-        "BREAKING: Scientists discover that drinking hot water with lemon cures all diseases instantly! This miracle cure has been hidden by big pharma for years.",
-        "NASA's Perseverance rover successfully landed on Mars, beginning its mission to search for signs of ancient life."
-    ]
-    
-    for article in test_articles:
-        print(f"\nAnalyzing: {article[:100]}...")
-        result = analyzer.analyze_news_with_ai(article)
-        print(f"Result: {result}")
+#!/usr/bin/env python3
+"""
+AI-Powered News Analyzer using ChatGPT/OpenAI API
+Provides high-accuracy fake news detection through AI analysis
+"""
+
+import asyncio
+import contextvars
+import os
+import json
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Dict, List, Optional
+
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient, DefaultHttpxClient, OpenAI, RateLimitError, Timeout
+
+from cache import LRUCache, make_cache_key
+from config import AI_CONFIG, CACHE_CONFIG
+from keyword_matcher import get_matcher
+from metrics import AI_FAILURES, HYBRID_FALLBACKS, record_cache, stage
+from persistent_cache import SQLiteCache
+
+SYSTEM_PROMPT = "You are an expert fact-checker and fake news detector. Analyze the given news article and provide a detailed assessment of its credibility."
+MAX_COMPLETION_TOKENS = 500
+
+class TokenBucket:
+    """
+    Asyncio token bucket refilled continuously at `rate_per_minute`.
+    Used for both requests/minute (1 per call) and tokens/minute limits.
+    """
+    
+    def __init__(self, rate_per_minute: float, capacity: Optional[float] = None):
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity if capacity is not None else rate_per_minute
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+    
+    async def acquire(self, amount: float = 1.0) -> None:
+        # A single request larger than the bucket waits for a full bucket instead of forever
+        amount = min(amount, self.capacity)
+        async with self._lock:
+            self._refill()
+            while self.tokens < amount:
+                await asyncio.sleep((amount - self.tokens) / self.rate)
+                self._refill()
+            self.tokens -= amount
+
+class AIAnalyzer:
+    def __init__(self, api_key: Optional[str] = None, base_url: Optional[str] = None,
+                 cache_path: Optional[str] = None):
+        """Initialize the AI analyzer with OpenAI API"""
+        self.api_key = api_key or os.getenv('OPENAI_API_KEY')
+        self.base_url = base_url or os.getenv('OPENAI_BASE_URL')
+        self.model = "gpt-3.5-turbo"  # Can be upgraded to gpt-4 for better accuracy
+        # Persistent analysis cache; an empty path disables it
+        self.cache_path = AI_CONFIG['cache_path'] if cache_path is None else cache_path
+        self._cache = None
+        self._client = None
+        self._client_lock = threading.Lock()
+    
+    @property
+    def cache(self) -> Optional[SQLiteCache]:
+        """On-disk cache of parsed analyses, shared by all workers using the same file"""
+        if self._cache is None and self.cache_path:
+            with self._client_lock:
+                if self._cache is None:
+                    self._cache = SQLiteCache(
+                        self.cache_path,
+                        namespace='ai_analysis',
+                        ttl=AI_CONFIG['cache_ttl'],
+                        max_entries=AI_CONFIG['cache_max_entries']
+                    )
+        return self._cache
+    
+    def cache_stats(self) -> Optional[Dict]:
+        cache = self.cache
+        return cache.stats() if cache is not None else None
+    
+    @property
+    def client(self) -> OpenAI:
+        """
+        One long-lived client per analyzer. Its httpx connection pool keeps
+        connections alive between calls and is safe to share across threads.
+        """
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = OpenAI(
+                        api_key=self.api_key,
+                        base_url=self.base_url,
+                        timeout=Timeout(AI_CONFIG['request_timeout'], connect=AI_CONFIG['connect_timeout']),
+                        max_retries=AI_CONFIG['max_retries'],
+                        http_client=DefaultHttpxClient(limits=httpx.Limits(
+                            max_connections=AI_CONFIG['max_connections'],
+                            max_keepalive_connections=AI_CONFIG['max_keepalive_connections'],
+                            keepalive_expiry=AI_CONFIG['keepalive_expiry']
+                        ))
+                    )
+        return self._client
+    
+    def close(self) -> None:
+        """Close the pooled connections and this thread's cache connection"""
+        with self._client_lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+            if self._cache is not None:
+                self._cache.close()
+        
+    def analyze_news_with_ai(self, text: str) -> Dict:
+        """
+        Analyze news text using ChatGPT for fake news detection
+        Returns detailed analysis with confidence scores
+        """
+        if not self.api_key:
+            return {
+                "error": "OpenAI API key not found. Please set OPENAI_API_KEY environment variable.",
+                "available": False
+            }
+        
+        try:
+            request = self._completion_request(text)
+            cached = self._cached_result(request)
+            if cached is not None:
+                return cached
+            
+            # Get AI analysis through the pooled client
+            with stage('ai_request'):
+                response = self.client.chat.completions.create(**request)
+            
+            # Parse the AI response
+            return self._store_result(request, self._format_result(response.choices[0].message.content))
+            
+        except Exception as e:
+            AI_FAILURES.inc(reason='rate_limited' if isinstance(e, RateLimitError) else 'error')
+            return {
+                "error": f"AI analysis failed: {str(e)}",
+                "available": False
+            }
+    
+    def _completion_request(self, text: str) -> Dict:
+        """Chat completion arguments for analyzing one article"""
+        return {
+            "model": self.model,
+            "messages": [
+                {
+                    "role": "system",
+                    "content": SYSTEM_PROMPT
+                },
+                {
+                    "role": "user",
+                    # Create a comprehensive prompt for fake news analysis
+                    "content": self._create_analysis_prompt(text)
+                }
+            ],
+            "temperature": 0.1,  # Low temperature for consistent results
+            "max_tokens": MAX_COMPLETION_TOKENS
+        }
+    
+    def _format_result(self, ai_response: str) -> Dict:
+        return {
+            "ai_analysis": self._parse_ai_response(ai_response),
+            "raw_response": ai_response,
+            "available": True,
+            "cached": False
+        }
+    
+    def _cache_key(self, request: Dict) -> str:
+        """Model name + hash of the full prompt and sampling parameters"""
+        prompt = json.dumps([request["messages"], request["temperature"], request["max_tokens"]], sort_keys=True)
+        return make_cache_key(request["model"], make_cache_key(prompt))
+    
+    def _cached_result(self, request: Dict) -> Optional[Dict]:
+        if self.cache is None:
+            return None
+        cached = self.cache.get(self._cache_key(request))
+        record_cache('ai', cached is not None)
+        if cached is None:
+            return None
+        return {
+            "ai_analysis": cached["ai_analysis"],
+            "raw_response": cached["raw_response"],
+            "available": True,
+            "cached": True
+        }
+    
+    def _store_result(self, request: Dict, result: Dict) -> Dict:
+        if self.cache is not None:
+            self.cache.put(self._cache_key(request), {
+                "ai_analysis": result["ai_analysis"],
+                "raw_response": result["raw_response"]
+            })
+        return result
+    
+    def _create_analysis_prompt(self, text: str) -> str:
+        """Create a comprehensive prompt for AI analysis"""
+        return f"""
+Please analyze the following news article for potential fake news indicators. Provide your assessment in the following JSON format:
+
+{{
+    "credibility_score": 0-100,
+    "is_likely_fake": true/false,
+    "confidence": 0-100,
+    "red_flags": ["list", "of", "red", "flags"],
+    "green_flags": ["list", "of", "positive", "indicators"],
+    "reasoning": "detailed explanation",
+    "recommendations": "what to check or verify"
+}}
+
+News Article:
+{text[:2000]}  # Limit text length for API efficiency
+
+Focus on:
+1. Sensational language and emotional manipulation
+2. Lack of credible sources or citations
+3. Conspiracy theory patterns
+4. Miracle cure claims
+5. Authority figure manipulation
+6. Urgency and fear tactics
+7. Contradictions with established facts
+8. Professional journalistic standards
+9. Source credibility
+10. Factual accuracy indicators
+
+Respond only with the JSON analysis.
+"""
+    
+    def _parse_ai_response(self, response: str) -> Dict:
+        """Parse the AI response into structured data"""
+        try:
+            # Try to extract JSON from the response
+            if '{' in response and '}' in response:
+                start = response.find('{')
+                end = response.rfind('}') + 1
+                json_str = response[start:end]
+                return json.loads(json_str)
+            else:
+                # Fallback parsing
+                return self._fallback_parsing(response)
+        except json.JSONDecodeError:
+            return self._fallback_parsing(response)
+    
+    def _fallback_parsing(self, response: str) -> Dict:
+        """Fallback parsing when JSON parsing fails"""
+        # Determine if likely fake from indicator phrases in the text response
+        is_likely_fake = get_matcher('fake_indicators').counts(response)['fake_indicators'] > 0
+        
+        # Estimate confidence based on response length and content
+        confidence = min(80, len(response) // 2)
+        
+        return {
+            "credibility_score": 30 if is_likely_fake else 70,
+            "is_likely_fake": is_likely_fake,
+            "confidence": confidence,
+            "red_flags": ["Unable to parse detailed analysis"],
+            "green_flags": ["AI analysis completed"],
+            "reasoning": response,
+            "recommendations": "Verify with multiple sources"
+        }
+    
+    def get_fact_checking_sources(self, topic: str) -> List[str]:
+        """Get recommended fact-checking sources for a topic"""
+        sources = [
+            "Snopes.com",
+            "FactCheck.org",
+            "PolitiFact.com",
+            "Reuters Fact Check",
+            "Associated Press Fact Check",
+            "BBC Reality Check",
+            "Full Fact (UK)",
+            "Science Feedback",
+            "Lead Stories",
+            "NewsGuard"
+        ]
+        return sources[:5]  # Return top 5 sources
+    
+    def analyze_multiple_articles(self, articles: List[str]) -> List[Dict]:
+        """
+        Analyze multiple articles in batch, concurrently and rate limited.
+        Results come back in input order. Must not be called from a running event loop;
+        use analyze_multiple_articles_async there.
+        """
+        return asyncio.run(self.analyze_multiple_articles_async(articles))
+    
+    async def analyze_multiple_articles_async(self, articles: List[str],
+                                              concurrency: Optional[int] = None,
+                                              requests_per_minute: Optional[float] = None,
+                                              tokens_per_minute: Optional[float] = None) -> List[Dict]:
+        """Async batch analysis with bounded concurrency, RPM/TPM token buckets and 429 backoff"""
+        if not self.api_key:
+            return [self.analyze_news_with_ai(article) for article in articles]
+        
+        semaphore = asyncio.Semaphore(concurrency or AI_CONFIG['batch_concurrency'])
+        request_bucket = TokenBucket(requests_per_minute or AI_CONFIG['requests_per_minute'])
+        token_bucket = TokenBucket(tokens_per_minute or AI_CONFIG['tokens_per_minute'])
+        
+        # Async clients are bound to their event loop, so each batch run owns one
+        client = AsyncOpenAI(
+            api_key=self.api_key,
+            base_url=self.base_url,
+            timeout=Timeout(AI_CONFIG['request_timeout'], connect=AI_CONFIG['connect_timeout']),
+            max_retries=0,  # 429s are retried below, after going back through the limiters
+            http_client=DefaultAsyncHttpxClient(limits=httpx.Limits(
+                max_connections=AI_CONFIG['max_connections'],
+                max_keepalive_connections=AI_CONFIG['max_keepalive_connections'],
+                keepalive_expiry=AI_CONFIG['keepalive_expiry']
+            ))
+        )
+        
+        async def analyze(article: str) -> Dict:
+            request = self._completion_request(article)
+            cached = self._cached_result(request)
+            if cached is not None:
+                return cached
+            # Rough token estimate: ~4 characters per token plus the completion budget
+            estimated_tokens = sum(len(m["content"]) for m in request["messages"]) // 4 + MAX_COMPLETION_TOKENS
+            async with semaphore:
+                for attempt in range(AI_CONFIG['batch_max_retries'] + 1):
+                    await request_bucket.acquire(1)
+                    await token_bucket.acquire(estimated_tokens)
+                    try:
+                        response = await client.chat.completions.create(**request)
+                        return self._store_result(request, self._format_result(response.choices[0].message.content))
+                    except RateLimitError as e:
+                        if attempt == AI_CONFIG['batch_max_retries']:
+                            AI_FAILURES.inc(reason='rate_limited')
+                            return {"error": f"AI analysis failed: {str(e)}", "available": False}
+                        await asyncio.sleep(self._backoff_delay(attempt, e))
+                    except Exception as e:
+                        AI_FAILURES.inc(reason='error')
+                        return {"error": f"AI analysis failed: {str(e)}", "available": False}
+        
+        try:
+            return await asyncio.gather(*(analyze(article) for article in articles))
+        finally:
+            await client.close()
+    
+    def _backoff_delay(self, attempt: int, error: Exception) -> float:
+        """Exponential backoff with jitter, never shorter than the API's Retry-After"""
+        delay = min(AI_CONFIG['batch_backoff_max'], AI_CONFIG['batch_backoff_base'] * (2 ** attempt))
+        delay *= random.uniform(0.5, 1.0)
+        response = getattr(error, 'response', None)
+        try:
+            delay = max(delay, float(response.headers.get('retry-after')))
+        except (AttributeError, TypeError, ValueError):
+            pass
+        return delay
+
+class HybridAnalyzer:
+    """Combines ML model with AI analysis for maximum accuracy"""
+    
+    def __init__(self, ml_model, ai_analyzer: AIAnalyzer, cache_size: Optional[int] = None,
+                 ai_timeout: Optional[float] = None):
+        self.ml_model = ml_model
+        self.ai_analyzer = ai_analyzer
+        self.cache = LRUCache(CACHE_CONFIG['hybrid_cache_size'] if cache_size is None else cache_size)
+        # Deadline (seconds) for the AI leg; past it we answer with the ML result alone
+        self.ai_timeout = AI_CONFIG['hybrid_ai_timeout'] if ai_timeout is None else ai_timeout
+        self._executor = ThreadPoolExecutor(
+            max_workers=AI_CONFIG['hybrid_ai_workers'], thread_name_prefix='hybrid-ai'
+        )
+    
+    def _cache_key(self, text: str, ml_model=None) -> str:
+        """Cleaned text + ML model version + AI model, so a retrained model never hits stale entries"""
+        ml_model = self.ml_model if ml_model is None else ml_model
+        cleaned_text = ml_model.preprocess_text(text)
+        return make_cache_key(cleaned_text, getattr(ml_model, 'model_version', None), self.ai_analyzer.model)
+    
+    def analyze_hybrid(self, text: str) -> Dict:
+        """Combine ML and AI analysis for best results, reusing cached results for repeated articles"""
+        # ml_model may be swapped for a retrained one at any time; use one model for the whole call
+        ml_model = self.ml_model
+        cache_key = self._cache_key(text, ml_model)
+        cached = self.cache.get(cache_key)
+        record_cache('hybrid', cached is not None)
+        if cached is not None:
+            return cached
+        
+        result = self._analyze_uncached(text, ml_model)
+        
+        # Only cache complete analyses so a transient AI failure is retried next time
+        if "hybrid_score" in result and "error" not in result["ai_analysis"]:
+            self.cache.put(cache_key, result)
+        return result
+    
+    def _analyze_uncached(self, text: str, ml_model=None) -> Dict:
+        ml_model = self.ml_model if ml_model is None else ml_model
+        # Start the AI call first so it overlaps with the ML prediction
+        deadline = time.monotonic() + self.ai_timeout
+        # Run it in this request's context so its stage timings reach the request's timings block
+        ai_future = self._executor.submit(contextvars.copy_context().run, self.ai_analyzer.analyze_news_with_ai, text)
+        
+        # Get ML prediction
+        with stage('hybrid_ml'):
+            ml_result = ml_model.predict(text)
+        
+        # Get AI analysis, but never wait past the deadline
+        ai_timed_out = False
+        try:
+            with stage('hybrid_ai_wait'):
+                ai_result = ai_future.result(timeout=max(0.0, deadline - time.monotonic()))
+        except FutureTimeoutError:
+            # The call keeps running in its worker thread; its result is discarded
+            ai_future.cancel()
+            ai_timed_out = True
+            AI_FAILURES.inc(reason='timeout')
+            ai_result = {"error": f"AI analysis timed out after {self.ai_timeout:g}s", "available": False}
+        except Exception as e:
+            AI_FAILURES.inc(reason='error')
+            ai_result = {"error": f"AI analysis failed: {str(e)}", "available": False}
+        
+        # Combine results
+        if ai_result.get("available", False) and "ai_analysis" in ai_result:
+            ai_analysis = ai_result["ai_analysis"]
+            
+            # Weight the results (AI gets higher weight for accuracy)
+            ml_weight = 0.3
+            ai_weight = 0.7
+            
+            # Calculate hybrid score
+            ml_score = ml_result.get("confidence", 0.5)
+            ai_score = ai_analysis.get("credibility_score", 50) / 100
+            
+            hybrid_score = (ml_score * ml_weight) + (ai_score * ai_weight)
+            
+            # Determine final prediction
+            is_fake = hybrid_score < 0.5
+            
+            return {
+                "prediction": "FAKE" if is_fake else "REAL",
+                "confidence": hybrid_score,
+                "ml_prediction": ml_result,
+                "ai_analysis": ai_analysis,
+                "hybrid_score": hybrid_score,
+                "recommendations": ai_analysis.get("recommendations", "Verify with multiple sources"),
+                "red_flags": ai_analysis.get("red_flags", []),
+                "green_flags": ai_analysis.get("green_flags", []),
+                "ai_timed_out": False
+            }
+        else:
+            # Fallback to ML only if AI is not available
+            HYBRID_FALLBACKS.inc(reason='timeout' if ai_timed_out else 'ai_unavailable')
+            return {
+                "prediction": ml_result.get("prediction", "UNKNOWN"),
+                "confidence": ml_result.get("confidence", 0.5),
+                "ml_prediction": ml_result,
+                "ai_analysis": {"error": ai_result["error"] if ai_timed_out else "AI analysis not available"},
+                "hybrid_score": ml_result.get("confidence", 0.5),
+                "recommendations": "Use ML prediction only",
+                "red_flags": [],
+                "green_flags": [],
+                "ai_timed_out": ai_timed_out
+            }
+
+# Example usage and testing
+if __name__ == "__main__":
+    # Test the AI analyzer
+    analyzer = AIAnalyzer()
+    
+    test_articles = [
+        "BREAKING: Scientists discover that drinking hot water with lemon cures all diseases instantly! This miracle cure has been hidden by big pharma for years.",
+        "NASA's Perseverance rover successfully landed on Mars, beginning its mission to search for signs of ancient life."
+    ]
+    
+    for article in test_articles:
+        print(f"\nAnalyzing: {article[:100]}...")
+        result = analyzer.analyze_news_with_ai(article)
+        print(f"Result: {result}")
@@ -1,284 +1,448 @@
-from flask import Flask, render_template, request, jsonify
-import pickle
-import numpy as np
-import pandas as pd
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.ensemble import RandomForestClassifier
-from sklearn.model_selection import train_test_split
-from sklearn.metrics import accuracy_score, classification_report
-import nltk
-from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize
-from textblob import TextBlob
-import re
-import os
-from typing import Any, Dict
-
-# Import AI analyzer
-try:
-    from ai_analyzer import AIAnalyzer, HybridAnalyzer
-    AI_AVAILABLE = True
-except ImportError:
-    AI_AVAILABLE = False
-    print("AI analyzer not available. Install openai package for enhanced accuracy.")
-
-app = Flask(__name__)
-
-# Download required NLTK data
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt')
-
-try:
-    nltk.data.find('corpora/stopwords')
-except LookupError:
-    nltk.download('stopwords')
-
-class FakeNewsDetector:
-    def __init__(self):
-        self.vectorizer = TfidfVectorizer(max_features=5000, stop_words='english')
-        self.classifier = RandomForestClassifier(n_estimators=100, random_state=42)
-        self.is_trained = False
-        
-    def preprocess_text(self, text):
-        """Clean and preprocess text data"""
-        if pd.isna(text):
-            return ""
-        
-        # Convert to lowercase
-        text = str(text).lower()
-        
-        # Remove special characters and digits
-        text = re.sub(r'[^a-zA-Z\s]', '', text)
-        
-        # Remove extra whitespace
-        text = ' '.join(text.split())
-        
-        return text
-    
-    def extract_features(self, text):
-        """Extract additional features from text"""
-        blob = TextBlob(text)
-        
-        features = {
-            'text_length': len(text),
-            'word_count': len(text.split()),
-            'avg_word_length': np.mean([len(word) for word in text.split()]) if text.split() else 0,
-            'sentiment_polarity': blob.sentiment.polarity,
-            'sentiment_subjectivity': blob.sentiment.subjectivity,
-            'exclamation_count': text.count('!'),
-            'question_count': text.count('?'),
-            'uppercase_count': sum(1 for c in text if c.isupper()),
-            'url_count': len(re.findall(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+', text))
-        }
-        
-        return features
-    
-    def train(self, data_path=None):
-        """Train the model with sample data or provided dataset"""
-        if data_path and os.path.exists(data_path):
-            # Load custom dataset
-            df = pd.read_csv(data_path)
-        else:
-            # Create sample dataset for demonstration
-            df = self.create_sample_dataset()
-        
-        # Preprocess text
-        df['cleaned_text'] = df['text'].apply(self.preprocess_text)
-        
-        # Extract features
-        feature_data = []
-        for text in df['cleaned_text']:
-            features = self.extract_features(text)
-            feature_data.append(features)
-        
-        feature_df = pd.DataFrame(feature_data)
-        
-        # Combine text features with extracted features
-        X_text = self.vectorizer.fit_transform(df['cleaned_text'])
-        X_features = feature_df.values
-        
-        # Combine features
-        X_combined = np.hstack([X_text.toarray(), X_features])
-        y = df['label'].values
-        
-        # Train classifier
-        self.classifier.fit(X_combined, y)
-        self.is_trained = True
-        
-        return accuracy_score(y, self.classifier.predict(X_combined))
-    
-    def create_sample_dataset(self):
-        """Create a sample dataset for demonstration"""
-        sample_data = {
-            'text': [
-                # Fake news examples
-                "BREAKING: Scientists discover that drinking hot water with lemon cures all diseases instantly! This miracle cure has been hidden by big pharma for years.",
-                "ALIENS CONFIRMED: Government admits to covering up extraterrestrial contact for decades. Shocking new evidence reveals everything.",
-                "5G CAUSES COVID: New study proves that 5G networks are responsible for the coronavirus pandemic. Experts say radiation is the real culprit.",
-                "FLAT EARTH PROVEN: NASA finally admits the Earth is flat after pressure from social media. All space photos were CGI.",
-                "TIME TRAVEL ACHIEVED: Scientists successfully send a cat back to 1920. The cat returned with a message from the past.",
-                
-                # Real news examples
-                "NASA's Perseverance rover successfully landed on Mars, beginning its mission to search for signs of ancient life.",
-                "The World Health Organization reports that COVID-19 vaccines have been proven safe and effective in clinical trials.",
-                "Scientists discover new species of deep-sea creatures in the Pacific Ocean during research expedition.",
-                "Global temperatures continue to rise, with 2023 being one of the warmest years on record according to climate data.",
-                "Researchers develop new renewable energy technology that could reduce carbon emissions by 50%.",
-                "Study shows that regular exercise can improve mental health and reduce symptoms of depression.",
-                "New cancer treatment shows promising results in early clinical trials, offering hope for patients.",
-                "International space station celebrates 20 years of continuous human presence in space.",
-                "Renewable energy sources now provide over 30% of global electricity generation.",
-                "Scientists develop biodegradable plastic alternative made from plant materials."
-            ],
-            'label': [1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]  # 1 for fake, 0 for real
-        }
-        return pd.DataFrame(sample_data)
-    
-    def predict(self, text):
-        """Predict whether a news article is fake or real"""
-        if not self.is_trained:
-            return {"error": "Model not trained. Please train the model first."}
-        
-        # Preprocess text
-        cleaned_text = self.preprocess_text(text)
-        
-        # Extract features
-        features = self.extract_features(cleaned_text)
-        
-        # Vectorize text
-        text_vector = self.vectorizer.transform([cleaned_text])
-        
-        # Combine features
-        X_combined = np.hstack([text_vector.toarray(), np.array([list(features.values())])])
-        
-        # Make prediction
-        prediction = self.classifier.predict(X_combined)[0]
-        probability = self.classifier.predict_proba(X_combined)[0]
-        
-        return {
-            "prediction": "FAKE" if prediction == 1 else "REAL",
-            "confidence": float(max(probability)),
-            "fake_probability": float(probability[1]),
-            "real_probability": float(probability[0]),
-            "features": features
-        }
-
-# Initialize the detector
-detector = FakeNewsDetector()
-
-# Initialize AI analyzer if available
-ai_analyzer = None
-hybrid_analyzer = None
-if AI_AVAILABLE:
-    try:
-        ai_analyzer = AIAnalyzer()
-        hybrid_analyzer = HybridAnalyzer(detector, ai_analyzer)
-        print("✅ AI analyzer initialized successfully!")
-    except Exception as e:
-        print(f"⚠️ AI analyzer initialization failed: {e}")
-        ai_analyzer = None
-        hybrid_analyzer = None
-
-# Web verifier import
-try:
-    from web_verifier import WebVerifier
-    web_verifier = WebVerifier()
-    print("✅ Web verifier initialized")
-except Exception as _e:
-    web_verifier = None
-
-@app.route('/')
-def index():
-    return render_template('index.html')
-
-@app.route('/predict', methods=['POST'])
-def predict_news():
-    try:
-        data = request.get_json()
-        news_text = data.get('text', '')
-        use_ai = data.get('use_ai', True)  # Default to using AI if available
-        
-        if not news_text.strip():
-            return jsonify({"error": "Please provide news text"}), 400
-        
-        # Train model if not already trained
-        if not detector.is_trained:
-            detector.train()
-        
-        # Use hybrid analysis if AI is available and requested
-        if use_ai and hybrid_analyzer:
-            result = hybrid_analyzer.analyze_hybrid(news_text)
-            result['analysis_type'] = 'hybrid'
-            result['ai_available'] = True
-        else:
-            # Fallback to ML only
-            result = detector.predict(news_text)
-            result['analysis_type'] = 'ml_only'
-            result['ai_available'] = False
-        
-        return jsonify(result)
-    
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
-
-@app.route('/train', methods=['POST'])
-def train_model():
-    try:
-        # Train the model
-        accuracy = detector.train()
-        return jsonify({
-            "message": "Model trained successfully",
-            "accuracy": accuracy
-        })
-    
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
-
-@app.route('/health')
-def health_check():
-    return jsonify({
-        "status": "healthy", 
-        "model_trained": detector.is_trained,
-        "ai_available": ai_analyzer is not None,
-        "hybrid_available": hybrid_analyzer is not None
-    })
-
-@app.route('/ai_status')
-def ai_status():
-    """Check AI analyzer status and capabilities"""
-    if ai_analyzer:
-        return jsonify({
-            "ai_available": True,
-            "model": ai_analyzer.model,
-            "capabilities": [
-                "fake news detection",
-                "credibility scoring",
-                "red flag identification",
-                "fact-checking recommendations"
-            ]
-        })
-    else:
-        return jsonify({
-            "ai_available": False,
-            "message": "OpenAI API key not configured or package not installed"
-        })
-
-@app.route('/verify', methods=['POST'])
-def verify_on_web():
-    """Verify the news text against web sources using DuckDuckGo search."""
-    try:
-        data: Dict[str, Any] = request.get_json() or {}
-        news_text: str = data.get('text', '').strip()
-        if not news_text:
-            return jsonify({'error': 'Please provide news text'}), 400
-        if web_verifier is None:
-            return jsonify({'error': 'Web verifier not available'}), 500
-        result = web_verifier.verify(news_text)
-        return jsonify(result)
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
-
-if __name__ == '__main__':
+from flask import Flask, Response, g, render_template, request, jsonify
+import functools
+import importlib.util
+import os
+import shutil
+import threading
+import time
+import uuid
+from typing import Any, Dict
+
+from config import API_CONFIG, MODEL_CONFIG, ONLINE_CONFIG
+from feedback import FeedbackBuffer, parse_label
+import metrics
+import profiling
+from training_jobs import TrainingJobManager
+
+# The AI analyzer (openai) and web verifier (duckduckgo_search) are imported on
+# first use; checking that they are installed doesn't import them
+AI_AVAILABLE = importlib.util.find_spec('openai') is not None
+if not AI_AVAILABLE:
+    print("AI analyzer not available. Install openai package for enhanced accuracy.")
+
+app = Flask(__name__)
+
+# The live detector (detector.FakeNewsDetector) is loaded from the saved artifact
+# on first use, or by start_warm_up() when serving; numpy, pandas and sklearn are
+# only imported then, so the app answers /health as soon as Flask is up
+detector = None
+
+# AI analyzer, hybrid analyzer and web verifier are also created on first use;
+# None after that means the component is unavailable
+ai_analyzer = None
+hybrid_analyzer = None
+web_verifier = None
+_initialized = set()
+_components_lock = threading.Lock()
+
+# Training runs in the background on a fresh detector, which then replaces
+# the live one in a single assignment; request handlers read `detector` once
+training_jobs = TrainingJobManager(
+    max_workers=MODEL_CONFIG['training_workers'], history=MODEL_CONFIG['training_job_history']
+)
+_detector_lock = threading.Lock()
+_first_train_lock = threading.Lock()
+
+def swap_detector(model, expected=None):
+    """
+    Make a fully trained detector live for all new requests.
+    With `expected`, only swap if that detector is still the live one.
+    """
+    global detector
+    with _detector_lock:
+        if expected is not None and detector is not expected:
+            return False
+        detector = model
+        if hybrid_analyzer:
+            hybrid_analyzer.ml_model = model
+            hybrid_analyzer.cache.clear()
+        return True
+
+def get_detector():
+    """The live detector, loading the saved one or training one first if there is none yet"""
+    global detector
+    model = detector
+    if model is None or not model.is_trained:
+        # numpy, pandas and sklearn are first imported here
+        from detector import FakeNewsDetector, load_detector
+        # Serialize first-request loading and training so concurrent callers don't each do it
+        with _first_train_lock:
+            if detector is None:
+                loaded = load_detector()
+                with _detector_lock:
+                    # A /train job may have swapped in a model meanwhile; keep that one
+                    if detector is None:
+                        detector = loaded
+            model = detector
+            if not model.is_trained:
+                model = FakeNewsDetector()
+                model.train()
+                swap_detector(model)
+    return model
+
+def get_ai_analyzer():
+    """The AI analyzer, created (and openai imported) on first call; None if unavailable"""
+    global ai_analyzer
+    if 'ai' not in _initialized:
+        with _components_lock:
+            if 'ai' not in _initialized:
+                if AI_AVAILABLE:
+                    try:
+                        from ai_analyzer import AIAnalyzer
+                        ai_analyzer = AIAnalyzer()
+                        print("✅ AI analyzer initialized successfully!")
+                    except Exception as e:
+                        print(f"⚠️ AI analyzer initialization failed: {e}")
+                        ai_analyzer = None
+                _initialized.add('ai')
+    return ai_analyzer
+
+def get_hybrid_analyzer():
+    """The hybrid ML + AI analyzer, created on first call; None without an AI analyzer"""
+    global hybrid_analyzer
+    if 'hybrid' not in _initialized:
+        analyzer = get_ai_analyzer()
+        if analyzer:
+            get_detector()
+        with _components_lock:
+            if 'hybrid' not in _initialized:
+                if analyzer:
+                    from ai_analyzer import HybridAnalyzer
+                    # Under the swap lock, so a concurrent /train swap can't be missed
+                    with _detector_lock:
+                        hybrid_analyzer = HybridAnalyzer(detector, analyzer)
+                _initialized.add('hybrid')
+    return hybrid_analyzer
+
+def _ai_configured():
+    """Whether AI analysis can work: the created analyzer has a key, or (before it exists) one is set"""
+    if 'ai' in _initialized:
+        return ai_analyzer is not None and bool(ai_analyzer.api_key)
+    return AI_AVAILABLE and bool(os.getenv('OPENAI_API_KEY'))
+
+def get_web_verifier():
+    """The web verifier, created (and its search client imported) on first call; None if unavailable"""
+    global web_verifier
+    if 'web' not in _initialized:
+        with _components_lock:
+            if 'web' not in _initialized:
+                try:
+                    from web_verifier import WebVerifier
+                    web_verifier = WebVerifier()
+                    print("✅ Web verifier initialized")
+                except Exception:
+                    web_verifier = None
+                _initialized.add('web')
+    return web_verifier
+
+def warm_up():
+    """Load the model and create the lazy components ahead of the first request"""
+    start = time.perf_counter()
+    try:
+        get_detector()
+        get_hybrid_analyzer()
+        get_web_verifier()
+        print(f"✅ Warm-up finished in {time.perf_counter() - start:.2f}s")
+    except Exception as e:
+        print(f"⚠️ Warm-up failed, components will load on first request: {e}")
+
+def start_warm_up():
+    """Warm up in a background thread so the server answers (/health) right away"""
+    thread = threading.Thread(target=warm_up, name='warm-up', daemon=True)
+    thread.start()
+    return thread
+
+def run_training_job(job, data_path=None):
+    """Train a new detector, save it, then swap it in; cancellation is honored up to the swap"""
+    from detector import FakeNewsDetector
+    from model_store import publish_artifact
+
+    data_path = data_path or MODEL_CONFIG['training_data_path']
+    model = FakeNewsDetector()
+    if model.mode == 'online' and data_path:
+        # Stream large datasets in chunks instead of loading them whole
+        result = model.train_streaming(data_path, progress=job.report)
+    else:
+        result = {"accuracy": model.train(data_path, progress=job.report)}
+    # Save next to the live artifact and only replace it after the last cancellation checkpoint
+    artifact_path = MODEL_CONFIG['artifact_path']
+    staging = f"{artifact_path.rstrip(os.sep)}.staging-{uuid.uuid4().hex[:8]}"
+    try:
+        job.report('saving', 0.95)
+        model.save(staging)
+        job.report('swapping', 0.99)
+        publish_artifact(staging, artifact_path)
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+    swap_detector(model)
+    result["model_version"] = model.model_version
+    return result
+
+def profile_training_job(mode, job):
+    """run_training_job under a profiler; the profile summary is added to the job result"""
+    result, profile = profiling.profile_call(mode, 'train', run_training_job, job)
+    result["profile"] = profile
+    return result
+
+def apply_feedback(texts, labels):
+    """Fold a feedback micro-batch into the live online model"""
+    for _ in range(3):
+        base = get_detector()
+        model = base.partial_fit(texts, labels)
+        # A /train job may have swapped in a new model meanwhile; redo the update on top of it
+        if swap_detector(model, expected=base):
+            break
+    else:
+        raise RuntimeError("Live model kept changing; feedback batch not applied")
+    if model.n_updates % ONLINE_CONFIG['save_every_batches'] == 0:
+        model.save(MODEL_CONFIG['artifact_path'])
+
+feedback_buffer = FeedbackBuffer(
+    apply_feedback,
+    batch_size=ONLINE_CONFIG['feedback_batch_size'],
+    flush_interval=ONLINE_CONFIG['feedback_flush_interval'],
+    max_buffered=ONLINE_CONFIG['feedback_max_buffered']
+)
+
+@app.before_request
+def start_request_metrics():
+    g.request_start = time.perf_counter()
+    # ?timings=1 adds a per-stage "timings" block (milliseconds) to JSON responses
+    if request.args.get('timings'):
+        metrics.start_timings()
+
+@app.after_request
+def finish_request_metrics(response):
+    elapsed = time.perf_counter() - g.get('request_start', time.perf_counter())
+    metrics.observe_request(request.url_rule.rule if request.url_rule else 'unmatched', response.status_code, elapsed)
+    timings = metrics.stop_timings()
+    if timings is not None and response.is_json:
+        data = response.get_json(silent=True)
+        if isinstance(data, dict):
+            data['timings'] = {'stages_ms': timings, 'total_ms': round(elapsed * 1000, 3)}
+            response.set_data(app.json.dumps(data))
+    return response
+
+@app.teardown_request
+def clear_request_timings(exc):
+    # Test clients reuse one thread for many requests; never leak a timings block into the next
+    metrics.stop_timings()
+
+@app.route('/metrics')
+def metrics_endpoint():
+    """Counters and histograms in the Prometheus text format"""
+    return Response(metrics.REGISTRY.render(), content_type=metrics.CONTENT_TYPE)
+
+@app.route('/')
+def index():
+    return render_template('index.html')
+
+@app.route('/predict', methods=['POST'])
+def predict_news():
+    try:
+        data = request.get_json()
+        news_text = data.get('text', '')
+        use_ai = data.get('use_ai', True)  # Default to using AI if available
+        
+        if not news_text.strip():
+            return jsonify({"error": "Please provide news text"}), 400
+        
+        # Train model if not already trained
+        model = get_detector()
+        
+        # Use hybrid analysis if AI is available and requested
+        hybrid = get_hybrid_analyzer() if use_ai else None
+        if hybrid:
+            result = hybrid.analyze_hybrid(news_text)
+            result['analysis_type'] = 'hybrid'
+            result['ai_available'] = True
+        else:
+            # Fallback to ML only
+            result = model.predict(news_text)
+            result['analysis_type'] = 'ml_only'
+            result['ai_available'] = False
+        
+        return jsonify(result)
+    
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+@app.route('/predict/batch', methods=['POST'])
+def predict_news_batch():
+    """Analyze a JSON array of news texts with the ML model in one pass"""
+    try:
+        data = request.get_json()
+        if isinstance(data, dict):
+            data = data.get('texts')
+        if not isinstance(data, list):
+            return jsonify({"error": "Please provide a JSON array of news texts"}), 400
+        
+        max_batch_size = API_CONFIG['max_batch_size']
+        if len(data) > max_batch_size:
+            return jsonify({"error": f"Batch too large (max {max_batch_size} texts)"}), 413
+        
+        # Validate per item so one bad entry doesn't fail the whole batch
+        results = [None] * len(data)
+        valid_indexes = []
+        for i, item in enumerate(data):
+            if isinstance(item, dict):
+                item = item.get('text', '')
+            if not isinstance(item, str) or not item.strip():
+                results[i] = {"error": "Please provide news text"}
+            else:
+                data[i] = item
+                valid_indexes.append(i)
+        
+        if valid_indexes:
+            # Train model if not already trained
+            predictions = get_detector().predict_batch([data[i] for i in valid_indexes])
+            for i, prediction in zip(valid_indexes, predictions):
+                prediction['analysis_type'] = 'ml_only'
+                results[i] = prediction
+        
+        for i, result in enumerate(results):
+            result['index'] = i
+        
+        return jsonify({"results": results, "count": len(results)})
+    
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+@app.route('/train', methods=['POST'])
+def train_model():
+    """Start a background training job; poll /train/<job_id> for its status"""
+    try:
+        mode, error = profiling.requested_mode(request)
+        if error:
+            return jsonify(error[0]), error[1]
+        # A profiled /train profiles the job itself; the request only queues it
+        job = training_jobs.submit(functools.partial(profile_training_job, mode) if mode else run_training_job)
+        return jsonify({
+            "message": "Training started",
+            "job_id": job.job_id,
+            "status": job.status,
+            "status_url": f"/train/{job.job_id}"
+        }), 202
+    
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+@app.route('/train/<job_id>')
+def training_status(job_id):
+    job = training_jobs.get(job_id)
+    if job is None:
+        return jsonify({"error": "Unknown training job"}), 404
+    return jsonify(job.to_dict())
+
+@app.route('/train/<job_id>/cancel', methods=['POST'])
+def cancel_training(job_id):
+    job = training_jobs.cancel(job_id)
+    if job is None:
+        return jsonify({"error": "Unknown training job"}), 404
+    return jsonify(job.to_dict())
+
+@app.route('/feedback', methods=['POST'])
+def submit_feedback():
+    """
+    Queue labeled articles ({"text": ..., "label": "FAKE" | "REAL"}, a list of
+    them, or {"items": [...]}) for the online model. ?flush=1 applies them before returning.
+    """
+    try:
+        model = get_detector()
+        if model.mode != 'online':
+            return jsonify({"error": "Online learning is disabled (set MODEL_CONFIG['mode'] = 'online')"}), 409
+        
+        data = request.get_json()
+        if isinstance(data, dict):
+            data = data.get('items', [data])
+        if not isinstance(data, list) or not data:
+            return jsonify({"error": "Please provide labeled news texts"}), 400
+        
+        examples = []
+        for i, item in enumerate(data):
+            text = item.get('text') if isinstance(item, dict) else None
+            label = parse_label(item.get('label')) if isinstance(item, dict) else None
+            if not isinstance(text, str) or not text.strip() or label is None:
+                return jsonify({"error": "Each item needs non-empty text and a FAKE/REAL label", "index": i}), 400
+            examples.append((text, label))
+        
+        if not feedback_buffer.add(examples):
+            return jsonify({"error": "Feedback backlog is full, try again later"}), 503
+        if request.args.get('flush'):
+            feedback_buffer.flush()
+        
+        return jsonify({
+            "accepted": len(examples),
+            "buffered": len(feedback_buffer),
+            "model_version": (detector or model).model_version
+        }), 202
+    
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+@app.route('/health')
+def health_check():
+    # Answers without loading anything: components not loaded yet report as such
+    model = detector
+    return jsonify({
+        "status": "healthy", 
+        "model_loaded": model is not None,
+        "model_trained": model is not None and model.is_trained,
+        "model_version": model.model_version if model else None,
+        "model_mode": model.mode if model else MODEL_CONFIG['mode'],
+        "feedback": feedback_buffer.stats() if model and model.mode == 'online' else None,
+        "ai_available": _ai_configured(),
+        "hybrid_available": _ai_configured() and ('hybrid' not in _initialized or hybrid_analyzer is not None),
+        "cache": {
+            "prediction": model.prediction_cache.stats() if model else None,
+            "hybrid": hybrid_analyzer.cache.stats() if hybrid_analyzer else None,
+            "search": web_verifier.cache_stats() if web_verifier else None
+        }
+    })
+
+@app.route('/ai_status')
+def ai_status():
+    """Check AI analyzer status and capabilities"""
+    analyzer = get_ai_analyzer()
+    if analyzer and _ai_configured():
+        return jsonify({
+            "ai_available": True,
+            "model": analyzer.model,
+            "cache": analyzer.cache_stats(),
+            "capabilities": [
+                "fake news detection",
+                "credibility scoring",
+                "red flag identification",
+                "fact-checking recommendations"
+            ]
+        })
+    else:
+        return jsonify({
+            "ai_available": False,
+            "message": "OpenAI API key not configured or package not installed"
+        })
+
+@app.route('/verify', methods=['POST'])
+def verify_on_web():
+    """Verify the news text against web sources using DuckDuckGo search."""
+    try:
+        data: Dict[str, Any] = request.get_json() or {}
+        news_text: str = data.get('text', '').strip()
+        if not news_text:
+            return jsonify({'error': 'Please provide news text'}), 400
+        verifier = get_web_verifier()
+        if verifier is None:
+            return jsonify({'error': 'Web verifier not available'}), 500
+        result = verifier.verify(news_text)
+        return jsonify(result)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+# Authorized ?profile= requests on these endpoints run under a profiler (no-op without an admin token)
+profiling.install(app, ('predict_news', 'verify_on_web'))
+
+if __name__ == '__main__':
+    # With the debug reloader only the serving child process (WERKZEUG_RUN_MAIN) needs a warm model
+    if os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        start_warm_up()
     app.run(debug=True, host='0.0.0.0', port=5000) 
\ No newline at end of file
@@ -0,0 +1,997 @@
+#!/usr/bin/env python3
+"""
+Offline benchmarks for the Fake News Detection System
+Usage: python benchmark.py <benchmark> [--sizes N ...]
+"""
+
+import argparse
+import asyncio
+import io
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import urllib.request
+
+import numpy as np
+import joblib
+import pandas as pd
+from sklearn.feature_extraction.text import TfidfVectorizer
+from bs4 import BeautifulSoup
+from textblob import TextBlob
+
+from ai_analyzer import AIAnalyzer
+from detector import FakeNewsDetector
+from classifiers import CLASSIFIER_BACKENDS
+from compiled_forest import CompiledForest
+from config import MODEL_CONFIG
+from data_generator import create_expanded_dataset
+from fake_openai import FakeOpenAIServer
+from fake_search import StaticSearchBackend
+from domains import ReputationIndex
+from keyword_matcher import KeywordMatcher
+from html_title import CHUNK_SIZE, read_title
+from model_store import artifact_exists
+from persistent_cache import SQLiteCache
+from sentiment import get_lexicon
+from web_verifier import WebVerifier, normalize_query
+
+DATASET_PATH = 'expanded_dataset.csv'
+OUTPUT_PATH = 'bench_output.txt'
+
+
+def load_corpus(n_rows, seed=42):
+    """Build a corpus of n_rows articles by resampling the bundled dataset"""
+    if os.path.exists(DATASET_PATH):
+        base = pd.read_csv(DATASET_PATH)
+    else:
+        base = FakeNewsDetector().create_sample_dataset()
+    return base.sample(n=n_rows, replace=True, random_state=seed).reset_index(drop=True)
+
+
+def matrix_nbytes(X):
+    """Memory held by a dense or CSR feature matrix"""
+    if hasattr(X, 'indptr'):
+        return X.data.nbytes + X.indices.nbytes + X.indptr.nbytes
+    return X.nbytes
+
+
+def _featurize(detector, df):
+    """Token lists and hand-crafted features, tokenized once as in train()"""
+    token_lists = [detector.tokenize(text) for text in df['text']]
+    _, feature_df = detector.featurize(token_lists)
+    return token_lists, feature_df.values
+
+
+def _build_dense(detector, token_lists, features):
+    """The pre-sparse pipeline: densify TF-IDF and hstack the raw features"""
+    X_text = detector.vectorizer.fit_transform(token_lists)
+    return np.hstack([X_text.toarray(), features])
+
+
+def _build_sparse(detector, token_lists, features):
+    X_text = detector.vectorizer.fit_transform(token_lists)
+    return detector.combine_features(X_text, features, fit=True)
+
+
+def _measure(build, *args):
+    tracemalloc.start()
+    start = time.perf_counter()
+    X = build(*args)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return X, elapsed, peak
+
+
+def bench_sparse(sizes, predict_rounds=200):
+    """Memory and latency of the dense vs sparse feature matrices"""
+    results = []
+    sample_text = "BREAKING: Scientists discover that drinking hot water with lemon cures all diseases instantly!"
+    for n_rows in sizes:
+        df = load_corpus(n_rows)
+        detector = FakeNewsDetector()
+        token_lists, features = _featurize(detector, df)
+        y = df['label'].values
+
+        for mode, build in (('dense', _build_dense), ('sparse', _build_sparse)):
+            X, build_s, peak = _measure(build, detector, token_lists, features)
+
+            start = time.perf_counter()
+            detector.classifier.fit(X, y)
+            fit_s = time.perf_counter() - start
+
+            # Time the per-request combine + classify step on the same fitted model
+            tokens_one = detector.tokenize(sample_text)
+            vector = detector.vectorizer.transform([tokens_one])
+            row = detector.featurize([tokens_one])[1].values.tolist()
+            start = time.perf_counter()
+            for _ in range(predict_rounds):
+                if mode == 'sparse':
+                    X_one = detector.combine_features(vector, row)
+                else:
+                    X_one = np.hstack([vector.toarray(), np.array(row)])
+                detector.classifier.predict_proba(X_one)
+            predict_ms = (time.perf_counter() - start) / predict_rounds * 1000
+
+            results.append({
+                'benchmark': 'sparse',
+                'mode': mode,
+                'rows': n_rows,
+                'columns': X.shape[1],
+                'matrix_mb': round(matrix_nbytes(X) / 1e6, 3),
+                'build_peak_mb': round(peak / 1e6, 3),
+                'build_s': round(build_s, 4),
+                'fit_s': round(fit_s, 4),
+                'predict_ms': round(predict_ms, 3),
+            })
+    return results
+
+
+def _legacy_featurize(texts):
+    """The pre-fusion pipeline: regex cleanup, three splits and TextBlob per text, then re-tokenize in TF-IDF"""
+    url_pattern = r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+'
+    cleaned = [' '.join(re.sub(r'[^a-zA-Z\s]', '', str(t).lower()).split()) for t in texts]
+    rows = []
+    for text in cleaned:
+        blob = TextBlob(text)
+        rows.append({
+            'text_length': len(text),
+            'word_count': len(text.split()),
+            'avg_word_length': np.mean([len(word) for word in text.split()]) if text.split() else 0,
+            'sentiment_polarity': blob.sentiment.polarity,
+            'sentiment_subjectivity': blob.sentiment.subjectivity,
+            'exclamation_count': text.count('!'),
+            'question_count': text.count('?'),
+            'uppercase_count': sum(1 for c in text if c.isupper()),
+            'url_count': len(re.findall(url_pattern, text))
+        })
+    features = pd.DataFrame(rows)
+    X_text = TfidfVectorizer(max_features=5000, stop_words='english').fit_transform(cleaned)
+    return X_text, features
+
+
+def _fused_featurize(detector, texts):
+    token_lists = [detector.tokenize(t) for t in texts]
+    _, features = detector.featurize(token_lists)
+    X_text = detector.vectorizer.fit_transform(token_lists)
+    return X_text, features
+
+
+def bench_featurize(sizes):
+    """Legacy per-document featurization vs tokenize-once batch featurization"""
+    results = []
+    for n_rows in sizes:
+        texts = list(load_corpus(n_rows)['text'])
+        for mode in ('legacy', 'fused'):
+            start = time.perf_counter()
+            if mode == 'legacy':
+                _legacy_featurize(texts)
+            else:
+                _fused_featurize(FakeNewsDetector(), texts)
+            elapsed = time.perf_counter() - start
+            results.append({
+                'benchmark': 'featurize',
+                'mode': mode,
+                'rows': n_rows,
+                'total_s': round(elapsed, 4),
+                'docs_per_s': round(n_rows / elapsed, 1),
+            })
+    return results
+
+
+def bench_sentiment(sizes):
+    """TextBlob per document vs the array-backed lexicon scorer on cleaned text"""
+    results = []
+    detector = FakeNewsDetector()
+    lexicon = get_lexicon()
+    for n_rows in sizes:
+        token_lists = [detector.tokenize(t) for t in load_corpus(n_rows)['text']]
+        cleaned = [' '.join(tokens) for tokens in token_lists]
+
+        start = time.perf_counter()
+        for text in cleaned:
+            TextBlob(text).sentiment
+        textblob_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        lexicon.score_batch(token_lists)
+        lexicon_s = time.perf_counter() - start
+
+        results.append({
+            'benchmark': 'sentiment',
+            'rows': n_rows,
+            'textblob_s': round(textblob_s, 4),
+            'lexicon_s': round(lexicon_s, 4),
+            'speedup': round(textblob_s / lexicon_s, 1),
+        })
+    return results
+
+
+def bench_ai_client(sizes):
+    """Per-call latency of a fresh OpenAI client per call vs the pooled client, against a local stub"""
+    from openai import OpenAI
+
+    results = []
+    for n_calls in sizes:
+        for mode in ('client_per_call', 'pooled'):
+            with FakeOpenAIServer() as server:
+                analyzer = AIAnalyzer(api_key='benchmark', base_url=server.base_url, cache_path='')
+                if mode == 'client_per_call':
+                    # What analyze_news_with_ai used to do on every call
+                    def call(text):
+                        client = OpenAI(api_key=analyzer.api_key, base_url=analyzer.base_url)
+                        client.chat.completions.create(
+                            model=analyzer.model, max_tokens=500, temperature=0.1,
+                            messages=[{"role": "user", "content": analyzer._create_analysis_prompt(text)}]
+                        )
+                else:
+                    call = analyzer.analyze_news_with_ai
+
+                call("warm-up article")
+                latencies = []
+                for i in range(n_calls):
+                    start = time.perf_counter()
+                    call(f"Benchmark article number {i}")
+                    latencies.append((time.perf_counter() - start) * 1000)
+                analyzer.close()
+
+                results.append({
+                    'benchmark': 'ai_client',
+                    'mode': mode,
+                    'calls': n_calls,
+                    'p50_ms': round(float(np.percentile(latencies, 50)), 3),
+                    'p99_ms': round(float(np.percentile(latencies, 99)), 3),
+                    'connections_opened': server.connections,
+                })
+    return results
+
+
+def bench_ai_batch(sizes, latency=0.05):
+    """Throughput of analyze_multiple_articles against a stub API with fixed per-call latency"""
+    results = []
+    for n_articles in sizes:
+        with FakeOpenAIServer(latency=latency) as server:
+            analyzer = AIAnalyzer(api_key='benchmark', base_url=server.base_url, cache_path='')
+            start = time.perf_counter()
+            # Limits far above the request volume, so this measures concurrency rather than RPM/TPM waits
+            analyzed = asyncio.run(analyzer.analyze_multiple_articles_async(
+                [f"Benchmark article {i}" for i in range(n_articles)],
+                requests_per_minute=10 ** 6, tokens_per_minute=10 ** 9
+            ))
+            elapsed = time.perf_counter() - start
+        results.append({
+            'benchmark': 'ai_batch',
+            'articles': n_articles,
+            'stub_latency_ms': latency * 1000,
+            'total_s': round(elapsed, 3),
+            'articles_per_s': round(n_articles / elapsed, 1),
+            # The old loop paid the call latency plus a 1s sleep per article
+            'sequential_estimate_s': round(n_articles * (1 + latency), 1),
+            'errors': sum(1 for r in analyzed if not r.get('available')),
+        })
+    return results
+
+
+def html_fixture(size_kb, seed=0):
+    """A news-style page of roughly size_kb: heavy <head>, then article body"""
+    rng = np.random.default_rng(seed)
+    words = load_corpus(200, seed=seed)['text'].str.cat(sep=' ').split()
+    head = (
+        '<!DOCTYPE html><html lang="en"><head><meta charset="utf-8">'
+        + ''.join(f'<meta property="og:tag{i}" content="{" ".join(rng.choice(words, 8))}">' for i in range(40))
+        + '<style>' + 'body{margin:0;padding:0}' * 200 + '</style>'
+        + '<title>Markets &amp; Politics: Daily Briefing | Example News</title></head><body>'
+    )
+    paragraphs = []
+    size = len(head)
+    while size < size_kb * 1024:
+        paragraph = '<p>' + ' '.join(rng.choice(words, 60)) + '</p><script>track(' + str(size) + ')</script>'
+        paragraphs.append(paragraph)
+        size += len(paragraph)
+    return (head + ''.join(paragraphs) + '</body></html>').encode('utf-8')
+
+
+def bench_html_title(sizes, rounds=20):
+    """Full download + BeautifulSoup parse vs streaming <title> extraction, per page size in KB"""
+    results = []
+    for size_kb in sizes:
+        page = html_fixture(size_kb)
+        chunks = [page[i:i + CHUNK_SIZE] for i in range(0, len(page), CHUNK_SIZE)]
+        for mode in ('beautifulsoup', 'streaming'):
+            read = 0
+
+            def stream():
+                nonlocal read
+                for chunk in chunks:
+                    read += len(chunk)
+                    yield chunk
+
+            start = time.perf_counter()
+            for _ in range(rounds):
+                read = 0
+                if mode == 'beautifulsoup':
+                    # What _safe_fetch_title used to do: whole body, then a full parse
+                    body = b''.join(stream()).decode('utf-8')
+                    title = BeautifulSoup(body, 'html.parser').title.string.strip()
+                else:
+                    title = read_title(stream(), 'text/html; charset=utf-8')
+            elapsed = (time.perf_counter() - start) / rounds
+            results.append({
+                'benchmark': 'html_title',
+                'mode': mode,
+                'page_kb': round(len(page) / 1024),
+                'ms_per_page': round(elapsed * 1000, 3),
+                'bytes_read': read,
+                'title': title,
+            })
+    return results
+
+
+def _latency_row(n_entries, op, latencies):
+    latencies = np.array(latencies) * 1e6
+    return {
+        'benchmark': 'sqlite_cache',
+        'entries': n_entries,
+        'op': op,
+        'calls': len(latencies),
+        'p50_us': round(float(np.percentile(latencies, 50)), 1),
+        'p99_us': round(float(np.percentile(latencies, 99)), 1),
+        'mean_us': round(float(latencies.mean()), 1),
+    }
+
+
+def bench_sqlite_cache(sizes, ops=1000):
+    """SQLiteCache put/get latency with n entries already stored and max_entries = n (evicting on every put)"""
+    results = []
+    for n_entries in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = SQLiteCache(os.path.join(tmp, 'bench.sqlite3'), namespace='bench', ttl=86400,
+                                max_entries=n_entries)
+            now = time.time()
+            with cache._transaction() as conn:
+                conn.executemany(
+                    "INSERT INTO entries (namespace, key, value, created_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                    ((cache.namespace, f"key-{i}", json.dumps({'results': [i]}), now, now) for i in range(n_entries))
+                )
+            for op, call in (('put', lambda i: cache.put(f"new-{i}", {'results': [i]})),
+                             ('get_hit', lambda i: cache.get(f"new-{i}")),
+                             ('get_miss', lambda i: cache.get(f"missing-{i}"))):
+                latencies = []
+                for i in range(ops):
+                    start = time.perf_counter()
+                    call(i)
+                    latencies.append(time.perf_counter() - start)
+                results.append(_latency_row(n_entries, op, latencies))
+            cache.close()
+    return results
+
+
+def bench_search_cache(sizes, latency=0.05, unique_fraction=0.2):
+    """/verify calls over a stream of claims with repeats, against a stub search with fixed latency"""
+    results = []
+    for n_calls in sizes:
+        corpus = load_corpus(max(1, int(n_calls * unique_fraction)))['text'].tolist()
+        rng = np.random.default_rng(0)
+        claims = [corpus[i] for i in rng.integers(0, len(corpus), n_calls)]
+        for mode in ('uncached', 'cached'):
+            backend = StaticSearchBackend(latency=latency)
+            verifier = WebVerifier(search_backend=backend, cache_path='')
+            if mode == 'uncached':
+                verifier.search_cache.max_size = 0
+            start = time.perf_counter()
+            for claim in claims:
+                verifier.verify(claim)
+            elapsed = time.perf_counter() - start
+            results.append({
+                'benchmark': 'search_cache',
+                'mode': mode,
+                'calls': n_calls,
+                'stub_latency_ms': latency * 1000,
+                'total_s': round(elapsed, 3),
+                'backend_searches': backend.calls,
+                'hit_rate': verifier.search_cache.stats()['hit_rate'],
+            })
+    return results
+
+
+def _synthetic_domains(n, seed=0):
+    rng = np.random.default_rng(seed)
+    tlds = np.array(['com', 'net', 'org', 'info', 'co.uk', 'com.au', 'news', 'io'])
+    names = rng.integers(0, 36 ** 8, n)
+    return [f"{np.base_repr(int(x), 36).lower()}.{tld}" for x, tld in zip(names, rng.choice(tlds, n))]
+
+
+def bench_domains(sizes, lookups=100000):
+    """Reputation index vs a Python dict of domains: build time, memory and parent-walking lookups"""
+    results = []
+    for n_domains in sizes:
+        domains = _synthetic_domains(n_domains)
+        labels = ['suspect' if i % 3 else 'trusted' for i in range(n_domains)]
+        rng = np.random.default_rng(1)
+        # Half listed (behind a subdomain), half unlisted hosts
+        listed = [f"www.{domains[i]}" for i in rng.integers(0, n_domains, lookups // 2)]
+        hosts = listed + [f"www.{d}" for d in _synthetic_domains(lookups - len(listed), seed=2)]
+
+        start = time.perf_counter()
+        table = dict(zip(domains, labels))
+        dict_build_s = time.perf_counter() - start
+        dict_bytes = sys.getsizeof(table) + sum(sys.getsizeof(d) for d in table)
+
+        start = time.perf_counter()
+        index = ReputationIndex.from_items(zip(domains, labels))
+        index_build_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        found = sum(1 for host in hosts if index.lookup(host) is not None)
+        lookup_s = time.perf_counter() - start
+
+        path = 'bench_reputation.npz'
+        index.save(path)
+        start = time.perf_counter()
+        ReputationIndex.from_file(path)
+        load_s = time.perf_counter() - start
+        os.remove(path)
+
+        results.append({
+            'benchmark': 'domains',
+            'domains': n_domains,
+            'dict_build_s': round(dict_build_s, 3),
+            'dict_mb': round(dict_bytes / 1e6, 1),
+            'index_build_s': round(index_build_s, 3),
+            'index_mb': round(index.nbytes / 1e6, 1),
+            'npz_load_s': round(load_s, 4),
+            'lookups_per_s': round(len(hosts) / lookup_s),
+            'found': found,
+        })
+    return results
+
+
+def bench_keywords(sizes, n_snippets=2000):
+    """Per-keyword substring scans vs one Aho-Corasick pass, by lexicon size (phrases per category)"""
+    results = []
+    snippets = [text[:240].lower() for text in load_corpus(n_snippets)['text']]
+    vocabulary = sorted({w for text in snippets for w in text.split()})
+    rng = np.random.default_rng(0)
+    for n_phrases in sizes:
+        # Mostly multi-word phrases that rarely occur, the worst case for early-exit any()
+        lexicons = {
+            category: [' '.join(rng.choice(vocabulary, int(rng.integers(2, 4)))) for _ in range(n_phrases)]
+            for category in ('refutes', 'supports')
+        }
+        start = time.perf_counter()
+        for text in snippets:
+            any(k in text for k in lexicons['refutes']) or any(k in text for k in lexicons['supports'])
+        scan_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        matcher = KeywordMatcher(lexicons)
+        build_s = time.perf_counter() - start
+        start = time.perf_counter()
+        for text in snippets:
+            matcher.counts(text)
+        matcher_s = time.perf_counter() - start
+
+        results.append({
+            'benchmark': 'keywords',
+            'phrases_per_category': n_phrases,
+            'snippets': n_snippets,
+            'substring_scan_s': round(scan_s, 4),
+            'matcher_build_s': round(build_s, 4),
+            'matcher_s': round(matcher_s, 4),
+            'speedup': round(scan_s / matcher_s, 1),
+        })
+    return results
+
+
+def bench_online(sizes, batch_size=32, rounds=20):
+    """Full retrain on n rows vs folding one feedback micro-batch into an online model"""
+    results = []
+    for n_rows in sizes:
+        df = load_corpus(n_rows)
+        path = 'bench_train.csv'
+        df.to_csv(path, index=False)
+        feedback = load_corpus(batch_size, seed=7)
+        try:
+            for mode in ('batch', 'online'):
+                detector = FakeNewsDetector(mode=mode)
+                start = time.perf_counter()
+                detector.train(path)
+                train_s = time.perf_counter() - start
+
+                update_ms = None
+                if mode == 'online':
+                    start = time.perf_counter()
+                    for _ in range(rounds):
+                        detector = detector.partial_fit(list(feedback['text']), list(feedback['label']))
+                    update_ms = (time.perf_counter() - start) / rounds * 1000
+
+                results.append({
+                    'benchmark': 'online',
+                    'mode': mode,
+                    'rows': n_rows,
+                    'full_train_s': round(train_s, 3),
+                    'micro_batch': batch_size,
+                    'update_ms': round(update_ms, 2) if update_ms is not None else None,
+                })
+        finally:
+            os.remove(path)
+    return results
+
+
+def bench_stream_train(sizes, chunksize=10000):
+    """In-memory train() vs chunked train_streaming() on a CSV of n rows, each in a fresh process for peak RSS"""
+    results = []
+    for n_rows in sizes:
+        path = 'bench_stream.csv'
+        load_corpus(n_rows).to_csv(path, index=False)
+        file_mb = os.path.getsize(path) / 1e6
+        try:
+            for mode in ('in_memory', 'streaming'):
+                command = [sys.executable, 'streaming_train.py', path, '--json', '--chunksize', str(chunksize)]
+                if mode == 'in_memory':
+                    command.append('--in-memory')
+                output = subprocess.run(command, capture_output=True, text=True, check=True).stdout
+                report = json.loads(output.strip().splitlines()[-1])
+                results.append({
+                    'benchmark': 'stream_train',
+                    'mode': mode,
+                    'rows': report['rows'],
+                    'file_mb': round(file_mb, 1),
+                    'seconds': report['seconds'],
+                    'rows_per_s': report['rows_per_s'],
+                    'peak_rss_mb': report['peak_rss_mb'],
+                })
+        finally:
+            os.remove(path)
+    return results
+
+
+def _letters(i):
+    """Distinct letters-only word per integer (tokenization drops digits)"""
+    word = 'q'
+    while True:
+        i, r = divmod(i, 26)
+        word += chr(ord('a') + r)
+        if not i:
+            return word
+
+
+def split_corpus(n_rows, test_size=None, seed=None):
+    """
+    Train/test split over unique articles, each side resampled to its share of
+    n_rows, so no test article also appears in the training data
+    """
+    test_size = MODEL_CONFIG['test_size'] if test_size is None else test_size
+    seed = MODEL_CONFIG['random_state'] if seed is None else seed
+    base = load_corpus(n_rows).drop_duplicates('text')
+    test = base.sample(frac=test_size, random_state=seed)
+    train = base.drop(test.index)
+    n_test = max(len(test), int(n_rows * test_size))
+    return (train.sample(n=n_rows - n_test, replace=True, random_state=seed).reset_index(drop=True),
+            test.sample(n=n_test, replace=True, random_state=seed).reset_index(drop=True))
+
+
+def bench_classifiers(sizes, backends=None, single_calls=200):
+    """Train every batch-mode backend on the same split: fit time, latency, throughput, size, accuracy"""
+    backends = backends or [name for name in CLASSIFIER_BACKENDS if name != 'sgd']
+    results = []
+    for n_rows in sizes:
+        train_df, test_df = split_corpus(n_rows)
+        path = 'bench_classifiers.csv'
+        train_df.to_csv(path, index=False)
+        try:
+            for name in backends:
+                detector = FakeNewsDetector(mode='batch', classifier=name)
+                # Measure the model, not the prediction cache
+                detector.prediction_cache.max_size = 0
+                start = time.perf_counter()
+                detector.train(path)
+                fit_s = time.perf_counter() - start
+
+                texts = list(test_df['text'])
+                detector.predict(texts[0])
+                latencies = []
+                for i in range(single_calls):
+                    start = time.perf_counter()
+                    detector.predict(texts[i % len(texts)])
+                    latencies.append((time.perf_counter() - start) * 1000)
+
+                predictions = detector.predict_batch(texts)
+                predicted = np.array([p['prediction'] == 'FAKE' for p in predictions], dtype=int)
+                # predict_batch scores identical texts once, so time it on distinct ones
+                distinct = [f"{text} {_letters(i)}" for i, text in enumerate(texts)]
+                start = time.perf_counter()
+                detector.predict_batch(distinct)
+                batch_s = time.perf_counter() - start
+
+                buffer = io.BytesIO()
+                joblib.dump(detector.classifier, buffer)
+                results.append({
+                    'benchmark': 'classifiers',
+                    'backend': name,
+                    'train_rows': len(train_df),
+                    'test_rows': len(test_df),
+                    'fit_s': round(fit_s, 3),
+                    'p50_ms': round(float(np.percentile(latencies, 50)), 3),
+                    'p99_ms': round(float(np.percentile(latencies, 99)), 3),
+                    'batch_docs_per_s': round(len(texts) / batch_s, 1),
+                    'model_kb': round(buffer.tell() / 1024, 1),
+                    'accuracy': round(float((predicted == test_df['label'].to_numpy()).mean()), 4),
+                })
+        finally:
+            os.remove(path)
+    return results
+
+
+def bench_forest(sizes, calls=500, batch_rows=(1, 16, 64, 256)):
+    """Random forest scoring: sklearn predict_proba vs the compiled path, per batch size and end to end"""
+    results = []
+    for n_rows in sizes:
+        train_df, test_df = split_corpus(n_rows)
+        path = 'bench_forest.csv'
+        train_df.to_csv(path, index=False)
+        try:
+            detector = FakeNewsDetector(mode='batch', classifier='random_forest')
+            detector.prediction_cache.max_size = 0
+            detector.train(path)
+        finally:
+            os.remove(path)
+        start = time.perf_counter()
+        compiled = CompiledForest(detector.classifier)
+        compile_ms = (time.perf_counter() - start) * 1000
+
+        texts = [f"{text} {_letters(i)}" for i, text in enumerate(test_df['text'])]
+        token_lists = [detector.tokenize(text) for text in texts]
+        _, feature_df = detector.featurize(token_lists)
+        X = detector.combine_features(detector.vectorizer.transform(token_lists), feature_df.values)
+        X = X[np.arange(max(batch_rows)) % X.shape[0]]
+        for rows in batch_rows:
+            X_batch = X[:rows]
+            row = {'benchmark': 'forest', 'train_rows': n_rows, 'nodes': int(compiled.feature.size),
+                   'max_depth': compiled.max_depth, 'compile_ms': round(compile_ms, 1), 'batch_rows': rows}
+            rounds = max(10, calls // rows)
+            for name, score in (('sklearn', detector.classifier.predict_proba), ('compiled', compiled.predict_proba)):
+                score(X_batch)
+                start = time.perf_counter()
+                for _ in range(rounds):
+                    score(X_batch)
+                row[f'{name}_ms'] = round((time.perf_counter() - start) / rounds * 1000, 3)
+            row['speedup'] = round(row['sklearn_ms'] / row['compiled_ms'], 1)
+            row['identical'] = bool(np.array_equal(compiled.predict_proba(X_batch),
+                                                   detector.classifier.predict_proba(X_batch)))
+            results.append(row)
+
+        # End to end: tokenize, featurize, vectorize and score one article (p50 over `calls`)
+        row = dict(results[-1], batch_rows='predict()')
+        outputs = {}
+        configured = MODEL_CONFIG['compiled_inference']
+        try:
+            for name, enabled in (('sklearn', False), ('compiled', True)):
+                MODEL_CONFIG['compiled_inference'] = enabled
+                detector.compile()
+                latencies = []
+                for i in range(calls):
+                    start = time.perf_counter()
+                    detector.predict(texts[i % len(texts)])
+                    latencies.append((time.perf_counter() - start) * 1000)
+                row[f'{name}_ms'] = round(float(np.percentile(latencies, 50)), 3)
+                outputs[name] = detector.predict_batch(texts[:max(batch_rows)])
+        finally:
+            MODEL_CONFIG['compiled_inference'] = configured
+        row['speedup'] = round(row['sklearn_ms'] / row['compiled_ms'], 1)
+        row['identical'] = outputs['sklearn'] == outputs['compiled']
+        results.append(row)
+    return results
+
+
+def _timed_stage(n_rows, stage, fn, items):
+    """One hot_paths row: total time for fn over items, per-call mean and p99"""
+    latencies = np.empty(len(items))
+    for i, item in enumerate(items):
+        start = time.perf_counter()
+        fn(item)
+        latencies[i] = time.perf_counter() - start
+    return _stage_row(n_rows, stage, len(items), float(latencies.sum()),
+                      p99_us=float(np.percentile(latencies, 99)) * 1e6)
+
+
+def _stage_row(n_rows, stage, calls, total_s, p99_us=None):
+    return {
+        'benchmark': 'hot_paths',
+        'rows': n_rows,
+        'stage': stage,
+        'calls': calls,
+        'total_s': round(total_s, 4),
+        'us_per_call': round(total_s / max(1, calls) * 1e6, 2),
+        'p99_us': round(p99_us, 2) if p99_us is not None else None,
+    }
+
+
+def bench_hot_paths(sizes, max_calls=20000, predict_calls=1000, seed=0):
+    """
+    Detection hot paths on data_generator corpora of n rows: per-call stages
+    (preprocess_text, extract_features, WebVerifier helpers) run on the first
+    max_calls articles, predict() on predict_calls; batch stages (vectorize,
+    train, predict_batch) on the whole corpus
+    """
+    results = []
+    for n_rows in sizes:
+        start = time.perf_counter()
+        df = create_expanded_dataset(n_rows, seed=seed, path=None)
+        results.append(_stage_row(n_rows, 'generate', n_rows, time.perf_counter() - start))
+        texts = list(df['text'])
+        sample = texts[:max_calls]
+
+        detector = FakeNewsDetector(mode='batch')
+        detector.prediction_cache.max_size = 0
+        results.append(_timed_stage(n_rows, 'preprocess_text', detector.preprocess_text, sample))
+        cleaned = [detector.preprocess_text(text) for text in sample]
+        results.append(_timed_stage(n_rows, 'extract_features', detector.extract_features, cleaned))
+
+        start = time.perf_counter()
+        token_lists = [detector.tokenize(text) for text in texts]
+        results.append(_stage_row(n_rows, 'tokenize', n_rows, time.perf_counter() - start))
+        start = time.perf_counter()
+        _, feature_df = detector.featurize(token_lists)
+        results.append(_stage_row(n_rows, 'featurize', n_rows, time.perf_counter() - start))
+        start = time.perf_counter()
+        X_text = detector.vectorizer.fit_transform(token_lists)
+        detector.combine_features(X_text, feature_df.values, fit=True)
+        results.append(_stage_row(n_rows, 'vectorize', n_rows, time.perf_counter() - start))
+        del token_lists, feature_df, X_text
+
+        path = 'bench_hot_paths.csv'
+        df.to_csv(path, index=False)
+        try:
+            start = time.perf_counter()
+            detector.train(path)
+            results.append(_stage_row(n_rows, 'train', n_rows, time.perf_counter() - start))
+        finally:
+            os.remove(path)
+        results.append(_timed_stage(n_rows, 'predict', detector.predict, sample[:predict_calls]))
+        start = time.perf_counter()
+        detector.predict_batch(texts)  # repeated articles are scored once, as in production
+        results.append(_stage_row(n_rows, 'predict_batch', n_rows, time.perf_counter() - start))
+
+        verifier = WebVerifier(search_backend=StaticSearchBackend())
+        urls = [f"https://www.{domain}/news/{i}" for i, domain in enumerate(_synthetic_domains(len(sample), seed))]
+        results.append(_timed_stage(n_rows, 'normalize_query', normalize_query, sample))
+        results.append(_timed_stage(n_rows, 'infer_stance', verifier._infer_stance_from_snippet, sample))
+        results.append(_timed_stage(n_rows, 'extract_domain', verifier._extract_domain, urls))
+        results.append(_timed_stage(n_rows, 'credibility_label', verifier._credibility_label,
+                                    [verifier._extract_host(url) for url in urls]))
+        items = [{'credibility': verifier._credibility_label(verifier._extract_host(url)),
+                  'stance': verifier._infer_stance_from_snippet(text)} for url, text in zip(urls, sample)]
+        pages = [items[i:i + verifier.max_results] for i in range(0, len(items), verifier.max_results)]
+        results.append(_timed_stage(n_rows, 'score_overall', verifier._score_overall, pages))
+    return results
+
+
+# Cold start: import app, then serve (the model at argv[1]) on a free port while warming up in the background
+COLD_START_SERVER = """
+import json, sys, time
+start = time.perf_counter()
+import app
+import_ms = (time.perf_counter() - start) * 1000
+app.MODEL_CONFIG['artifact_path'] = sys.argv[1]
+heavy = [m for m in ('sklearn', 'pandas', 'openai', 'duckduckgo_search', 'nltk', 'textblob') if m in sys.modules]
+from werkzeug.serving import make_server
+server = make_server('127.0.0.1', 0, app.app, threaded=True)
+app.start_warm_up()
+print(json.dumps({'port': server.server_port, 'import_ms': import_ms, 'heavy': heavy}), flush=True)
+server.serve_forever()
+"""
+
+# Milliseconds from process start; over budget fails the run like a regression.
+# Measured p50s with a saved model: ~140-220 import, ~190-300 healthy, ~2200-3100 first
+# prediction (loading sklearn and the artifact). An eager ML import in app.py blows the
+# first two; use --compare against a saved run to catch smaller slowdowns.
+COLD_START_BUDGET_MS = {
+    'import_app': 400,
+    'first_healthy': 500,
+    'first_prediction': 4000,
+}
+
+
+def _wait_for_ok(url, deadline, body=None):
+    """Retry until the URL answers 200; returns perf_counter() at that moment"""
+    data = json.dumps(body).encode() if body is not None else None
+    while True:
+        try:
+            request = urllib.request.Request(url, data=data, headers={'Content-Type': 'application/json'})
+            with urllib.request.urlopen(request, timeout=30) as response:
+                if response.status == 200:
+                    return time.perf_counter()
+        except OSError:
+            if time.perf_counter() > deadline:
+                raise
+        time.sleep(0.005)
+
+
+def _cold_start_once(timeout=120):
+    """One fresh server process: ms to import app, to the first healthy /health and first /predict"""
+    start = time.perf_counter()
+    process = subprocess.Popen([sys.executable, '-c', COLD_START_SERVER, MODEL_CONFIG['artifact_path']],
+                               stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+    try:
+        info = json.loads(process.stdout.readline())
+        base_url = f"http://127.0.0.1:{info['port']}"
+        deadline = start + timeout
+        healthy = _wait_for_ok(base_url + '/health', deadline)
+        predicted = _wait_for_ok(base_url + '/predict', deadline,
+                                 {'text': 'Scientists confirm the new vaccine passed trials', 'use_ai': False})
+    finally:
+        process.kill()
+        process.wait()
+    return {
+        'import_app': info['import_ms'],
+        'first_healthy': (healthy - start) * 1000,
+        'first_prediction': (predicted - start) * 1000,
+    }, info['heavy']
+
+
+def bench_cold_start(sizes):
+    """Time to a healthy server and to its first prediction from a fresh process, over n cold starts"""
+    if not artifact_exists(MODEL_CONFIG['artifact_path']):
+        # Measure loading the saved model, as a deployed server does, not first-run training
+        detector = FakeNewsDetector()
+        detector.train()
+        detector.save(MODEL_CONFIG['artifact_path'])
+
+    results = []
+    for n_runs in sizes:
+        runs = [_cold_start_once() for _ in range(n_runs)]
+        heavy = runs[-1][1]
+        for metric, budget in COLD_START_BUDGET_MS.items():
+            values = [timings[metric] for timings, _ in runs]
+            p50 = float(np.percentile(values, 50))
+            results.append({
+                'benchmark': 'cold_start',
+                'runs': n_runs,
+                'metric': metric,
+                'p50_ms': round(p50, 1),
+                'max_ms': round(max(values), 1),
+                'budget_ms': budget,
+                'within_budget': p50 <= budget,
+                'heavy_imports': ','.join(heavy) if metric == 'import_app' else '',
+            })
+    return results
+
+
+BENCHMARKS = {
+    'sparse': bench_sparse,
+    'featurize': bench_featurize,
+    'sentiment': bench_sentiment,
+    'ai_client': bench_ai_client,
+    'ai_batch': bench_ai_batch,
+    'html_title': bench_html_title,
+    'search_cache': bench_search_cache,
+    'sqlite_cache': bench_sqlite_cache,
+    'domains': bench_domains,
+    'keywords': bench_keywords,
+    'online': bench_online,
+    'stream_train': bench_stream_train,
+    'classifiers': bench_classifiers,
+    'forest': bench_forest,
+    'hot_paths': bench_hot_paths,
+    'cold_start': bench_cold_start,
+}
+
+
+# Identifying fields and the lower-is-better metric compared by --compare
+REGRESSION_KEYS = {
+    'hot_paths': (('rows', 'stage'), 'us_per_call'),
+    'classifiers': (('backend', 'train_rows'), 'p50_ms'),
+    'forest': (('train_rows', 'batch_rows'), 'compiled_ms'),
+    'cold_start': (('runs', 'metric'), 'p50_ms'),
+    'sqlite_cache': (('entries', 'op'), 'p50_us'),
+}
+
+
+def current_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                              text=True, check=True).stdout.strip() or None
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def write_results(results, path=OUTPUT_PATH):
+    """Append results as JSON lines so runs can be diffed between commits"""
+    with open(path, 'a', encoding='utf-8') as fh:
+        for row in results:
+            fh.write(json.dumps(row) + '\n')
+
+
+def load_results(path):
+    with open(path, encoding='utf-8') as fh:
+        return [json.loads(line) for line in fh if line.strip()]
+
+
+def compare_results(results, baseline, threshold=0.25):
+    """
+    Match rows to the latest baseline row with the same identifying fields and
+    report the relative change of the benchmark's metric (positive = slower)
+    """
+    latest = {}
+    for row in baseline:
+        keys = REGRESSION_KEYS.get(row.get('benchmark'))
+        if keys:
+            latest[(row['benchmark'],) + tuple(row.get(k) for k in keys[0])] = row
+    comparisons = []
+    for row in results:
+        keys = REGRESSION_KEYS.get(row.get('benchmark'))
+        if not keys:
+            continue
+        fields, metric = keys
+        before = latest.get((row['benchmark'],) + tuple(row.get(k) for k in fields))
+        if not before or not before.get(metric) or row.get(metric) is None:
+            continue
+        change = row[metric] / before[metric] - 1
+        comparisons.append({
+            'benchmark': row['benchmark'],
+            'case': ' '.join(f"{k}={row.get(k)}" for k in fields),
+            'metric': metric,
+            'baseline': before[metric],
+            'current': row[metric],
+            'change_pct': round(change * 100, 1),
+            'baseline_commit': before.get('commit'),
+            'regression': change > threshold,
+        })
+    return comparisons
+
+
+def print_results(results):
+    if not results:
+        return
+    columns = list(results[0].keys())
+    print(' | '.join(columns))
+    for row in results:
+        print(' | '.join(str(row.get(c, '')) for c in columns))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('benchmark', choices=sorted(BENCHMARKS))
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 5000, 20000])
+    parser.add_argument('--output', default=OUTPUT_PATH, help='JSON lines file results are appended to')
+    parser.add_argument('--compare', metavar='BASELINE',
+                        help='Compare against a previous results file; exit 1 on regressions')
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='Relative slowdown counted as a regression (default 0.25 = 25%%)')
+    args = parser.parse_args()
+
+    results = BENCHMARKS[args.benchmark](args.sizes)
+    print_results(results)
+    commit = current_commit()
+    for row in results:
+        row['commit'] = commit
+
+    regressions = []
+    if args.compare:
+        comparisons = compare_results(results, load_results(args.compare), args.threshold)
+        print(f"\n📊 Compared with {args.compare}")
+        if comparisons:
+            print_results(comparisons)
+        else:
+            print(f"No comparable rows for '{args.benchmark}'")
+        regressions = [c for c in comparisons if c['regression']]
+
+    write_results(results, args.output)
+    print(f"\n📄 Results appended to {args.output}")
+    over_budget = [row for row in results if row.get('within_budget') is False]
+    if over_budget:
+        print(f"❌ {len(over_budget)} result(s) over budget")
+    if regressions:
+        print(f"❌ {len(regressions)} regression(s) over {args.threshold:.0%}")
+    if regressions or over_budget:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
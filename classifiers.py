@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Classifier backends for the Fake News Detection System
+Selected by name through MODEL_CONFIG['classifier']; every backend supports predict_proba
+"""
+
+from typing import Callable, Dict, Optional
+
+from sklearn.calibration import CalibratedClassifierCV
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.linear_model import LogisticRegression, SGDClassifier
+from sklearn.naive_bayes import ComplementNB
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import FunctionTransformer
+from sklearn.svm import LinearSVC
+
+from config import MODEL_CONFIG, ONLINE_CONFIG
+
+
+def clip_negative(X):
+    """Naive Bayes needs non-negative counts; the scaled sentiment polarity can be negative"""
+    return X.maximum(0) if hasattr(X, 'maximum') else X.clip(min=0)
+
+
+def _random_forest(params: Dict):
+    return RandomForestClassifier(
+        n_estimators=params.pop('n_estimators', MODEL_CONFIG['random_forest_n_estimators']),
+        random_state=params.pop('random_state', MODEL_CONFIG['random_forest_random_state']),
+        n_jobs=params.pop('n_jobs', MODEL_CONFIG['train_n_jobs']),
+        **params
+    )
+
+
+def _logistic_regression(params: Dict):
+    params.setdefault('max_iter', 1000)
+    return LogisticRegression(random_state=MODEL_CONFIG['random_state'], **params)
+
+
+def _linear_svm(params: Dict):
+    # LinearSVC has no predict_proba; calibration adds it (sigmoid fits tiny datasets best)
+    cv = params.pop('cv', 3)
+    return CalibratedClassifierCV(LinearSVC(random_state=MODEL_CONFIG['random_state'], **params),
+                                  method='sigmoid', cv=cv)
+
+
+def _complement_nb(params: Dict):
+    return make_pipeline(FunctionTransformer(clip_negative, accept_sparse=True), ComplementNB(**params))
+
+
+def _sgd(params: Dict):
+    params.setdefault('alpha', ONLINE_CONFIG['alpha'])
+    return SGDClassifier(loss='log_loss', random_state=MODEL_CONFIG['random_state'], **params)
+
+
+CLASSIFIER_BACKENDS: Dict[str, Callable[[Dict], object]] = {
+    'random_forest': _random_forest,
+    'logistic_regression': _logistic_regression,
+    'linear_svm': _linear_svm,
+    'complement_nb': _complement_nb,
+    'sgd': _sgd,  # the online-mode learner (supports partial_fit)
+}
+
+
+def register_backend(name: str, factory: Callable[[Dict], object]) -> None:
+    """Add a backend: factory(params) must return an unfitted estimator with predict_proba"""
+    CLASSIFIER_BACKENDS[name] = factory
+
+
+def make_classifier(name: Optional[str] = None, **params):
+    """Build the named backend (default MODEL_CONFIG['classifier']) with config params and overrides"""
+    name = name or MODEL_CONFIG['classifier']
+    if name not in CLASSIFIER_BACKENDS:
+        raise ValueError(f"Unknown classifier backend: {name} (choose from {', '.join(sorted(CLASSIFIER_BACKENDS))})")
+    merged = dict(MODEL_CONFIG['classifier_params'].get(name, {}))
+    merged.update(params)
+    return CLASSIFIER_BACKENDS[name](merged)
+
+
+def set_n_jobs(estimator, n_jobs: Optional[int]) -> None:
+    """Switch a fitted estimator's parallelism, e.g. to 1 so single-article predictions skip thread dispatch"""
+    if n_jobs is not None and hasattr(estimator, 'n_jobs'):
+        estimator.n_jobs = n_jobs
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Compiled random forest inference for the Fake News Detection System
+Flattens a fitted RandomForestClassifier into contiguous node arrays and walks
+all trees at once with numpy, skipping sklearn's per-call validation and
+per-tree dispatch. Probabilities match RandomForestClassifier.predict_proba.
+"""
+
+import numpy as np
+from scipy import sparse
+from sklearn.ensemble import RandomForestClassifier
+
+TREE_LEAF = -1  # sklearn's children_left marker for leaves
+
+
+class CompiledForest:
+    """
+    All trees' nodes in one set of arrays. Leaves point to themselves, so a
+    traversal step is the same gather for every (row, tree) pair.
+    """
+
+    def __init__(self, forest):
+        trees = [estimator.tree_ for estimator in forest.estimators_]
+        self.classes_ = forest.classes_
+        self.n_features = forest.n_features_in_
+        self.n_trees = len(trees)
+
+        offsets = np.cumsum([0] + [tree.node_count for tree in trees[:-1]])
+        self.roots = offsets.astype(np.intp)
+        features, thresholds, lefts, rights, values, leaves = [], [], [], [], [], []
+        for offset, tree in zip(offsets, trees):
+            is_leaf = tree.children_left == TREE_LEAF
+            own = np.arange(tree.node_count) + offset
+            lefts.append(np.where(is_leaf, own, tree.children_left + offset))
+            rights.append(np.where(is_leaf, own, tree.children_right + offset))
+            features.append(np.where(is_leaf, 0, tree.feature))
+            thresholds.append(tree.threshold)
+            leaves.append(is_leaf)
+            # Same normalization as DecisionTreeClassifier.predict_proba
+            value = tree.value[:, 0, :].astype(np.float64)
+            normalizer = value.sum(axis=1)[:, np.newaxis]
+            normalizer[normalizer == 0.0] = 1.0
+            values.append(value / normalizer)
+
+        self.feature = np.concatenate(features).astype(np.intp)
+        self.threshold = np.concatenate(thresholds).astype(np.float64)
+        self.left = np.concatenate(lefts).astype(np.intp)
+        self.right = np.concatenate(rights).astype(np.intp)
+        self.is_leaf = np.concatenate(leaves)
+        self.value = np.ascontiguousarray(np.concatenate(values))
+        self.max_depth = max(estimator.tree_.max_depth for estimator in forest.estimators_)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(a.nbytes for a in (self.feature, self.threshold, self.left, self.right, self.is_leaf, self.value))
+
+    def _leaves(self, X: np.ndarray) -> np.ndarray:
+        """Leaf index per (row, tree) for a dense float32 block"""
+        rows = np.arange(X.shape[0])[:, np.newaxis]
+        nodes = np.repeat(self.roots[np.newaxis, :], X.shape[0], axis=0)
+        for _ in range(self.max_depth):
+            if self.is_leaf[nodes].all():
+                break
+            # sklearn compares float32 inputs against float64 thresholds
+            go_left = X[rows, self.feature[nodes]] <= self.threshold[nodes]
+            nodes = np.where(go_left, self.left[nodes], self.right[nodes])
+        return nodes
+
+    def predict_proba(self, X, block_size: int = 256) -> np.ndarray:
+        """Class probabilities for a dense or sparse matrix, densified block_size rows at a time"""
+        n_rows = X.shape[0]
+        out = np.empty((n_rows, len(self.classes_)), dtype=np.float64)
+        for start in range(0, n_rows, block_size):
+            block = X[start:start + block_size]
+            block = block.toarray() if sparse.issparse(block) else np.asarray(block)
+            leaf_values = self.value[self._leaves(block.astype(np.float32))]
+            # Summing over the tree axis adds trees in order, like the forest's accumulation
+            out[start:start + block_size] = leaf_values.sum(axis=1) / self.n_trees
+        return out
+
+    def predict(self, X) -> np.ndarray:
+        return self.classes_[np.argmax(self.predict_proba(X), axis=1)]
+
+
+def compile_forest(estimator):
+    """CompiledForest for a fitted RandomForestClassifier, None for any other estimator"""
+    if isinstance(estimator, RandomForestClassifier) and hasattr(estimator, 'estimators_'):
+        return CompiledForest(estimator)
+    return None
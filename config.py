@@ -1,60 +1,160 @@
-"""
-Configuration file for Fake News Detection System
-"""
-
-# Model Configuration
-MODEL_CONFIG = {
-    'tfidf_max_features': 5000,
-    'random_forest_n_estimators': 100,
-    'random_forest_random_state': 42,
-    'test_size': 0.2,
-    'random_state': 42
-}
-
-# Feature Extraction Configuration
-FEATURE_CONFIG = {
-    'min_text_length': 10,
-    'max_text_length': 10000,
-    'sentiment_weight': 1.0,
-    'punctuation_weight': 1.0,
-    'case_weight': 1.0,
-    'url_weight': 2.0
-}
-
-# Web Interface Configuration
-WEB_CONFIG = {
-    'host': '0.0.0.0',
-    'port': 5000,
-    'debug': True,
-    'threaded': True
-}
-
-# Data Configuration
-DATA_CONFIG = {
-    'sample_dataset_size': 100,
-    'fake_news_ratio': 0.5,
-    'real_news_ratio': 0.5,
-    'min_confidence_threshold': 0.6
-}
-
-# API Configuration
-API_CONFIG = {
-    'max_request_size': 16 * 1024 * 1024,  # 16MB
-    'rate_limit': 100,  # requests per minute
-    'timeout': 30  # seconds
-}
-
-# Logging Configuration
-LOGGING_CONFIG = {
-    'level': 'INFO',
-    'format': '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    'file': 'fake_news_detector.log'
-}
-
-# Security Configuration
-SECURITY_CONFIG = {
-    'enable_cors': True,
-    'allowed_origins': ['*'],
-    'enable_rate_limiting': False,
-    'max_text_length': 10000
-}
+"""
+Configuration file for Fake News Detection System
+"""
+
+import os
+
+# Model Configuration
+MODEL_CONFIG = {
+    'tfidf_max_features': 5000,
+    'random_forest_n_estimators': 100,
+    'random_forest_random_state': 42,
+    'classifier': 'random_forest',  # batch-mode backend: random_forest, logistic_regression, linear_svm, complement_nb
+    'classifier_params': {  # per-backend estimator parameters
+        'logistic_regression': {'C': 10.0},
+        'complement_nb': {'alpha': 0.1}
+    },
+    'train_n_jobs': -1,  # cores used to fit backends that parallelize (random forest)
+    'predict_n_jobs': 1,  # set after fitting: one article is faster without thread dispatch
+    'compiled_inference': True,  # score small batches with compiled_forest instead of sklearn (random forest only)
+    'compiled_max_rows': 128,  # larger batches go to sklearn, which is faster past a few hundred rows
+    'test_size': 0.2,
+    'random_state': 42,
+    'artifact_path': 'models/fake_news_detector',  # saved by /train and run.py, loaded at startup
+    'mode': 'batch',  # 'batch' (TF-IDF + random forest) or 'online' (hashing + SGD, learns from /feedback)
+    'training_data_path': None,  # dataset for /train jobs (CSV, or JSONL/Parquet in online mode); None = built-in sample
+    'training_workers': 1,  # background /train jobs run one at a time
+    'training_job_history': 50  # finished jobs kept for status queries
+}
+
+# Online Learning Configuration (MODEL_CONFIG['mode'] = 'online')
+ONLINE_CONFIG = {
+    'n_features': 2 ** 18,  # hashing vectorizer width; new words never need a refit
+    'alpha': 1e-5,  # SGD regularization strength
+    'feedback_batch_size': 32,  # buffered /feedback examples applied as one partial_fit
+    'feedback_flush_interval': 5.0,  # seconds before a partial micro-batch is applied anyway
+    'feedback_max_buffered': 10000,  # /feedback answers 503 beyond this backlog
+    'save_every_batches': 10,  # save the model artifact after this many micro-batches
+    'stream_chunksize': 10000,  # rows per chunk for train_streaming()
+    'stream_epochs': 1
+}
+
+# Feature Extraction Configuration
+FEATURE_CONFIG = {
+    'min_text_length': 10,
+    'max_text_length': 10000,
+    'sentiment_weight': 1.0,
+    'punctuation_weight': 1.0,
+    'case_weight': 1.0,
+    'url_weight': 2.0,
+    'sentiment_lexicon_path': None  # None = TextBlob's bundled en-sentiment.xml
+}
+
+# Prediction Cache Configuration
+CACHE_CONFIG = {
+    'prediction_cache_size': 4096,  # ML predictions kept in memory (LRU)
+    'hybrid_cache_size': 1024  # ML + AI results kept in memory (LRU)
+}
+
+# Web Interface Configuration
+WEB_CONFIG = {
+    'host': '0.0.0.0',
+    'port': 5000,
+    'debug': True,
+    'threaded': True
+}
+
+# Data Configuration
+DATA_CONFIG = {
+    'sample_dataset_size': 100,
+    'fake_news_ratio': 0.5,
+    'real_news_ratio': 0.5,
+    'min_confidence_threshold': 0.6
+}
+
+# API Configuration
+API_CONFIG = {
+    'max_request_size': 16 * 1024 * 1024,  # 16MB
+    'rate_limit': 100,  # requests per minute
+    'timeout': 30,  # seconds
+    'max_batch_size': 1000  # texts per /predict/batch request
+}
+
+# AI Analyzer Configuration
+AI_CONFIG = {
+    'hybrid_ai_timeout': 15.0,  # seconds the hybrid analysis waits for the AI leg
+    'hybrid_ai_workers': 8,  # concurrent AI calls for hybrid analysis
+    'request_timeout': 30.0,  # seconds per OpenAI request
+    'connect_timeout': 5.0,  # seconds to open a connection
+    'max_retries': 2,  # OpenAI client retries on connection errors / 429 / 5xx
+    'max_connections': 16,  # connection pool size, >= concurrent workers
+    'max_keepalive_connections': 8,  # idle connections kept open
+    'keepalive_expiry': 60.0,  # seconds an idle connection is kept
+    'batch_concurrency': 8,  # in-flight requests in analyze_multiple_articles
+    'requests_per_minute': 500,  # OpenAI RPM limit for batch analysis
+    'tokens_per_minute': 200000,  # OpenAI TPM limit for batch analysis
+    'batch_max_retries': 5,  # retries per article after a 429
+    'batch_backoff_base': 1.0,  # seconds, doubled on every retry
+    'batch_backoff_max': 30.0,  # seconds
+    'cache_path': 'cache/ai_analysis.sqlite3',  # persistent AI analysis cache, '' to disable
+    'cache_ttl': 7 * 24 * 3600,  # seconds before a cached analysis expires
+    'cache_max_entries': 100000  # least recently used analyses are evicted beyond this
+}
+
+# Web Verification Configuration
+VERIFY_CONFIG = {
+    'deadline': 12.0,  # seconds for a whole /verify call (search + title fetches)
+    'fetch_workers': 8,  # concurrent page title fetches
+    'pool_hosts': 32,  # hosts with kept-alive connections per worker thread
+    'pool_per_host': 4,  # kept-alive connections per host
+    'title_max_bytes': 256 * 1024,  # stop reading a page after this much if </title> has not appeared
+    'timelimit': 'y',  # search results from the past year
+    'safesearch': 'moderate',
+    'search_cache_ttl': 6 * 60 * 60,  # seconds before a cached search is repeated
+    'search_cache_size': 1024,  # in-memory search results
+    'search_cache_path': 'cache/search_results.sqlite3',  # on-disk tier shared by workers; '' disables it
+    'search_cache_max_entries': 50000,
+    'public_suffix_path': None,  # full public_suffix_list.dat; None uses the built-in subset
+    'reputation_path': None  # "domain[,label]" list or compiled .npz reputation index
+}
+
+# Keyword lexicons, matched as lowercase substrings in one pass (see keyword_matcher.py)
+LEXICON_CONFIG = {
+    # Search snippets that contradict or back up a claim
+    'refutes': ['false', 'fake', 'hoax', 'debunk', 'not true', 'misleading', 'no evidence'],
+    'supports': ['confirms', 'confirmed', 'announced', 'reports', 'evidence shows', 'official'],
+    # Free-text AI responses that call an article fake
+    'fake_indicators': ['fake', 'false', 'misleading', 'unreliable'],
+    'extra_lexicons_path': None  # JSON file of {"refutes": [...], ...} extending the lists above
+}
+
+# Metrics Configuration (see metrics.py and /metrics)
+METRICS_CONFIG = {
+    'enabled': True,  # stage timers, request and cache-lookup metrics; failure counters and /metrics stay on
+    'stage_buckets': (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+    'request_buckets': (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+}
+
+# Request profiling (see profiling.py); disabled unless an admin token is set
+PROFILING_CONFIG = {
+    'admin_token': os.getenv('PROFILE_ADMIN_TOKEN'),  # sent as the X-Admin-Token header
+    'output_dir': 'profiles',  # stored .prof (pstats) and .folded (flame graph) files
+    'max_stored': 100,  # oldest profiles are deleted beyond this
+    'sample_interval': 0.001,  # seconds between stack samples for ?profile=sample
+    'top': 25  # functions listed in the response summary
+}
+
+# Logging Configuration
+LOGGING_CONFIG = {
+    'level': 'INFO',
+    'format': '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    'file': 'fake_news_detector.log'
+}
+
+# Security Configuration
+SECURITY_CONFIG = {
+    'enable_cors': True,
+    'allowed_origins': ['*'],
+    'enable_rate_limiting': False,
+    'max_text_length': 10000
+}
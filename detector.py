@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+"""
+The ML fake news detector: TF-IDF or hashing features plus hand-crafted
+features, scored by the configured classifier, saved as on-disk artifacts.
+Kept out of app.py so the web app starts without loading numpy, pandas or sklearn.
+"""
+
+import copy
+import os
+import time
+import uuid
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfVectorizer
+from sklearn.metrics import accuracy_score
+from sklearn.preprocessing import MaxAbsScaler
+
+from cache import LRUCache, make_cache_key
+from classifiers import make_classifier, set_n_jobs
+from compiled_forest import compile_forest
+from config import CACHE_CONFIG, MODEL_CONFIG, ONLINE_CONFIG
+from featurizer import FEATURE_NAMES, batch_features, features_from_tokens, tokenize, vectorizer_analyzer
+from metrics import record_cache, stage
+from model_store import artifact_exists, load_artifact, save_artifact
+from streaming_train import iter_chunks, labeled_rows, peak_rss_mb
+
+LABEL_CLASSES = np.array([0, 1])  # 0 = real, 1 = fake
+
+def new_model_version():
+    return datetime.now(timezone.utc).strftime('%Y%m%d%H%M%S') + '-' + uuid.uuid4().hex[:8]
+
+class FakeNewsDetector:
+    def __init__(self, mode=None, classifier=None):
+        # 'batch': TF-IDF + the MODEL_CONFIG['classifier'] backend, refit from scratch by train()
+        # 'online': stateless hashing features + SGD, also updatable with partial_fit()
+        self.mode = mode or MODEL_CONFIG['mode']
+        if self.mode == 'online':
+            self.vectorizer = HashingVectorizer(
+                n_features=ONLINE_CONFIG['n_features'], analyzer=vectorizer_analyzer, alternate_sign=False
+            )
+            self.classifier_name = 'sgd'
+        elif self.mode == 'batch':
+            # Documents reach the vectorizer already tokenized (see featurizer.tokenize)
+            self.vectorizer = TfidfVectorizer(max_features=MODEL_CONFIG['tfidf_max_features'], analyzer=vectorizer_analyzer)
+            self.classifier_name = classifier or MODEL_CONFIG['classifier']
+        else:
+            raise ValueError(f"Unknown model mode: {self.mode}")
+        self.classifier = make_classifier(self.classifier_name)
+        self.compiled = None  # compiled_forest copy of a fitted random forest, see _predict_proba
+        # MaxAbsScaler keeps sparse inputs sparse, unlike StandardScaler
+        self.feature_scaler = MaxAbsScaler()
+        self.feature_names = []
+        self.model_version = None
+        self.n_updates = 0  # partial_fit micro-batches since the last full train()
+        self.prediction_cache = LRUCache(CACHE_CONFIG['prediction_cache_size'])
+        self.is_trained = False
+        
+    def preprocess_text(self, text):
+        """Clean and preprocess text data"""
+        # Lowercase, remove special characters and digits, collapse whitespace
+        return ' '.join(self.tokenize(text))
+    
+    def tokenize(self, text):
+        """Split raw text into cleaned tokens (the only tokenization a document gets)"""
+        if not isinstance(text, str) and pd.isna(text):
+            return []
+        return tokenize(text)
+    
+    def extract_features(self, text):
+        """Extract additional features from preprocessed text (see preprocess_text)"""
+        return features_from_tokens(text, text.split())
+    
+    def featurize(self, token_lists):
+        """Hand-crafted features and TF-IDF input for already tokenized documents"""
+        cleaned_texts = [' '.join(tokens) for tokens in token_lists]
+        return cleaned_texts, batch_features(cleaned_texts, token_lists)
+    
+    def train(self, data_path=None, progress=None):
+        """
+        Train the model with sample data or provided dataset.
+        progress(stage, fraction) is called between stages and may raise to abort.
+        """
+        progress = progress or (lambda stage, fraction: None)
+        progress('loading', 0.0)
+        if data_path and os.path.exists(data_path):
+            # Load custom dataset
+            df = pd.read_csv(data_path)
+        else:
+            # Create sample dataset for demonstration
+            df = self.create_sample_dataset()
+        
+        # Tokenize once, then reuse the tokens for features and TF-IDF
+        progress('featurizing', 0.1)
+        token_lists = [self.tokenize(text) for text in df['text']]
+        _, feature_df = self.featurize(token_lists)
+        
+        # Combine text features with extracted features
+        progress('vectorizing', 0.3)
+        X_text = self.vectorizer.fit_transform(token_lists)
+        X_combined = self.combine_features(X_text, feature_df.values, fit=True)
+        y = df['label'].values
+        
+        # Train classifier
+        progress('fitting', 0.5)
+        with stage('fit'):
+            self.classifier.fit(X_combined, y)
+        set_n_jobs(self.classifier, MODEL_CONFIG['predict_n_jobs'])
+        self.compile()
+        progress('evaluating', 0.9)
+        self.feature_names = list(feature_df.columns)
+        self.model_version = new_model_version()
+        self.n_updates = 0
+        self.prediction_cache.clear()
+        self.is_trained = True
+        
+        return accuracy_score(y, self.classifier.predict(X_combined))
+    
+    def train_streaming(self, data_path, chunksize=None, epochs=None, progress=None):
+        """
+        Out-of-core training for online mode: read data_path (CSV, JSONL or Parquet)
+        in chunks and partial_fit each one, so memory is bounded by the chunk size
+        rather than the dataset. Returns rows/sec, progressive accuracy (each chunk
+        scored before it is learned, first epoch only) and peak RSS.
+        """
+        if self.mode != 'online':
+            raise ValueError("train_streaming() needs an online-mode model (MODEL_CONFIG['mode'] = 'online')")
+        progress = progress or (lambda stage, fraction: None)
+        chunksize = chunksize or ONLINE_CONFIG['stream_chunksize']
+        epochs = epochs or ONLINE_CONFIG['stream_epochs']
+        
+        start = time.perf_counter()
+        rows = chunks = scored = correct = 0
+        fitted = False
+        for epoch in range(epochs):
+            for chunk, fraction in iter_chunks(data_path, chunksize):
+                texts, labels = labeled_rows(chunk)
+                if not texts:
+                    continue
+                y = np.asarray(labels, dtype=int)
+                token_lists = [self.tokenize(text) for text in texts]
+                _, feature_df = self.featurize(token_lists)
+                self.feature_scaler.partial_fit(feature_df.values)
+                X_combined = self.combine_features(self.vectorizer.transform(token_lists), feature_df.values)
+                if fitted and epoch == 0:
+                    scored += len(y)
+                    correct += int((self.classifier.predict(X_combined) == y).sum())
+                self.classifier.partial_fit(X_combined, y, classes=LABEL_CLASSES)
+                fitted = True
+                rows += len(y)
+                chunks += 1
+                progress('streaming', 0.95 * (epoch + fraction) / epochs)
+        if not fitted:
+            raise ValueError(f"No labeled rows found in {data_path}")
+        elapsed = time.perf_counter() - start
+        
+        self.feature_names = list(FEATURE_NAMES)
+        self.model_version = new_model_version()
+        self.n_updates = 0
+        self.prediction_cache.clear()
+        self.is_trained = True
+        return {
+            'mode': self.mode,
+            'rows': rows,
+            'chunks': chunks,
+            'epochs': epochs,
+            'seconds': round(elapsed, 3),
+            'rows_per_s': round(rows / elapsed, 1),
+            'progressive_accuracy': round(correct / scored, 4) if scored else None,
+            'peak_rss_mb': peak_rss_mb(),
+        }
+    
+    def partial_fit(self, texts, labels):
+        """
+        Fold a micro-batch of labeled articles into an online-mode model.
+        Returns a new detector; this one keeps serving predictions unchanged.
+        """
+        if self.mode != 'online':
+            raise ValueError("partial_fit() needs an online-mode model (MODEL_CONFIG['mode'] = 'online')")
+        
+        model = FakeNewsDetector(mode='online')
+        # The hashing vectorizer is stateless, so it can be shared
+        model.vectorizer = self.vectorizer
+        model.classifier = copy.deepcopy(self.classifier)
+        model.feature_scaler = copy.deepcopy(self.feature_scaler)
+        
+        token_lists = [self.tokenize(text) for text in texts]
+        _, feature_df = model.featurize(token_lists)
+        model.feature_scaler.partial_fit(feature_df.values)
+        X_combined = model.combine_features(model.vectorizer.transform(token_lists), feature_df.values)
+        model.classifier.partial_fit(X_combined, np.asarray(labels, dtype=int), classes=LABEL_CLASSES)
+        
+        model.feature_names = list(feature_df.columns)
+        model.model_version = new_model_version()
+        model.n_updates = self.n_updates + 1
+        model.is_trained = True
+        return model
+    
+    def combine_features(self, X_text, X_features, fit=False):
+        """Stack TF-IDF and scaled hand-crafted features into one sparse CSR matrix"""
+        X_features = np.asarray(X_features, dtype=np.float64)
+        if fit:
+            X_features = self.feature_scaler.fit_transform(X_features)
+        else:
+            X_features = self.feature_scaler.transform(X_features)
+        
+        return sparse.hstack([X_text, sparse.csr_matrix(X_features)], format='csr')
+    
+    def compile(self):
+        """Flatten a fitted random forest for fast small-batch scoring (no-op for other backends)"""
+        self.compiled = compile_forest(self.classifier) if MODEL_CONFIG['compiled_inference'] else None
+        return self.compiled is not None
+    
+    def _predict_proba(self, X):
+        """Class probabilities; small batches skip sklearn's per-call overhead when compiled"""
+        if self.compiled is not None and X.shape[0] <= MODEL_CONFIG['compiled_max_rows']:
+            return self.compiled.predict_proba(X)
+        return self.classifier.predict_proba(X)
+    
+    def save(self, path):
+        """Persist the fitted model as an on-disk artifact"""
+        if not self.is_trained:
+            raise ValueError("Model not trained. Please train the model first.")
+        
+        components = {
+            'vectorizer': self.vectorizer,
+            'classifier': self.classifier,
+            'feature_scaler': self.feature_scaler,
+        }
+        metadata = {
+            'model_version': self.model_version,
+            'mode': self.mode,
+            'n_updates': self.n_updates,
+            'feature_schema': self.feature_names,
+            'classifier': type(self.classifier).__name__,
+            'classifier_backend': self.classifier_name,
+            'n_text_features': (
+                self.vectorizer.n_features if self.mode == 'online' else len(self.vectorizer.vocabulary_)
+            ),
+        }
+        return save_artifact(path, components, metadata)
+    
+    def load(self, path, mmap=True):
+        """Load a model artifact saved by save(), memory-mapping large arrays"""
+        components, metadata = load_artifact(path, mmap=mmap)
+        
+        if metadata.get('feature_schema') != FEATURE_NAMES:
+            raise ValueError("Model artifact feature schema does not match extract_features(). Please retrain the model.")
+        
+        self.mode = metadata.get('mode', 'batch')
+        self.vectorizer = components['vectorizer']
+        self.classifier = components['classifier']
+        self.classifier_name = metadata.get('classifier_backend', 'random_forest')
+        self.feature_scaler = components['feature_scaler']
+        self.compile()
+        self.feature_names = metadata['feature_schema']
+        self.model_version = metadata.get('model_version')
+        self.n_updates = metadata.get('n_updates', 0)
+        self.prediction_cache.clear()
+        self.is_trained = True
+        return metadata
+    
+    def create_sample_dataset(self):
+        """Create a sample dataset for demonstration"""
+        sample_data = {
+            'text': [
+                # Fake news examples
+                "BREAKING: Scientists discover that drinking hot water with lemon cures all diseases instantly! This miracle cure has been hidden by big pharma for years.",
+                "ALIENS CONFIRMED: Government admits to covering up extraterrestrial contact for decades. Shocking new evidence reveals everything.",
+                "5G CAUSES COVID: New study proves that 5G networks are responsible for the coronavirus pandemic. Experts say radiation is the real culprit.",
+                "FLAT EARTH PROVEN: NASA finally admits the Earth is flat after pressure from social media. All space photos were CGI.",
+                "TIME TRAVEL ACHIEVED: Scientists successfully send a cat back to 1920. The cat returned with a message from the past.",
+                
+                # Real news examples
+                "NASA's Perseverance rover successfully landed on Mars, beginning its mission to search for signs of ancient life.",
+                "The World Health Organization reports that COVID-19 vaccines have been proven safe and effective in clinical trials.",
+                "Scientists discover new species of deep-sea creatures in the Pacific Ocean during research expedition.",
+                "Global temperatures continue to rise, with 2023 being one of the warmest years on record according to climate data.",
+                "Researchers develop new renewable energy technology that could reduce carbon emissions by 50%.",
+                "Study shows that regular exercise can improve mental health and reduce symptoms of depression.",
+                "New cancer treatment shows promising results in early clinical trials, offering hope for patients.",
+                "International space station celebrates 20 years of continuous human presence in space.",
+                "Renewable energy sources now provide over 30% of global electricity generation.",
+                "Scientists develop biodegradable plastic alternative made from plant materials."
+            ],
+            'label': [1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]  # 1 for fake, 0 for real
+        }
+        return pd.DataFrame(sample_data)
+    
+    def predict(self, text):
+        """Predict whether a news article is fake or real"""
+        if not self.is_trained:
+            return {"error": "Model not trained. Please train the model first."}
+        
+        return self.predict_batch([text])[0]
+    
+    def predict_batch(self, texts):
+        """Predict a list of articles with one vectorize/featurize/classify pass"""
+        if not self.is_trained:
+            return [{"error": "Model not trained. Please train the model first."} for _ in texts]
+        
+        # Tokenize once; identical cleaned texts are scored only once
+        documents = {}
+        cleaned_texts = []
+        with stage('tokenize'):
+            for text in texts:
+                tokens = self.tokenize(text)
+                cleaned_text = ' '.join(tokens)
+                documents.setdefault(cleaned_text, tokens)
+                cleaned_texts.append(cleaned_text)
+        
+        # Serve repeated articles from the cache, keyed by cleaned text + model version
+        predictions = {}
+        cache_keys = {}
+        for cleaned_text in documents:
+            cache_keys[cleaned_text] = make_cache_key(cleaned_text, self.model_version)
+            cached = self.prediction_cache.get(cache_keys[cleaned_text])
+            record_cache('prediction', cached is not None)
+            if cached is not None:
+                predictions[cleaned_text] = cached
+        
+        missing = [tokens for text, tokens in documents.items() if text not in predictions]
+        if missing:
+            with stage('featurize'):
+                unique_texts, feature_df = self.featurize(missing)
+                feature_rows = feature_df.to_dict('records')
+            
+            # Vectorize text and combine with the hand-crafted features
+            with stage('vectorize'):
+                text_vectors = self.vectorizer.transform(missing)
+                X_combined = self.combine_features(text_vectors, feature_df.values)
+            
+            # Make predictions (predict() is the argmax of predict_proba, so one call is enough)
+            with stage('classify'):
+                probabilities = self._predict_proba(X_combined)
+            
+            for text, features, probability in zip(unique_texts, feature_rows, probabilities):
+                predictions[text] = {
+                    "prediction": "FAKE" if probability[1] > probability[0] else "REAL",
+                    "confidence": float(max(probability)),
+                    "fake_probability": float(probability[1]),
+                    "real_probability": float(probability[0]),
+                    "features": features
+                }
+                self.prediction_cache.put(cache_keys[text], predictions[text])
+        
+        # Copy per item so callers can annotate results independently
+        return [dict(predictions[text]) for text in cleaned_texts]
+
+def load_detector(path=None):
+    """Create a detector from the saved model artifact, if there is one"""
+    path = path or MODEL_CONFIG['artifact_path']
+    model = FakeNewsDetector()
+    if artifact_exists(path):
+        try:
+            metadata = model.load(path)
+            print(f"✅ Loaded model artifact {metadata.get('model_version')} from {path}")
+        except Exception as e:
+            print(f"⚠️ Could not load model artifact from {path}: {e}")
+            model = FakeNewsDetector()
+    return model
@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""
+Domain handling for web verification
+Public-suffix-aware registrable domain extraction and a compact domain
+reputation index that scales to reputation lists with millions of entries
+"""
+
+import hashlib
+import ipaddress
+import os
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+# Subset of the Public Suffix List (https://publicsuffix.org/list/) in its own
+# format. Single-label TLDs need no entry: an unlisted TLD is a suffix by the
+# PSL's default "*" rule. Load the full list via VERIFY_CONFIG['public_suffix_path'].
+BUILTIN_SUFFIX_RULES = """
+// United Kingdom
+co.uk
+org.uk
+ac.uk
+gov.uk
+ltd.uk
+plc.uk
+me.uk
+net.uk
+nhs.uk
+police.uk
+sch.uk
+// Australia / New Zealand
+com.au
+net.au
+org.au
+edu.au
+gov.au
+asn.au
+id.au
+co.nz
+org.nz
+govt.nz
+ac.nz
+// Asia
+co.jp
+ne.jp
+or.jp
+ac.jp
+go.jp
+co.kr
+or.kr
+co.in
+net.in
+org.in
+gov.in
+ac.in
+com.cn
+net.cn
+org.cn
+gov.cn
+com.hk
+org.hk
+com.sg
+gov.sg
+com.tw
+com.my
+com.pk
+com.ph
+co.id
+co.th
+// Americas
+com.br
+gov.br
+org.br
+com.mx
+gob.mx
+com.ar
+gob.ar
+com.co
+qc.ca
+on.ca
+// Europe / Africa / Middle East
+com.tr
+gov.tr
+co.il
+org.il
+com.ua
+com.pl
+co.za
+org.za
+gov.za
+com.ng
+com.eg
+co.ke
+// Wildcard and exception rules
+*.ck
+!www.ck
+*.bd
+// Shared hosting: every subdomain belongs to a different owner
+blogspot.com
+github.io
+herokuapp.com
+"""
+
+_RULE = 1
+_EXCEPTION = 2
+_END = ''  # never a real label
+
+
+def _normalize_host(host: str) -> str:
+    host = (host or '').strip().lower()
+    if host.startswith('[') and ']' in host:
+        return host[1:host.index(']')]
+    if host.count(':') == 1:
+        host = host.split(':', 1)[0]
+    return host.rstrip('.')
+
+
+def _is_ip(host: str) -> bool:
+    try:
+        ipaddress.ip_address(host)
+        return True
+    except ValueError:
+        return False
+
+
+class PublicSuffixTrie:
+    """Suffix rules in a trie keyed by reversed labels; a lookup walks each label once"""
+
+    def __init__(self, rules: Iterable[str] = ()):
+        self.root: Dict = {}
+        self.size = 0
+        for rule in rules:
+            self.add_rule(rule)
+
+    @classmethod
+    def from_text(cls, text: str) -> 'PublicSuffixTrie':
+        rules = []
+        for line in text.splitlines():
+            line = line.strip()
+            if line and not line.startswith('//'):
+                rules.append(line.split()[0])
+        return cls(rules)
+
+    @classmethod
+    def from_file(cls, path: str) -> 'PublicSuffixTrie':
+        with open(path, encoding='utf-8') as fh:
+            return cls.from_text(fh.read())
+
+    def add_rule(self, rule: str) -> None:
+        kind = _RULE
+        if rule.startswith('!'):
+            kind, rule = _EXCEPTION, rule[1:]
+        node = self.root
+        for label in reversed(rule.lower().split('.')):
+            node = node.setdefault(label, {})
+        node[_END] = kind
+        self.size += 1
+
+    def suffix_length(self, labels: List[str]) -> int:
+        """Number of trailing labels forming the public suffix (PSL algorithm)"""
+        length = 1  # default "*" rule
+        exception = None
+        nodes = [self.root]
+        for depth, label in enumerate(reversed(labels), start=1):
+            matched = []
+            for node in nodes:
+                for key in (label, '*'):
+                    child = node.get(key)
+                    if child is None:
+                        continue
+                    matched.append(child)
+                    kind = child.get(_END)
+                    if kind == _RULE:
+                        length = max(length, depth)
+                    elif kind == _EXCEPTION:
+                        exception = depth
+            if not matched:
+                break
+            nodes = matched
+        # An exception rule's suffix is the rule minus its leftmost label
+        return exception - 1 if exception is not None else length
+
+    def registrable_domain(self, host: str) -> str:
+        """'news.bbc.co.uk' -> 'bbc.co.uk'; IPs and bare suffixes are returned unchanged"""
+        host = _normalize_host(host)
+        if not host or _is_ip(host):
+            return host
+        labels = host.split('.')
+        length = self.suffix_length(labels)
+        if len(labels) <= length:
+            return host
+        return '.'.join(labels[-(length + 1):])
+
+    def parent_domains(self, host: str) -> List[str]:
+        """The host and each parent down to its registrable domain, most specific first"""
+        host = _normalize_host(host)
+        if not host or _is_ip(host):
+            return [host] if host else []
+        labels = host.split('.')
+        length = self.suffix_length(labels)
+        if len(labels) <= length:
+            return [host]
+        return ['.'.join(labels[i:]) for i in range(len(labels) - length)]
+
+
+def domain_hash(domain: str) -> int:
+    """Stable 64-bit hash of a normalized domain (stable across processes, unlike hash())"""
+    return int.from_bytes(hashlib.blake2b(domain.encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+def _sorted_unique(hashes: np.ndarray, labels: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Sort by hash, keeping the last label given for each hash"""
+    order = np.argsort(hashes, kind='stable')
+    hashes, labels = hashes[order], labels[order]
+    keep = np.append(hashes[1:] != hashes[:-1], True) if len(hashes) else np.zeros(0, dtype=bool)
+    return hashes[keep], labels[keep]
+
+
+class ReputationIndex:
+    """
+    Domain -> label map stored as a sorted uint64 hash array plus a parallel
+    uint8 label array: about 9 bytes per domain. With 64-bit hashes the chance
+    of any false match is ~n^2 / 2^65, about 3e-8 for a million domains.
+    """
+
+    def __init__(self, hashes: np.ndarray, labels: np.ndarray, label_names: List[str],
+                 suffixes: Optional[PublicSuffixTrie] = None):
+        self.hashes = hashes
+        self.labels = labels
+        self.label_names = list(label_names)
+        self.suffixes = suffixes or get_public_suffixes()
+
+    @classmethod
+    def from_items(cls, items: Iterable[Tuple[str, str]],
+                   suffixes: Optional[PublicSuffixTrie] = None) -> 'ReputationIndex':
+        """Build from (domain, label) pairs; a later pair wins over an earlier one"""
+        label_ids: Dict[str, int] = {}
+        hashes, labels = [], []
+        for domain, label in items:
+            domain = _normalize_host(domain)
+            if not domain:
+                continue
+            hashes.append(domain_hash(domain))
+            labels.append(label_ids.setdefault(label, len(label_ids)))
+        if len(label_ids) > 255:
+            raise ValueError("At most 255 distinct reputation labels are supported")
+        hashes = np.array(hashes, dtype=np.uint64)
+        labels = np.array(labels, dtype=np.uint8)
+        return cls(*_sorted_unique(hashes, labels), list(label_ids), suffixes)
+
+    @classmethod
+    def from_file(cls, path: str, default_label: str = 'suspect',
+                  suffixes: Optional[PublicSuffixTrie] = None) -> 'ReputationIndex':
+        """Load a compiled .npz index, or a text file of "domain[,label]" lines ('#' comments)"""
+        if path.endswith('.npz'):
+            with np.load(path) as data:
+                return cls(data['hashes'], data['labels'], [str(n) for n in data['label_names']], suffixes)
+        return cls.from_items(_read_domain_list(path, default_label), suffixes)
+
+    def save(self, path: str) -> None:
+        """Write the compiled index so later loads skip parsing and hashing"""
+        np.savez(path, hashes=self.hashes, labels=self.labels, label_names=np.array(self.label_names))
+
+    def merged(self, extra: 'ReputationIndex') -> 'ReputationIndex':
+        """New index combining both; entries in extra take precedence"""
+        names = self.label_names + [n for n in extra.label_names if n not in self.label_names]
+        remap = np.array([names.index(n) for n in extra.label_names], dtype=np.uint8)
+        hashes = np.concatenate([self.hashes, extra.hashes])
+        labels = np.concatenate([self.labels, remap[extra.labels] if len(extra.labels) else extra.labels])
+        return ReputationIndex(*_sorted_unique(hashes, labels), names, self.suffixes)
+
+    def __len__(self):
+        return len(self.hashes)
+
+    @property
+    def nbytes(self) -> int:
+        return self.hashes.nbytes + self.labels.nbytes
+
+    def _label_of(self, domain: str) -> Optional[str]:
+        if not len(self.hashes):
+            return None
+        key = np.uint64(domain_hash(domain))
+        pos = int(np.searchsorted(self.hashes, key))
+        if pos < len(self.hashes) and self.hashes[pos] == key:
+            return self.label_names[self.labels[pos]]
+        return None
+
+    def lookup(self, host: str) -> Optional[str]:
+        """
+        Label of the most specific listed domain covering host, checking the
+        host and each parent down to its registrable domain (so a listed
+        'abcnews.go.com' matches 'www.abcnews.go.com' but never 'go.com')
+        """
+        for domain in self.suffixes.parent_domains(host):
+            label = self._label_of(domain)
+            if label is not None:
+                return label
+        return None
+
+
+def _read_domain_list(path: str, default_label: str):
+    with open(path, encoding='utf-8') as fh:
+        for line in fh:
+            line = line.split('#', 1)[0].strip()
+            if not line:
+                continue
+            parts = line.replace(',', ' ').replace('\t', ' ').split()
+            yield parts[0], parts[1] if len(parts) > 1 else default_label
+
+
+# Resolved PSL file path (None for the built-in rules) -> parsed trie
+_public_suffixes: Dict[Optional[str], PublicSuffixTrie] = {}
+_suffix_lock = threading.Lock()
+
+
+def get_public_suffixes(path: Optional[str] = None) -> PublicSuffixTrie:
+    """Shared suffix trie for a path (default: the built-in rules), built once per process"""
+    key = os.path.realpath(path) if path else None
+    trie = _public_suffixes.get(key)
+    if trie is None:
+        with _suffix_lock:
+            trie = _public_suffixes.get(key)
+            if trie is None:
+                trie = PublicSuffixTrie.from_file(key) if key else PublicSuffixTrie.from_text(BUILTIN_SUFFIX_RULES)
+                _public_suffixes[key] = trie
+    return trie
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the OpenAI chat completions API
+Used by benchmarks and offline tests; never talks to the real API
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional
+
+DEFAULT_ANALYSIS = {
+    "credibility_score": 25,
+    "is_likely_fake": True,
+    "confidence": 80,
+    "red_flags": ["Sensational language"],
+    "green_flags": [],
+    "reasoning": "Stub analysis",
+    "recommendations": "Verify with multiple sources"
+}
+
+
+class FakeOpenAIServer:
+    """
+    Threaded HTTP/1.1 server answering POST /v1/chat/completions with a canned analysis.
+    Counts requests and TCP connections, can add latency (seconds, or a callable
+    returning seconds) and answer the first `rate_limit_first` requests with 429s.
+    """
+
+    def __init__(self, latency: float = 0.0, rate_limit_first: int = 0,
+                 analysis: Optional[Dict] = None, analysis_fn: Optional[Callable[[str], Dict]] = None,
+                 port: int = 0):
+        self.latency = latency
+        self.rate_limit_first = rate_limit_first
+        # analysis_fn(prompt) lets tests return per-article answers
+        self.analysis_fn = analysis_fn or (lambda prompt: analysis or DEFAULT_ANALYSIS)
+        self.requests = 0
+        self.connections = 0
+        self.rate_limited = 0
+        self.prompts: List[str] = []
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(('127.0.0.1', port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            # Headers and body go out in separate writes; without this, Nagle +
+            # delayed ACKs add ~40ms to every response on a kept-alive connection
+            disable_nagle_algorithm = True
+
+            def setup(self):
+                super().setup()
+                with server._lock:
+                    server.connections += 1
+
+            def log_message(self, format, *args):
+                pass
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+                with server._lock:
+                    server.requests += 1
+                    limited = server.rate_limited < server.rate_limit_first
+                    if limited:
+                        server.rate_limited += 1
+                latency = server.latency() if callable(server.latency) else server.latency
+                if latency:
+                    time.sleep(latency)
+
+                if limited:
+                    self._send(429, {"error": {"message": "Rate limit reached", "type": "rate_limit_error"}},
+                               {'Retry-After': '0'})
+                    return
+
+                request = json.loads(body or b'{}')
+                prompt = request.get('messages', [{}])[-1].get('content', '')
+                with server._lock:
+                    server.prompts.append(prompt)
+                self._send(200, {
+                    "id": "chatcmpl-stub",
+                    "object": "chat.completion",
+                    "created": int(time.time()),
+                    "model": request.get('model', 'stub'),
+                    "choices": [{
+                        "index": 0,
+                        "message": {"role": "assistant", "content": json.dumps(server.analysis_fn(prompt))},
+                        "finish_reason": "stop"
+                    }],
+                    "usage": {"prompt_tokens": len(prompt) // 4, "completion_tokens": 50,
+                              "total_tokens": len(prompt) // 4 + 50}
+                })
+
+            def _send(self, status, payload, headers=None):
+                data = json.dumps(payload).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+        return Handler
+
+    def start(self) -> 'FakeOpenAIServer':
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the web search backend
+Used by benchmarks and offline tests; never talks to a search provider
+"""
+
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+DEFAULT_RESULTS = [
+    {'href': 'https://www.reuters.com/fact-check/claim', 'title': 'Fact check: claim is false',
+     'body': 'Reuters fact check: the claim is false and misleading.'},
+    {'href': 'https://www.bbc.co.uk/news/health', 'title': 'Health officials respond',
+     'body': 'Experts say there is no evidence for the claim.'},
+    {'href': 'https://beforeitsnews.com/story', 'title': 'They do not want you to know',
+     'body': 'Sources confirm the shocking truth.'},
+]
+
+
+class StaticSearchBackend:
+    """
+    Search backend returning canned results (or results_fn(query) per query).
+    Counts calls and can add latency (seconds) to mimic a remote provider.
+    """
+
+    name = 'static'
+
+    def __init__(self, results: Optional[List[Dict]] = None,
+                 results_fn: Optional[Callable[[str], List[Dict]]] = None, latency: float = 0.0):
+        self.results_fn = results_fn or (lambda query: results if results is not None else DEFAULT_RESULTS)
+        self.latency = latency
+        self.calls = 0
+        self.queries: List[str] = []
+        self._lock = threading.Lock()
+
+    def search(self, query: str, max_results: int, timelimit: Optional[str]) -> List[Dict]:
+        with self._lock:
+            self.calls += 1
+            self.queries.append(query)
+        if self.latency:
+            time.sleep(self.latency)
+        return [dict(hit) for hit in self.results_fn(query)[:max_results]]
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Single-pass text featurization for the Fake News Detection System
+Each document is tokenized once; the tokens feed both the hand-crafted
+statistics and the TF-IDF vectorizer
+"""
+
+import re
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS
+
+from config import FEATURE_CONFIG
+from sentiment import get_lexicon
+
+NON_ALPHA_RE = re.compile(r'[^a-zA-Z\s]')
+URL_RE = re.compile(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+')
+UPPERCASE_RE = re.compile(r'[A-Z]')
+
+FEATURE_NAMES = [
+    'text_length',
+    'word_count',
+    'avg_word_length',
+    'sentiment_polarity',
+    'sentiment_subjectivity',
+    'exclamation_count',
+    'question_count',
+    'uppercase_count',
+    'url_count',
+]
+
+
+def tokenize(text) -> List[str]:
+    """Lowercase, strip non-letters and split: the only tokenization a document gets"""
+    return NON_ALPHA_RE.sub('', str(text).lower()).split()
+
+
+def vectorizer_analyzer(tokens: List[str]) -> List[str]:
+    """
+    TF-IDF analyzer over pre-tokenized documents.
+    Matches TfidfVectorizer(stop_words='english') on cleaned text, whose default
+    token pattern keeps words of two or more characters.
+    """
+    return [t for t in tokens if len(t) > 1 and t not in ENGLISH_STOP_WORDS]
+
+
+def sentiment_lexicon():
+    """Lexicon used for the sentiment features (TextBlob-compatible scores)"""
+    return get_lexicon(FEATURE_CONFIG.get('sentiment_lexicon_path'))
+
+
+def features_from_tokens(text: str, tokens: List[str]) -> Dict:
+    """Hand-crafted features for one document, reusing its tokens"""
+    polarity, subjectivity = sentiment_lexicon().score(tokens)
+    return {
+        'text_length': len(text),
+        'word_count': len(tokens),
+        'avg_word_length': np.mean([len(word) for word in tokens]) if tokens else 0,
+        'sentiment_polarity': polarity,
+        'sentiment_subjectivity': subjectivity,
+        'exclamation_count': text.count('!'),
+        'question_count': text.count('?'),
+        'uppercase_count': sum(1 for c in text if c.isupper()),
+        'url_count': len(URL_RE.findall(text))
+    }
+
+
+def batch_features(cleaned_texts: Iterable[str], token_lists: Optional[List[List[str]]] = None) -> pd.DataFrame:
+    """
+    Hand-crafted features for a whole column of preprocessed texts using
+    vectorized pandas string ops. Relies on preprocess_text() output being
+    single-space separated, so word stats follow from lengths and space counts.
+    Pass token_lists when the caller already has them to skip re-splitting.
+    """
+    texts = pd.Series(list(cleaned_texts), dtype=object).astype(str)
+    if token_lists is None:
+        token_lists = [text.split() for text in texts]
+    lengths = texts.str.len().to_numpy()
+    word_counts = np.where(lengths > 0, texts.str.count(' ').to_numpy() + 1, 0)
+    letters = lengths - np.maximum(word_counts - 1, 0)
+    avg_word_length = np.divide(letters, word_counts, out=np.zeros(len(texts)), where=word_counts > 0)
+
+    scores = np.array(sentiment_lexicon().score_batch(token_lists), dtype=np.float64).reshape(-1, 2)
+
+    return pd.DataFrame({
+        'text_length': lengths,
+        'word_count': word_counts,
+        'avg_word_length': avg_word_length,
+        'sentiment_polarity': scores[:, 0],
+        'sentiment_subjectivity': scores[:, 1],
+        'exclamation_count': texts.str.count('!').to_numpy(),
+        'question_count': texts.str.count(r'\?').to_numpy(),
+        'uppercase_count': texts.str.count(UPPERCASE_RE.pattern).to_numpy(),
+        'url_count': texts.str.count(URL_RE.pattern).to_numpy(),
+    }, columns=FEATURE_NAMES)
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Labeled feedback buffering for the online model
+Collects /feedback examples and applies them as micro-batches on a background thread
+"""
+
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+LABELS = {'fake': 1, 'real': 0, '1': 1, '0': 0}
+
+
+def parse_label(value) -> Optional[int]:
+    """1 for fake, 0 for real; accepts 'FAKE'/'REAL', 1/0 and booleans. None if unrecognized."""
+    if isinstance(value, bool):
+        return int(value)
+    if isinstance(value, int) and value in (0, 1):
+        return value
+    if isinstance(value, str):
+        return LABELS.get(value.strip().lower())
+    return None
+
+
+class FeedbackBuffer:
+    """
+    Buffers (text, label) pairs and calls apply_fn(texts, labels) once
+    `batch_size` are waiting, or `flush_interval` seconds after the oldest
+    one arrived. Batches are applied one at a time, in arrival order.
+    """
+
+    def __init__(self, apply_fn: Callable[[List[str], List[int]], None], batch_size: int = 32,
+                 flush_interval: float = 5.0, max_buffered: int = 10000):
+        self.apply_fn = apply_fn
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_buffered = max_buffered
+        self._pending: List[Tuple[str, int]] = []
+        self._oldest = None
+        self._cond = threading.Condition()
+        self._apply_lock = threading.Lock()
+        self._thread = None
+        self.applied_batches = 0
+        self.applied_examples = 0
+        self.failed_batches = 0
+        self.last_error = None
+
+    def add(self, examples: Sequence[Tuple[str, int]]) -> bool:
+        """Queue examples; False if that would exceed max_buffered"""
+        with self._cond:
+            if len(self._pending) + len(examples) > self.max_buffered:
+                return False
+            if not self._pending:
+                self._oldest = time.monotonic()
+            self._pending.extend(examples)
+            self._ensure_worker()
+            self._cond.notify()
+        return True
+
+    def _ensure_worker(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='feedback-flusher', daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while True:
+                    if len(self._pending) >= self.batch_size:
+                        break
+                    if self._pending:
+                        remaining = self._oldest + self.flush_interval - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        self._cond.wait(remaining)
+                    else:
+                        self._cond.wait()
+            self.flush()
+
+    def _take(self) -> List[Tuple[str, int]]:
+        with self._cond:
+            batch = self._pending[:self.batch_size]
+            del self._pending[:self.batch_size]
+            self._oldest = time.monotonic() if self._pending else None
+            return batch
+
+    def flush(self) -> int:
+        """Apply everything buffered now, in the calling thread; returns the number of examples applied"""
+        applied = 0
+        with self._apply_lock:
+            while True:
+                batch = self._take()
+                if not batch:
+                    return applied
+                texts, labels = zip(*batch)
+                try:
+                    self.apply_fn(list(texts), list(labels))
+                except Exception as e:
+                    # Drop the batch rather than retrying it forever
+                    self.failed_batches += 1
+                    self.last_error = str(e)
+                    continue
+                self.applied_batches += 1
+                self.applied_examples += len(batch)
+                applied += len(batch)
+
+    def __len__(self):
+        with self._cond:
+            return len(self._pending)
+
+    def stats(self) -> Dict:
+        return {
+            'buffered': len(self),
+            'batch_size': self.batch_size,
+            'applied_batches': self.applied_batches,
+            'applied_examples': self.applied_examples,
+            'failed_batches': self.failed_batches,
+            'last_error': self.last_error,
+        }
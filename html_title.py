@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Streaming <title> extraction for the Fake News Detection System
+Reads a page incrementally and stops at </title> or a byte cap instead of
+downloading and parsing the whole document
+"""
+
+import codecs
+import html
+import re
+from typing import Iterable, Optional
+
+TITLE_END_RE = re.compile(rb'</title\s*>', re.IGNORECASE)
+TITLE_RE = re.compile(rb'<title(?:\s[^>]*)?>(.*?)</title\s*>', re.IGNORECASE | re.DOTALL)
+HEADER_CHARSET_RE = re.compile(r'charset=["\']?([\w.:-]+)', re.IGNORECASE)
+# <meta charset="utf-8"> and <meta http-equiv="Content-Type" content="text/html; charset=utf-8">
+META_CHARSET_RE = re.compile(rb'<meta[^>]+charset=["\']?([\w.:-]+)', re.IGNORECASE)
+WHITESPACE_RE = re.compile(r'\s+')
+
+BOMS = (
+    (codecs.BOM_UTF8, 'utf-8'),
+    (codecs.BOM_UTF16_LE, 'utf-16-le'),
+    (codecs.BOM_UTF16_BE, 'utf-16-be'),
+)
+
+DEFAULT_MAX_BYTES = 256 * 1024
+CHUNK_SIZE = 8 * 1024
+
+
+def _valid_encoding(name) -> Optional[str]:
+    if not name:
+        return None
+    name = name.decode('ascii', 'ignore') if isinstance(name, bytes) else name
+    try:
+        return codecs.lookup(name).name
+    except LookupError:
+        return None
+
+
+def detect_encoding(head: bytes, content_type: str = '') -> str:
+    """Byte-order mark, then the Content-Type charset, then a <meta> charset, then UTF-8"""
+    for bom, encoding in BOMS:
+        if head.startswith(bom):
+            return encoding
+    match = HEADER_CHARSET_RE.search(content_type or '')
+    encoding = _valid_encoding(match.group(1)) if match else None
+    if encoding:
+        return encoding
+    match = META_CHARSET_RE.search(head)
+    return (_valid_encoding(match.group(1)) if match else None) or 'utf-8'
+
+
+def read_title(chunks: Iterable[bytes], content_type: str = '', max_bytes: int = DEFAULT_MAX_BYTES) -> str:
+    """
+    Consume byte chunks until </title> shows up or max_bytes have been read,
+    then decode and unescape the title. Returns '' when there is none.
+    """
+    buffer = bytearray()
+    for chunk in chunks:
+        if not chunk:
+            continue
+        # Only the tail can complete a "</title>" split across chunks
+        search_from = max(0, len(buffer) - 16)
+        buffer += chunk
+        if TITLE_END_RE.search(buffer, search_from) or len(buffer) >= max_bytes:
+            break
+    head = bytes(buffer[:max_bytes])
+
+    encoding = detect_encoding(head, content_type)
+    if encoding.startswith('utf-16'):
+        # Markup is not ASCII-compatible; decode first, then search
+        match = re.search(r'<title(?:\s[^>]*)?>(.*?)</title\s*>', head.decode(encoding, 'replace'),
+                          re.IGNORECASE | re.DOTALL)
+        raw = match.group(1) if match else ''
+    else:
+        match = TITLE_RE.search(head)
+        raw = match.group(1).decode(encoding, 'replace') if match else ''
+    return WHITESPACE_RE.sub(' ', html.unescape(raw)).strip()
+
+
+def fetch_title(session, url: str, timeout: float, max_bytes: int = DEFAULT_MAX_BYTES) -> str:
+    """Title of an HTML page, streaming at most max_bytes of the body"""
+    with session.get(url, timeout=timeout, stream=True) as r:
+        content_type = r.headers.get('Content-Type', '')
+        if not r.ok or 'text/html' not in content_type:
+            return ''
+        return read_title(r.iter_content(CHUNK_SIZE), content_type, max_bytes)
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Multi-pattern keyword matching for the Fake News Detection System
+An Aho-Corasick automaton finds every lexicon phrase in one pass over the
+text, so the cost grows with text length rather than lexicon size
+"""
+
+import json
+import threading
+from collections import deque
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+from config import LEXICON_CONFIG
+
+LEXICON_CATEGORIES = ('refutes', 'supports', 'fake_indicators')
+
+
+class KeywordMatch(NamedTuple):
+    start: int
+    end: int
+    keyword: str
+    category: str
+
+
+class KeywordMatcher:
+    """
+    Matches lowercase phrases from several named lexicons with plain substring
+    semantics: "fake" matches inside "fakery", overlapping matches are all reported.
+    """
+
+    def __init__(self, lexicons: Dict[str, Iterable[str]]):
+        self.categories = list(lexicons)
+        self.keywords: List[str] = []
+        self._keyword_categories: List[List[str]] = []
+        keyword_ids: Dict[str, int] = {}
+        for category, phrases in lexicons.items():
+            for phrase in phrases:
+                phrase = phrase.lower()
+                if not phrase:
+                    continue
+                if phrase not in keyword_ids:
+                    keyword_ids[phrase] = len(self.keywords)
+                    self.keywords.append(phrase)
+                    self._keyword_categories.append([])
+                categories = self._keyword_categories[keyword_ids[phrase]]
+                if category not in categories:
+                    categories.append(category)
+        self._build()
+
+    def _build(self) -> None:
+        # Trie of goto transitions, one dict per state
+        self._goto: List[Dict[str, int]] = [{}]
+        outputs: List[List[int]] = [[]]
+        for keyword_id, keyword in enumerate(self.keywords):
+            state = 0
+            for ch in keyword:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][ch] = nxt
+                    self._goto.append({})
+                    outputs.append([])
+                state = nxt
+            outputs[state].append(keyword_id)
+
+        # Failure links in breadth-first order; each state inherits its fail state's outputs
+        self._fail = [0] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                outputs[nxt].extend(outputs[self._fail[nxt]])
+        self._outputs = [tuple(out) for out in outputs]
+
+    def __len__(self):
+        return len(self.keywords)
+
+    def _scan(self, text: str):
+        """Yield (end, keyword_id) for every occurrence in lowercased text"""
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        state = 0
+        for i, ch in enumerate(text.lower()):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for keyword_id in outputs[state]:
+                yield i + 1, keyword_id
+
+    def find_all(self, text: str) -> List[KeywordMatch]:
+        """Every match with its position, in order of end position"""
+        matches = []
+        for end, keyword_id in self._scan(text):
+            keyword = self.keywords[keyword_id]
+            for category in self._keyword_categories[keyword_id]:
+                matches.append(KeywordMatch(end - len(keyword), end, keyword, category))
+        return matches
+
+    def counts(self, text: str) -> Dict[str, int]:
+        """Number of matches per category (every category present, zero if unmatched)"""
+        counts = dict.fromkeys(self.categories, 0)
+        for _, keyword_id in self._scan(text):
+            for category in self._keyword_categories[keyword_id]:
+                counts[category] += 1
+        return counts
+
+
+def load_lexicons(path: Optional[str] = None) -> Dict[str, List[str]]:
+    """Built-in lexicons from LEXICON_CONFIG, extended by a JSON file of {category: [phrases]}"""
+    lexicons = {category: list(LEXICON_CONFIG[category]) for category in LEXICON_CATEGORIES}
+    path = path or LEXICON_CONFIG.get('extra_lexicons_path')
+    if path:
+        with open(path, encoding='utf-8') as fh:
+            for category, phrases in json.load(fh).items():
+                lexicons.setdefault(category, []).extend(phrases)
+    return lexicons
+
+
+_matchers: Dict[tuple, KeywordMatcher] = {}
+_matchers_lock = threading.Lock()
+
+
+def get_matcher(*categories: str) -> KeywordMatcher:
+    """Shared matcher over the given lexicon categories, built once per process"""
+    matcher = _matchers.get(categories)
+    if matcher is None:
+        with _matchers_lock:
+            matcher = _matchers.get(categories)
+            if matcher is None:
+                lexicons = load_lexicons()
+                matcher = KeywordMatcher({category: lexicons[category] for category in categories})
+                _matchers[categories] = matcher
+    return matcher
@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+Concurrent load generator for the Fake News Detection System
+Drives /predict, /predict with AI and /verify against a running server (--url)
+or in-process through Flask's test client with stubbed AI/search backends
+(--in-process), and reports throughput, latency percentiles and error rates.
+
+Usage:
+  python load_test.py --in-process --concurrency 8 --rate 50 --duration 10
+  python load_test.py --url http://localhost:5000 --mix predict=1 --requests 500
+  python load_test.py --in-process --requests 200 --record run.jsonl
+  python load_test.py --in-process --replay run.jsonl --speed 2
+"""
+
+import argparse
+import contextlib
+import itertools
+import json
+import os
+import random
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, NamedTuple, Optional
+
+import numpy as np
+
+DATASET_PATH = 'expanded_dataset.csv'
+DEFAULT_MIX = 'predict=6,predict_ai=3,verify=1'
+
+
+class LoadRequest(NamedTuple):
+    name: str
+    method: str
+    path: str
+    body: Optional[Dict] = None
+    offset: Optional[float] = None  # seconds after the run started, for replays
+
+
+def scenario_request(name: str, text: str) -> LoadRequest:
+    """The request a scenario sends for one article"""
+    if name == 'predict':
+        return LoadRequest(name, 'POST', '/predict', {'text': text, 'use_ai': False})
+    if name == 'predict_ai':
+        return LoadRequest(name, 'POST', '/predict', {'text': text, 'use_ai': True})
+    if name == 'verify':
+        return LoadRequest(name, 'POST', '/verify', {'text': text})
+    raise ValueError(f"Unknown scenario: {name} (choose from predict, predict_ai, verify)")
+
+
+def parse_mix(mix: str) -> Dict[str, float]:
+    """'predict=6,verify=1' -> {'predict': 6.0, 'verify': 1.0}"""
+    weights = {}
+    for part in mix.split(','):
+        name, _, weight = part.partition('=')
+        scenario_request(name.strip(), '')  # validates the name
+        weights[name.strip()] = float(weight or 1)
+    return weights
+
+
+def load_texts(path: str = DATASET_PATH) -> List[str]:
+    """Articles to send: the bundled dataset, or the detector's built-in samples"""
+    import pandas as pd
+    if os.path.exists(path):
+        return list(pd.read_csv(path)['text'].dropna())
+    from detector import FakeNewsDetector
+    return list(FakeNewsDetector().create_sample_dataset()['text'])
+
+
+def generate_requests(texts: List[str], mix: Dict[str, float], seed: int = 0,
+                      unique: bool = False) -> Iterator[LoadRequest]:
+    """
+    Endless stream of requests drawn from the weighted mix. unique=True makes
+    every article distinct so prediction/AI/search caches never hit.
+    """
+    rng = random.Random(seed)
+    names, weights = list(mix), list(mix.values())
+    for i in itertools.count():
+        text = rng.choice(texts)
+        if unique:
+            text = f"{text} (ref {i})"
+        yield scenario_request(rng.choices(names, weights)[0], text)
+
+
+def read_log(path: str) -> List[LoadRequest]:
+    """Requests recorded with --record: one JSON object per line (name, method, path, body, offset)"""
+    entries = []
+    with open(path, encoding='utf-8') as fh:
+        for line in fh:
+            if line.strip():
+                entry = json.loads(line)
+                entries.append(LoadRequest(
+                    entry.get('name') or entry['path'], entry.get('method', 'POST'), entry['path'],
+                    entry.get('body'), entry.get('offset')
+                ))
+    return entries
+
+
+def write_log(path: str, requests_sent: List[LoadRequest]) -> None:
+    with open(path, 'w', encoding='utf-8') as fh:
+        for req in requests_sent:
+            fh.write(json.dumps(req._asdict()) + '\n')
+
+
+class HTTPTransport:
+    """Sends requests to a running server, one keep-alive session per worker thread"""
+
+    def __init__(self, base_url: str, timeout: float = 30.0):
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def send(self, req: LoadRequest) -> int:
+        import requests
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._local.session = requests.Session()
+        response = session.request(req.method, self.base_url + req.path, json=req.body, timeout=self.timeout)
+        response.content  # read the whole body, as a client would
+        return response.status_code
+
+
+class InProcessTransport:
+    """Calls the Flask app directly through a test client per worker thread"""
+
+    def __init__(self, flask_app):
+        self.app = flask_app
+        self._local = threading.local()
+
+    def send(self, req: LoadRequest) -> int:
+        client = getattr(self._local, 'client', None)
+        if client is None:
+            client = self._local.client = self.app.test_client()
+        response = client.open(req.path, method=req.method, json=req.body)
+        response.get_data()
+        return response.status_code
+
+
+@contextlib.contextmanager
+def stub_backends(app_module, ai_latency: float = 0.0, search_latency: float = 0.0):
+    """
+    Point the app's AI analyzer at a local FakeOpenAIServer and its web verifier
+    at canned search results, restoring the real ones afterwards
+    """
+    from ai_analyzer import AIAnalyzer, HybridAnalyzer
+    from fake_openai import FakeOpenAIServer
+    from fake_search import StaticSearchBackend
+    from web_verifier import WebVerifier
+
+    # Create the lazily initialized real components first, so they are what gets restored
+    saved = (app_module.get_ai_analyzer(), app_module.get_hybrid_analyzer(), app_module.get_web_verifier())
+    with FakeOpenAIServer(latency=ai_latency) as server:
+        analyzer = AIAnalyzer(api_key='load-test', base_url=server.base_url, cache_path='')
+        app_module.ai_analyzer = analyzer
+        app_module.hybrid_analyzer = HybridAnalyzer(app_module.get_detector(), analyzer)
+        app_module.web_verifier = WebVerifier(search_backend=StaticSearchBackend(latency=search_latency),
+                                              cache_path='')
+        try:
+            yield server
+        finally:
+            app_module.ai_analyzer, app_module.hybrid_analyzer, app_module.web_verifier = saved
+            analyzer.close()
+
+
+def percentile_ms(latencies: List[float], q: float) -> Optional[float]:
+    return round(float(np.percentile(latencies, q)) * 1000, 2) if latencies else None
+
+
+def summarize(name: str, samples: List[tuple], wall_s: float) -> Dict:
+    """Throughput, latency percentiles and errors for (latency_s, status, error) samples"""
+    latencies = [latency for latency, _, _ in samples]
+    errors = [status for _, status, error in samples if error]
+    return {
+        'scenario': name,
+        'requests': len(samples),
+        'errors': len(errors),
+        'error_rate': round(len(errors) / len(samples), 4) if samples else 0.0,
+        'throughput_rps': round(len(samples) / wall_s, 1) if wall_s else None,
+        'p50_ms': percentile_ms(latencies, 50),
+        'p95_ms': percentile_ms(latencies, 95),
+        'p99_ms': percentile_ms(latencies, 99),
+        'max_ms': round(max(latencies) * 1000, 2) if latencies else None,
+        'status_codes': dict(sorted(Counter(str(status) for _, status, _ in samples).items())),
+    }
+
+
+def run_load(transport, requests_iter, concurrency: int = 8, rate: Optional[float] = None,
+             duration: Optional[float] = None, total: Optional[int] = None,
+             speed: float = 1.0, record: Optional[List[LoadRequest]] = None) -> List[Dict]:
+    """
+    Send requests from requests_iter with `concurrency` workers until `total`
+    requests, `duration` seconds or the iterator runs out. With `rate`
+    (requests/s), or recorded offsets scaled by `speed`, requests are sent on a
+    fixed schedule and latency is measured from the scheduled time, so queueing
+    behind a slow server counts (no coordinated omission). Otherwise each worker
+    sends its next request as soon as the last one returns.
+    Returns one summary per scenario, then the overall summary.
+    """
+    lock = threading.Lock()
+    sequence = itertools.count()
+    samples: Dict[str, List[tuple]] = {}
+    start = time.perf_counter()
+    end = start + duration if duration else None
+
+    def next_request():
+        with lock:
+            i = next(sequence)
+            if total is not None and i >= total:
+                return None
+            req = next(requests_iter, None)
+        if req is None:
+            return None
+        if rate:
+            scheduled = start + i / rate
+        elif req.offset is not None:
+            scheduled = start + req.offset / speed
+        else:
+            scheduled = None
+        return req, scheduled
+
+    def worker():
+        while True:
+            item = next_request()
+            if item is None:
+                return
+            req, scheduled = item
+            now = time.perf_counter()
+            if end is not None and (scheduled or now) >= end:
+                return
+            if scheduled is not None and scheduled > now:
+                time.sleep(scheduled - now)
+            sent = scheduled if scheduled is not None else time.perf_counter()
+            try:
+                status = transport.send(req)
+                error = status >= 400
+            except Exception:
+                status, error = None, True
+            latency = time.perf_counter() - sent
+            with lock:
+                samples.setdefault(req.name, []).append((latency, status, error))
+                if record is not None:
+                    record.append(req._replace(offset=round(sent - start, 6)))
+
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='load') as executor:
+        for future in [executor.submit(worker) for _ in range(concurrency)]:
+            future.result()
+    wall_s = time.perf_counter() - start
+
+    summaries = [summarize(name, rows, wall_s) for name, rows in sorted(samples.items())]
+    summaries.append(summarize('all', [row for rows in samples.values() for row in rows], wall_s))
+    return summaries
+
+
+def print_report(summaries: List[Dict]) -> None:
+    columns = ['scenario', 'requests', 'throughput_rps', 'p50_ms', 'p95_ms', 'p99_ms', 'max_ms', 'error_rate']
+    print(' | '.join(columns))
+    for row in summaries:
+        print(' | '.join(str(row[c]) for c in columns))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument('--url', help='Base URL of a running server, e.g. http://localhost:5000')
+    target.add_argument('--in-process', action='store_true',
+                        help="Use Flask's test client with stubbed AI and search backends")
+    parser.add_argument('--mix', default=DEFAULT_MIX, help=f'Scenario weights (default {DEFAULT_MIX})')
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--rate', type=float, default=None, help='Requests per second (default: as fast as possible)')
+    parser.add_argument('--duration', type=float, default=None, help='Stop after this many seconds')
+    parser.add_argument('--requests', type=int, default=None, help='Stop after this many requests')
+    parser.add_argument('--unique', action='store_true', help='Make every article distinct to bypass caches')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--replay', metavar='LOG', help='Send the requests recorded in LOG instead of the mix')
+    parser.add_argument('--speed', type=float, default=1.0, help='Replay speed-up for recorded timings')
+    parser.add_argument('--record', metavar='LOG', help='Write the requests sent (with timings) to LOG')
+    parser.add_argument('--ai-latency', type=float, default=0.2, help='Stub AI response time in seconds (in-process)')
+    parser.add_argument('--search-latency', type=float, default=0.3, help='Stub search time in seconds (in-process)')
+    parser.add_argument('--json', action='store_true', help='Print the summaries as JSON lines')
+    args = parser.parse_args()
+
+    if args.replay:
+        requests_iter = iter(read_log(args.replay))
+    else:
+        if args.duration is None and args.requests is None:
+            args.requests = 200
+        requests_iter = generate_requests(load_texts(), parse_mix(args.mix), args.seed, args.unique)
+
+    record = [] if args.record else None
+    run = dict(concurrency=args.concurrency, rate=args.rate, duration=args.duration,
+               total=args.requests, speed=args.speed, record=record)
+    if args.in_process:
+        import app as app_module
+        with stub_backends(app_module, args.ai_latency, args.search_latency):
+            # Train or load the model before the clock starts
+            app_module.get_detector()
+            summaries = run_load(InProcessTransport(app_module.app), requests_iter, **run)
+    else:
+        summaries = run_load(HTTPTransport(args.url), requests_iter, **run)
+
+    if args.json:
+        for row in summaries:
+            print(json.dumps(row))
+    else:
+        print_report(summaries)
+    if record is not None:
+        write_log(args.record, record)
+        print(f"\n📄 Recorded {len(record)} requests to {args.record}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Lightweight metrics for the Fake News Detection System
+Counters and histograms rendered in the Prometheus text format at /metrics,
+and per-stage timers that also fill an opt-in per-request `timings` block
+"""
+
+import bisect
+import contextvars
+import math
+import threading
+import time
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+
+from config import METRICS_CONFIG
+
+
+def _escape(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence, extra: str = '') -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return '{' + ','.join(parts) + '}' if parts else ''
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return '+Inf' if value > 0 else '-Inf'
+    return repr(float(value))
+
+
+class Counter:
+    """Monotonic counter, one series per combination of label values"""
+
+    kind = 'counter'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        key = tuple(labels[name] for name in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(tuple(labels[name] for name in self.labelnames), 0.0)
+
+    def render(self) -> Iterable[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        for key, value in values:
+            yield f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+
+
+class Histogram:
+    """Cumulative-bucket histogram of observed values (seconds, for the timers here)"""
+
+    kind = 'histogram'
+
+    def __init__(self, name: str, documentation: str, buckets: Sequence[float], labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # label values -> [per-bucket counts (last is +Inf), sum]
+        self._series: Dict[Tuple, list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels) -> None:
+        key = tuple(labels[name] for name in self.labelnames)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][index] += 1
+            series[1] += value
+
+    def count(self, **labels) -> int:
+        series = self._series.get(tuple(labels[name] for name in self.labelnames))
+        return sum(series[0]) if series else 0
+
+    def render(self) -> Iterable[str]:
+        with self._lock:
+            snapshot = sorted((key, list(counts), total) for key, (counts, total) in self._series.items())
+        for key, counts, total in snapshot:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), counts):
+                cumulative += count
+                le = _format_labels(self.labelnames, key, f'le="{_format_value(bound)}"')
+                yield f"{self.name}_bucket{le} {cumulative}"
+            labels = _format_labels(self.labelnames, key)
+            yield f"{self.name}_sum{labels} {_format_value(total)}"
+            yield f"{self.name}_count{labels} {cumulative}"
+
+
+class Registry:
+    """Named metrics, rendered together for a scrape"""
+
+    def __init__(self):
+        self._metrics: Dict[str, object] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric):
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric) or existing.labelnames != metric.labelnames:
+                    raise ValueError(f"Metric {metric.name} is already registered with a different type or labels")
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, buckets: Sequence[float],
+                  labelnames: Sequence[str] = ()) -> Histogram:
+        return self._register(Histogram(name, documentation, buckets, labelnames))
+
+    def render(self) -> str:
+        """Prometheus text exposition format, version 0.0.4"""
+        lines = []
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda m: m.name)
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+REGISTRY = Registry()
+HTTP_REQUESTS = REGISTRY.counter(
+    'fnd_http_requests_total', 'HTTP requests by endpoint and status code', ('endpoint', 'status'))
+HTTP_SECONDS = REGISTRY.histogram(
+    'fnd_http_request_seconds', 'HTTP request latency by endpoint', METRICS_CONFIG['request_buckets'], ('endpoint',))
+STAGE_SECONDS = REGISTRY.histogram(
+    'fnd_stage_seconds', 'Time spent in each pipeline stage', METRICS_CONFIG['stage_buckets'], ('stage',))
+CACHE_LOOKUPS = REGISTRY.counter(
+    'fnd_cache_lookups_total', 'Cache lookups by cache and result (hit or miss)', ('cache', 'result'))
+AI_FAILURES = REGISTRY.counter(
+    'fnd_ai_failures_total', 'AI analyses that produced no result, by reason', ('reason',))
+HYBRID_FALLBACKS = REGISTRY.counter(
+    'fnd_hybrid_fallbacks_total', 'Hybrid analyses answered by the ML model alone, by reason', ('reason',))
+
+# Stage -> seconds for the current request, when it asked for a timings block
+_request_timings: contextvars.ContextVar[Optional[Dict[str, float]]] = contextvars.ContextVar(
+    'request_timings', default=None)
+
+
+class stage:
+    """
+    Time a block into fnd_stage_seconds{stage=name} (and the request's timings
+    block, if one is being collected):  with stage('vectorize'): ...
+    """
+
+    __slots__ = ('name', 'start')
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        if not METRICS_CONFIG['enabled']:
+            return False
+        elapsed = time.perf_counter() - self.start
+        STAGE_SECONDS.observe(elapsed, stage=self.name)
+        timings = _request_timings.get()
+        if timings is not None:
+            timings[self.name] = timings.get(self.name, 0.0) + elapsed
+        return False
+
+
+def record_cache(cache: str, hit: bool) -> None:
+    if METRICS_CONFIG['enabled']:
+        CACHE_LOOKUPS.inc(cache=cache, result='hit' if hit else 'miss')
+
+
+def start_timings() -> None:
+    """Collect stage timings for the rest of this request (context)"""
+    _request_timings.set({})
+
+
+def stop_timings() -> Optional[Dict[str, float]]:
+    """Stop collecting; returns stage -> milliseconds, or None if nothing was being collected"""
+    timings = _request_timings.get()
+    _request_timings.set(None)
+    if timings is None:
+        return None
+    return {name: round(seconds * 1000, 3) for name, seconds in timings.items()}
+
+
+def observe_request(endpoint: str, status: int, seconds: float) -> None:
+    if METRICS_CONFIG['enabled']:
+        HTTP_REQUESTS.inc(endpoint=endpoint, status=str(status))
+        HTTP_SECONDS.observe(seconds, endpoint=endpoint)
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+On-disk model artifacts for the Fake News Detection System
+Saves fitted components with joblib and loads them memory-mapped
+"""
+
+import json
+import os
+import platform
+import shutil
+import tempfile
+from datetime import datetime, timezone
+from typing import Dict, Tuple
+
+import joblib
+import numpy as np
+import sklearn
+
+# Bump when the artifact layout changes in a backwards-incompatible way
+ARTIFACT_VERSION = 2
+
+COMPONENTS_FILE = 'components.joblib'
+METADATA_FILE = 'metadata.json'
+
+
+def _atomic_write(path: str, write) -> None:
+    """Write through a temp file in the same directory, then rename over path"""
+    directory = os.path.dirname(path) or '.'
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.tmp-')
+    os.close(fd)
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def save_artifact(path: str, components: Dict, metadata: Dict) -> Dict:
+    """
+    Save fitted components (vectorizer, classifier, ...) plus metadata to a directory.
+    Arrays are stored uncompressed so they can be memory-mapped on load.
+    """
+    os.makedirs(path, exist_ok=True)
+    metadata = dict(metadata)
+    metadata.update({
+        'artifact_version': ARTIFACT_VERSION,
+        'created_at': datetime.now(timezone.utc).isoformat(),
+        'sklearn_version': sklearn.__version__,
+        'numpy_version': np.__version__,
+        'python_version': platform.python_version(),
+        'components': sorted(components),
+    })
+
+    _atomic_write(os.path.join(path, COMPONENTS_FILE), lambda tmp: joblib.dump(components, tmp))
+
+    def write_metadata(tmp):
+        with open(tmp, 'w', encoding='utf-8') as fh:
+            json.dump(metadata, fh, indent=2)
+
+    # Metadata goes last so a readable metadata file implies complete components
+    _atomic_write(os.path.join(path, METADATA_FILE), write_metadata)
+    return metadata
+
+
+def publish_artifact(staging: str, path: str) -> None:
+    """
+    Move an artifact saved at `staging` into `path` (a sibling on the same
+    filesystem), replacing the files there one rename at a time
+    """
+    os.makedirs(path, exist_ok=True)
+    # Metadata goes last, as in save_artifact
+    for name in (COMPONENTS_FILE, METADATA_FILE):
+        os.replace(os.path.join(staging, name), os.path.join(path, name))
+    shutil.rmtree(staging, ignore_errors=True)
+
+
+def read_metadata(path: str) -> Dict:
+    """Read an artifact's metadata without loading the model"""
+    with open(os.path.join(path, METADATA_FILE), encoding='utf-8') as fh:
+        return json.load(fh)
+
+
+def load_artifact(path: str, mmap: bool = True) -> Tuple[Dict, Dict]:
+    """
+    Load components and metadata saved by save_artifact.
+    With mmap=True large numpy arrays are memory-mapped read-only instead of copied.
+    """
+    metadata = read_metadata(path)
+    if metadata.get('artifact_version') != ARTIFACT_VERSION:
+        raise ValueError(
+            f"Unsupported model artifact version {metadata.get('artifact_version')} "
+            f"(expected {ARTIFACT_VERSION})"
+        )
+
+    saved_sklearn = metadata.get('sklearn_version', '')
+    if saved_sklearn.split('.')[:2] != sklearn.__version__.split('.')[:2]:
+        raise ValueError(
+            f"Model artifact was saved with scikit-learn {saved_sklearn}, "
+            f"but {sklearn.__version__} is installed. Please retrain the model."
+        )
+
+    components = joblib.load(os.path.join(path, COMPONENTS_FILE), mmap_mode='r' if mmap else None)
+    return components, metadata
+
+
+def artifact_exists(path: str) -> bool:
+    return os.path.exists(os.path.join(path, METADATA_FILE)) and \
+        os.path.exists(os.path.join(path, COMPONENTS_FILE))
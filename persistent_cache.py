@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Persistent SQLite-backed cache for the Fake News Detection System
+Safe to share between threads and worker processes (WAL mode + busy timeout)
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Optional
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    namespace   TEXT NOT NULL,
+    key         TEXT NOT NULL,
+    value       TEXT NOT NULL,
+    created_at  REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    PRIMARY KEY (namespace, key)
+);
+CREATE INDEX IF NOT EXISTS entries_accessed ON entries (namespace, accessed_at);
+CREATE INDEX IF NOT EXISTS entries_created ON entries (namespace, created_at);
+CREATE TABLE IF NOT EXISTS stats (
+    namespace TEXT PRIMARY KEY,
+    hits      INTEGER NOT NULL DEFAULT 0,
+    misses    INTEGER NOT NULL DEFAULT 0,
+    evictions INTEGER NOT NULL DEFAULT 0,
+    expired   INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+
+class SQLiteCache:
+    """
+    JSON values in a SQLite file, with TTL expiry and least-recently-used
+    eviction once `max_entries` is exceeded. Hit/miss counters live in the
+    database, so stats cover every process sharing the file.
+
+    Lookups are plain reads: hit/miss counts and access times are buffered and
+    written in one go by the next put, every `flush_every` lookups or after
+    `flush_interval` seconds. Expired rows are never returned but are only
+    deleted every `sweep_interval` seconds, and eviction runs once the row
+    count passes max_entries by `evict_slack` (a fraction of max_entries).
+    """
+
+    def __init__(self, path: str, namespace: str = 'default', ttl: Optional[float] = None,
+                 max_entries: Optional[int] = None, busy_timeout: float = 5.0, flush_every: int = 64,
+                 flush_interval: float = 1.0, sweep_interval: float = 60.0, evict_slack: float = 0.01):
+        self.path = path
+        self.namespace = namespace
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.busy_timeout = busy_timeout
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self.sweep_interval = sweep_interval
+        self.evict_slack = int(max_entries * evict_slack) if max_entries is not None else 0
+        self._local = threading.local()
+        # Buffered by get(), written by _flush()
+        self._pending_lock = threading.Lock()
+        self._pending_hits = 0
+        self._pending_misses = 0
+        self._pending_touches: Dict[str, float] = {}
+        self._pending_expired = set()
+        self._last_flush = time.monotonic()
+        # Rows in the namespace as of the last maintenance, plus puts since (an overestimate)
+        self._estimated_size = None
+        self._next_sweep = 0.0
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = self._connection()
+        conn.executescript(SCHEMA)
+        conn.execute("INSERT OR IGNORE INTO stats (namespace) VALUES (?)", (namespace,))
+
+    def _connection(self) -> sqlite3.Connection:
+        # sqlite3 connections must not be shared between threads
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.busy_timeout, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _transaction(self):
+        """Write transaction; BEGIN IMMEDIATE takes the write lock up front to avoid upgrade deadlocks"""
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def _count(self, conn, column: str, amount: int = 1) -> None:
+        conn.execute(f"UPDATE stats SET {column} = {column} + ? WHERE namespace = ?", (amount, self.namespace))
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired"""
+        now = time.time()
+        row = self._connection().execute(
+            "SELECT value, created_at FROM entries WHERE namespace = ? AND key = ?",
+            (self.namespace, key)
+        ).fetchone()
+        expired = row is not None and self.ttl is not None and now - row[1] > self.ttl
+        with self._pending_lock:
+            if row is None or expired:
+                self._pending_misses += 1
+                if expired:
+                    self._pending_expired.add(key)
+            else:
+                self._pending_hits += 1
+                self._pending_touches[key] = now
+            due = (self._pending_hits + self._pending_misses >= self.flush_every
+                   or time.monotonic() - self._last_flush >= self.flush_interval)
+        if due:
+            self.flush()
+        return None if row is None or expired else json.loads(row[0])
+
+    def _flush(self, conn) -> None:
+        """Write buffered lookups inside the caller's transaction"""
+        with self._pending_lock:
+            hits, misses = self._pending_hits, self._pending_misses
+            touches, expired = self._pending_touches, self._pending_expired
+            self._pending_hits = self._pending_misses = 0
+            self._pending_touches, self._pending_expired = {}, set()
+            self._last_flush = time.monotonic()
+        if hits or misses:
+            conn.execute("UPDATE stats SET hits = hits + ?, misses = misses + ? WHERE namespace = ?",
+                         (hits, misses, self.namespace))
+        if touches:
+            conn.executemany(
+                "UPDATE entries SET accessed_at = MAX(accessed_at, ?) WHERE namespace = ? AND key = ?",
+                [(at, self.namespace, key) for key, at in touches.items()]
+            )
+        if expired:
+            cutoff = time.time() - self.ttl
+            removed = sum(conn.execute(
+                "DELETE FROM entries WHERE namespace = ? AND key = ? AND created_at < ?",
+                (self.namespace, key, cutoff)
+            ).rowcount for key in expired)
+            if removed:
+                self._count(conn, 'expired', removed)
+
+    def flush(self) -> None:
+        """Write buffered hit/miss counts and access times now"""
+        with self._pending_lock:
+            if not (self._pending_hits or self._pending_misses or self._pending_touches or self._pending_expired):
+                return
+        with self._transaction() as conn:
+            self._flush(conn)
+
+    def _maintain(self, conn, now: float) -> None:
+        """Delete expired rows and evict least recently used ones beyond max_entries"""
+        if self.ttl is not None:
+            expired = conn.execute(
+                "DELETE FROM entries WHERE namespace = ? AND created_at < ?",
+                (self.namespace, now - self.ttl)
+            ).rowcount
+            if expired:
+                self._count(conn, 'expired', expired)
+        size = self._size(conn)
+        if self.max_entries is not None and size > self.max_entries:
+            evicted = conn.execute(
+                """DELETE FROM entries WHERE namespace = ? AND key IN (
+                       SELECT key FROM entries WHERE namespace = ?
+                       ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)""",
+                (self.namespace, self.namespace, self.max_entries)
+            ).rowcount
+            if evicted:
+                self._count(conn, 'evictions', evicted)
+            size -= evicted
+        self._estimated_size = size
+        self._next_sweep = time.monotonic() + self.sweep_interval
+
+    def put(self, key: str, value: Any) -> None:
+        now = time.time()
+        with self._transaction() as conn:
+            self._flush(conn)
+            conn.execute(
+                "INSERT OR REPLACE INTO entries (namespace, key, value, created_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                (self.namespace, key, json.dumps(value), now, now)
+            )
+            if self._estimated_size is None:
+                self._estimated_size = self._size(conn)
+            else:
+                self._estimated_size += 1
+            over_cap = (self.max_entries is not None
+                        and self._estimated_size > self.max_entries + self.evict_slack)
+            if over_cap or (self.ttl is not None and time.monotonic() >= self._next_sweep):
+                self._maintain(conn, now)
+
+    def clear(self) -> None:
+        with self._transaction() as conn:
+            self._flush(conn)
+            conn.execute("DELETE FROM entries WHERE namespace = ?", (self.namespace,))
+            self._estimated_size = 0
+
+    def _size(self, conn) -> int:
+        return conn.execute("SELECT COUNT(*) FROM entries WHERE namespace = ?", (self.namespace,)).fetchone()[0]
+
+    def __len__(self):
+        return self._size(self._connection())
+
+    def stats(self) -> Dict:
+        self.flush()
+        hits, misses, evictions, expired = self._connection().execute(
+            "SELECT hits, misses, evictions, expired FROM stats WHERE namespace = ?", (self.namespace,)
+        ).fetchone()
+        lookups = hits + misses
+        return {
+            'path': self.path,
+            'size': len(self),
+            'max_size': self.max_entries,
+            'ttl': self.ttl,
+            'hits': hits,
+            'misses': misses,
+            'evictions': evictions,
+            'expired': expired,
+            'hit_rate': round(hits / lookups, 4) if lookups else 0.0
+        }
+
+    def close(self) -> None:
+        self.flush()
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
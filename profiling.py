@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+On-demand request profiling for the Fake News Detection System
+With PROFILING_CONFIG['admin_token'] set, a request carrying ?profile=cprofile
+or ?profile=sample and a matching X-Admin-Token header runs under that profiler.
+The profile is stored (pstats .prof or collapsed-stack .folded for flame graphs)
+and summarized in the response. Without a token nothing is wrapped at all.
+"""
+
+import cProfile
+import functools
+import hmac
+import io
+import os
+import pstats
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from typing import Callable, Dict, List, Optional, Tuple
+
+from config import PROFILING_CONFIG
+
+MODES = ('cprofile', 'sample')
+TOKEN_HEADER = 'X-Admin-Token'
+
+
+class SamplingProfiler:
+    """
+    Samples one thread's Python stack every `interval` seconds from a
+    background thread and counts collapsed stacks ("outer;...;inner").
+    Cheaper than cProfile on long calls and unbiased by call counts.
+    """
+
+    def __init__(self, interval: float = 0.001, thread_id: Optional[int] = None):
+        self.interval = interval
+        self.thread_id = thread_id
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    @staticmethod
+    def _frame_label(frame) -> str:
+        code = frame.f_code
+        return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None:
+                stack.append(self._frame_label(frame))
+                frame = frame.f_back
+            self.stacks[';'.join(reversed(stack))] += 1
+            self.samples += 1
+
+    def start(self) -> 'SamplingProfiler':
+        if self.thread_id is None:
+            self.thread_id = threading.get_ident()
+        self._thread = threading.Thread(target=self._run, name='sampling-profiler', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def collapsed(self) -> str:
+        """Brendan Gregg's folded format: one "stack count" line, readable by flamegraph.pl and speedscope"""
+        return ''.join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+    def top(self, limit: int) -> List[Dict]:
+        """Functions by samples spent in them (self), with the share of stacks they appear in (inclusive)"""
+        own: Counter = Counter()
+        inclusive: Counter = Counter()
+        for stack, count in self.stacks.items():
+            frames = stack.split(';')
+            own[frames[-1]] += count
+            for label in set(frames):
+                inclusive[label] += count
+        total = max(1, self.samples)
+        return [{'function': label, 'self_samples': count, 'self_percent': round(100.0 * count / total, 1),
+                 'inclusive_percent': round(100.0 * inclusive[label] / total, 1)}
+                for label, count in own.most_common(limit)]
+
+
+def _cprofile_top(profiler: cProfile.Profile, limit: int) -> List[Dict]:
+    stats = pstats.Stats(profiler, stream=io.StringIO())
+    rows = []
+    for (filename, line, name), (_, calls, own, cumulative, _) in stats.stats.items():
+        rows.append({
+            'function': f"{name} ({os.path.basename(filename)}:{line})",
+            'calls': calls,
+            'own_ms': round(own * 1000, 3),
+            'cumulative_ms': round(cumulative * 1000, 3),
+        })
+    rows.sort(key=lambda row: row['cumulative_ms'], reverse=True)
+    return rows[:limit]
+
+
+def _prune(directory: str, keep: int) -> None:
+    """Delete the oldest stored profiles beyond `keep`"""
+    files = [os.path.join(directory, name) for name in os.listdir(directory) if name.endswith(('.prof', '.folded'))]
+    files.sort(key=os.path.getmtime)
+    for path in files[:max(0, len(files) - keep)]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def profile_call(mode: str, label: str, fn: Callable, *args, **kwargs) -> Tuple[object, Dict]:
+    """Run fn under the given profiler; returns (fn's result, profile summary) and stores the profile"""
+    profile_id = f"{label}-{time.strftime('%Y%m%d%H%M%S')}-{uuid.uuid4().hex[:6]}"
+    directory = PROFILING_CONFIG['output_dir']
+    os.makedirs(directory, exist_ok=True)
+    limit = PROFILING_CONFIG['top']
+
+    start = time.perf_counter()
+    if mode == 'cprofile':
+        profiler = cProfile.Profile()
+        try:
+            result = profiler.runcall(fn, *args, **kwargs)
+        finally:
+            wall = time.perf_counter() - start
+            path = os.path.join(directory, profile_id + '.prof')
+            profiler.dump_stats(path)
+        summary = {'top': _cprofile_top(profiler, limit)}
+    elif mode == 'sample':
+        sampler = SamplingProfiler(PROFILING_CONFIG['sample_interval']).start()
+        try:
+            result = fn(*args, **kwargs)
+        finally:
+            sampler.stop()
+            wall = time.perf_counter() - start
+            path = os.path.join(directory, profile_id + '.folded')
+            with open(path, 'w', encoding='utf-8') as fh:
+                fh.write(sampler.collapsed())
+        summary = {'samples': sampler.samples, 'top': sampler.top(limit)}
+    else:
+        raise ValueError(f"Unknown profile mode: {mode} (choose from {', '.join(MODES)})")
+
+    _prune(directory, PROFILING_CONFIG['max_stored'])
+    return result, dict({'id': profile_id, 'mode': mode, 'file': path, 'wall_ms': round(wall * 1000, 3)}, **summary)
+
+
+def enabled() -> bool:
+    return bool(PROFILING_CONFIG['admin_token'])
+
+
+def requested_mode(request) -> Tuple[Optional[str], Optional[Tuple[Dict, int]]]:
+    """
+    (mode, None) for an authorized profiling request, (None, None) for a normal
+    one, and (None, (error, status)) for a bad token or mode
+    """
+    mode = request.args.get('profile')
+    if not mode or not enabled():
+        return None, None
+    token = request.headers.get(TOKEN_HEADER, '')
+    if not hmac.compare_digest(token.encode(), PROFILING_CONFIG['admin_token'].encode()):
+        return None, ({"error": "Profiling requires a valid admin token"}, 403)
+    if mode not in MODES:
+        return None, ({"error": f"Unknown profile mode (choose from {', '.join(MODES)})"}, 400)
+    return mode, None
+
+
+def install(app, endpoints) -> bool:
+    """
+    Wrap the given Flask endpoints so authorized ?profile= requests are profiled.
+    Does nothing (and adds no per-request cost) unless an admin token is configured.
+    """
+    if not enabled():
+        return False
+    from flask import jsonify, request
+
+    for endpoint in endpoints:
+        view = app.view_functions[endpoint]
+
+        @functools.wraps(view)
+        def profiled_view(*args, _view=view, _endpoint=endpoint, **kwargs):
+            mode, error = requested_mode(request)
+            if error:
+                return jsonify(error[0]), error[1]
+            if mode is None:
+                return _view(*args, **kwargs)
+            rv, profile = profile_call(mode, _endpoint, _view, *args, **kwargs)
+            response = app.make_response(rv)
+            data = response.get_json(silent=True) if response.is_json else None
+            if isinstance(data, dict):
+                data['profile'] = profile
+                response = app.make_response((jsonify(data), response.status_code))
+            response.headers['X-Profile-Id'] = profile['id']
+            return response
+
+        app.view_functions[endpoint] = profiled_view
+    return True
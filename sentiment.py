@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Fast lexicon sentiment scoring for the Fake News Detection System
+Reproduces TextBlob's default (pattern) polarity/subjectivity for
+preprocessed text without building a TextBlob per document
+"""
+
+import os
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+from xml.etree import ElementTree
+
+import numpy as np
+
+NEGATIONS = ('no', 'not', "n't", 'never')
+MODIFIER_TAG = 'RB'
+
+
+def default_lexicon_path() -> str:
+    """Path of the en-sentiment.xml lexicon bundled with TextBlob"""
+    import textblob.en
+    return os.path.join(os.path.dirname(textblob.en.__file__), 'en-sentiment.xml')
+
+
+def _avg(values):
+    return sum(values) / float(len(values) or 1)
+
+
+def _load_lexicon(path: str) -> Dict[str, Dict]:
+    """
+    Parse the lexicon the same way pattern/TextBlob does: average each word's
+    senses per part-of-speech, then across tags, then derive "-ly" adverbs
+    from adjectives.
+    """
+    words = {}
+    for node in ElementTree.parse(path).getroot().findall('word'):
+        form = node.attrib.get('form')
+        if not form:
+            continue
+        psi = (
+            float(node.attrib.get('polarity', 0.0)),
+            float(node.attrib.get('subjectivity', 0.0)),
+            float(node.attrib.get('intensity', 1.0)),
+        )
+        words.setdefault(form, {}).setdefault(node.attrib.get('pos'), []).append(psi)
+
+    for form, tags in words.items():
+        words[form] = dict((pos, [_avg(each) for each in zip(*psi)]) for pos, psi in tags.items())
+    for form, tags in list(words.items()):
+        tags[None] = [_avg(each) for each in zip(*tags.values())]
+
+    # Map "terrible" to adverb "terribly", as TextBlob's English lexicon does
+    for form, tags in list(words.items()):
+        if 'JJ' in tags:
+            if form.endswith('y'):
+                form = form[:-1] + 'i'
+            if form.endswith('le'):
+                form = form[:-2]
+            entry = words.setdefault(form + 'ly', {})
+            entry[MODIFIER_TAG] = entry[None] = tuple(tags['JJ'])
+    return words
+
+
+class SentimentLexicon:
+    """
+    Lexicon compiled into a word -> id dict and parallel numpy arrays.
+    Scores token lists produced by featurizer.tokenize(); punctuation and
+    emoticon rules are not needed because preprocessing strips them.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        words = _load_lexicon(path or default_lexicon_path())
+        self.index = {word: i for i, word in enumerate(words)}
+        scores = np.array([words[w][None] for w in words], dtype=np.float64).reshape(-1, 3)
+        self.polarity = scores[:, 0].copy()
+        self.subjectivity = scores[:, 1].copy()
+        self.intensity = scores[:, 2].copy()
+        self.is_modifier = np.array([MODIFIER_TAG in words[w] for w in words], dtype=bool)
+        # Negations that are themselves lexicon words
+        self.is_negation = np.array([w in NEGATIONS for w in words], dtype=bool)
+
+    def __len__(self):
+        return len(self.index)
+
+    def token_ids(self, tokens: Sequence[str]) -> np.ndarray:
+        """Lexicon ids for a token list, -1 for unknown words"""
+        get = self.index.get
+        return np.fromiter((get(t, -1) for t in tokens), dtype=np.int64, count=len(tokens))
+
+    def score(self, tokens: Sequence[str]) -> Tuple[float, float]:
+        """(polarity, subjectivity) for one tokenized document"""
+        return self.score_batch([tokens])[0]
+
+    def score_batch(self, token_lists: Sequence[Sequence[str]]) -> List[Tuple[float, float]]:
+        """
+        Score many documents. Documents without modifiers or negations reduce
+        to a plain mean over known words and are scored with array ops; the
+        rest run the sequential negation/intensifier rules over token ids.
+        """
+        n_docs = len(token_lists)
+        lengths = np.fromiter((len(t) for t in token_lists), dtype=np.int64, count=n_docs)
+        ids = self.token_ids([t for tokens in token_lists for t in tokens])
+        doc_of_token = np.repeat(np.arange(n_docs), lengths)
+
+        known = ids >= 0
+        known_ids = ids[known]
+        known_docs = doc_of_token[known]
+
+        # Documents needing the sequential rules: a known modifier or any negation word
+        needs_rules = np.zeros(n_docs, dtype=bool)
+        needs_rules[known_docs[self.is_modifier[known_ids]]] = True
+        negation_tokens = np.fromiter(
+            (t in NEGATIONS for tokens in token_lists for t in tokens), dtype=bool, count=len(ids)
+        )
+        needs_rules[doc_of_token[negation_tokens]] = True
+
+        counts = np.bincount(known_docs, minlength=n_docs)
+        # astype: bincount returns ints when no document has a known word
+        polarity = np.bincount(known_docs, weights=self.polarity[known_ids], minlength=n_docs).astype(np.float64)
+        subjectivity = np.bincount(known_docs, weights=self.subjectivity[known_ids], minlength=n_docs).astype(np.float64)
+        divisor = np.maximum(counts, 1).astype(np.float64)
+        polarity /= divisor
+        subjectivity /= divisor
+
+        offsets = np.concatenate(([0], np.cumsum(lengths)))
+        for doc in np.flatnonzero(needs_rules):
+            start, end = offsets[doc], offsets[doc + 1]
+            polarity[doc], subjectivity[doc] = self._score_sequential(
+                token_lists[doc], ids[start:end]
+            )
+
+        return list(zip(polarity.tolist(), subjectivity.tolist()))
+
+    def _score_sequential(self, tokens: Sequence[str], ids: np.ndarray) -> Tuple[float, float]:
+        """pattern's assessments() rules for untagged words, over precomputed ids"""
+        assessments = []  # [polarity, subjectivity, intensity, negated]
+        modifier = None
+        negation = None
+        for word, word_id in zip(tokens, ids.tolist()):
+            if word_id >= 0:
+                p = self.polarity[word_id]
+                s = self.subjectivity[word_id]
+                i = self.intensity[word_id]
+                if modifier is None:
+                    assessments.append([p, s, i, False])
+                else:
+                    last = assessments[-1]
+                    last[0] = max(-1.0, min(p * last[2], +1.0))
+                    last[1] = max(-1.0, min(s * last[2], +1.0))
+                    last[2] = i
+                if negation is not None:
+                    assessments[-1][2] = 1.0 / assessments[-1][2]
+                    assessments[-1][3] = True
+                modifier = word if self.is_modifier[word_id] else None
+                negation = word if self.is_negation[word_id] else None
+            else:
+                if word in NEGATIONS:
+                    negation = word
+                elif negation and len(word.strip("'")) > 1:
+                    negation = None
+                if negation is not None and modifier is not None and modifier.endswith('ly'):
+                    assessments[-1][3] = True
+                    negation = None
+                elif modifier and len(word) > 2:
+                    modifier = None
+
+        if not assessments:
+            return 0.0, 0.0
+        # "not good" = slightly bad, "not bad" = slightly good
+        polarity = sum(p * -0.5 if negated else p for p, _, _, negated in assessments)
+        subjectivity = sum(s for _, s, _, _ in assessments)
+        return polarity / len(assessments), subjectivity / len(assessments)
+
+
+# Resolved lexicon path (None for TextBlob's) -> loaded lexicon
+_lexicons: Dict[Optional[str], SentimentLexicon] = {}
+_lexicons_lock = threading.Lock()
+
+
+def get_lexicon(path: Optional[str] = None) -> SentimentLexicon:
+    """Shared lexicon for a path (default: TextBlob's), loaded once per process"""
+    key = os.path.realpath(path) if path else None
+    lexicon = _lexicons.get(key)
+    if lexicon is None:
+        with _lexicons_lock:
+            lexicon = _lexicons.get(key)
+            if lexicon is None:
+                lexicon = _lexicons[key] = SentimentLexicon(key)
+    return lexicon
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Chunked dataset reading and out-of-core training for the Fake News Detection System
+Usage: python streaming_train.py <data.csv|.jsonl|.parquet> [--chunksize N] [--epochs N] [--save]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Iterator, List, Optional, Tuple
+
+import pandas as pd
+
+from feedback import parse_label
+
+COLUMNS = ['text', 'label']
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process in MB (None where the platform can't tell)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS, kilobytes elsewhere
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+def iter_chunks(path: str, chunksize: int) -> Iterator[Tuple[pd.DataFrame, float]]:
+    """
+    Yield (chunk, fraction of the file consumed) with text/label columns.
+    CSV and JSON Lines are read with pandas chunked readers; Parquet needs pyarrow.
+    """
+    ext = os.path.splitext(path)[1].lower()
+    if ext == '.parquet':
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("Reading Parquet needs pyarrow: pip install pyarrow")
+        parquet = pq.ParquetFile(path)
+        total = max(1, parquet.metadata.num_rows)
+        seen = 0
+        for batch in parquet.iter_batches(batch_size=chunksize, columns=COLUMNS):
+            chunk = batch.to_pandas()
+            seen += len(chunk)
+            yield chunk, seen / total
+        return
+
+    size = max(1, os.path.getsize(path))
+    with open(path, 'rb') as fh:
+        if ext in ('.jsonl', '.ndjson', '.json'):
+            reader = pd.read_json(fh, lines=True, chunksize=chunksize)
+        elif ext == '.csv':
+            reader = pd.read_csv(fh, usecols=COLUMNS, chunksize=chunksize)
+        else:
+            raise ValueError(f"Unsupported dataset format: {ext} (use .csv, .jsonl or .parquet)")
+        for chunk in reader:
+            # The parser reads ahead in blocks, so this is approximate
+            yield chunk[COLUMNS], min(1.0, fh.tell() / size)
+
+
+def labeled_rows(chunk: pd.DataFrame) -> Tuple[List[str], List[int]]:
+    """Texts and 0/1 labels, dropping rows with missing text or an unrecognized label"""
+    texts, labels = [], []
+    for text, label in zip(chunk['text'], chunk['label']):
+        if isinstance(label, float) and label.is_integer():
+            label = int(label)
+        label = parse_label(label)
+        if isinstance(text, str) and text.strip() and label is not None:
+            texts.append(text)
+            labels.append(label)
+    return texts, labels
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('data_path')
+    parser.add_argument('--chunksize', type=int, default=None)
+    parser.add_argument('--epochs', type=int, default=None)
+    parser.add_argument('--in-memory', action='store_true',
+                        help='Load the whole file and use the regular train() (for comparison)')
+    parser.add_argument('--save', action='store_true', help="Save to MODEL_CONFIG['artifact_path']")
+    parser.add_argument('--json', action='store_true', help='Print the report as one JSON line')
+    args = parser.parse_args()
+
+    from detector import FakeNewsDetector
+    from config import MODEL_CONFIG
+
+    if args.in_memory:
+        detector = FakeNewsDetector()
+        start = time.perf_counter()
+        accuracy = detector.train(args.data_path)
+        elapsed = time.perf_counter() - start
+        rows = sum(len(chunk) for chunk, _ in iter_chunks(args.data_path, 100000))
+        report = {'mode': detector.mode, 'rows': rows, 'seconds': round(elapsed, 3),
+                  'rows_per_s': round(rows / elapsed, 1), 'training_accuracy': accuracy,
+                  'peak_rss_mb': peak_rss_mb()}
+    else:
+        detector = FakeNewsDetector(mode='online')
+        report = detector.train_streaming(args.data_path, chunksize=args.chunksize, epochs=args.epochs)
+
+    if args.save:
+        detector.save(MODEL_CONFIG['artifact_path'])
+    if args.json:
+        print(json.dumps(report))
+    else:
+        for key, value in report.items():
+            print(f"{key}: {value}")
+
+
+if __name__ == "__main__":
+    main()
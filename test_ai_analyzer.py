@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Offline tests for AIAnalyzer against a local fake OpenAI-compatible server
+Runs without an API key: python -m pytest test_ai_analyzer.py
+"""
+
+import asyncio
+import os
+import random
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from ai_analyzer import AIAnalyzer, TokenBucket
+from config import AI_CONFIG
+from fake_openai import FakeOpenAIServer
+
+
+def _echo_article(prompt):
+    """Answer with the article text so tests can check result order"""
+    article = prompt.split("News Article:\n", 1)[1].split("  #", 1)[0]
+    return {"credibility_score": 50, "is_likely_fake": False, "reasoning": article}
+
+
+def test_client_is_reused_across_calls():
+    with FakeOpenAIServer() as server:
+        analyzer = AIAnalyzer(api_key='test-key', base_url=server.base_url, cache_path='')
+        client = analyzer.client
+        for i in range(5):
+            result = analyzer.analyze_news_with_ai(f"Article {i}")
+            assert result['available'] is True
+            assert result['ai_analysis']['credibility_score'] == 25
+        assert analyzer.client is client
+        # Keep-alive: every call went over the same connection
+        assert server.connections == 1
+        analyzer.close()
+
+
+def test_client_is_shared_safely_across_threads():
+    with FakeOpenAIServer(latency=0.02) as server:
+        analyzer = AIAnalyzer(api_key='test-key', base_url=server.base_url, cache_path='')
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(analyzer.analyze_news_with_ai, [f"Article {i}" for i in range(40)]))
+        assert all(r['available'] for r in results)
+        assert server.requests == 40
+        assert server.connections <= 8
+        analyzer.close()
+
+
+def test_batch_results_keep_input_order():
+    rng = random.Random(3)
+    articles = [f"Article number {i}" for i in range(30)]
+    with FakeOpenAIServer(latency=lambda: rng.uniform(0, 0.03), analysis_fn=_echo_article) as server:
+        analyzer = AIAnalyzer(api_key='test-key', base_url=server.base_url, cache_path='')
+        results = analyzer.analyze_multiple_articles(articles)
+
+    assert [r['ai_analysis']['reasoning'] for r in results] == articles
+    assert server.requests == 30
+
+
+def test_batch_retries_rate_limited_requests():
+    base = AI_CONFIG['batch_backoff_base']
+    AI_CONFIG['batch_backoff_base'] = 0.01
+    try:
+        with FakeOpenAIServer(rate_limit_first=4, analysis_fn=_echo_article) as server:
+            analyzer = AIAnalyzer(api_key='test-key', base_url=server.base_url, cache_path='')
+            results = analyzer.analyze_multiple_articles([f"Article {i}" for i in range(6)])
+    finally:
+        AI_CONFIG['batch_backoff_base'] = base
+
+    assert all(r['available'] for r in results)
+    assert server.rate_limited == 4
+    assert server.requests == 10
+
+
+def test_token_bucket_limits_rate():
+    async def take(n):
+        bucket = TokenBucket(rate_per_minute=1200, capacity=1)  # 20 per second, no burst
+        start = time.perf_counter()
+        for _ in range(n):
+            await bucket.acquire(1)
+        return time.perf_counter() - start
+
+    # First acquire is free, the other 10 wait 50ms each
+    assert asyncio.run(take(11)) >= 0.45
+
+
+def test_analyses_are_cached_on_disk():
+    with tempfile.TemporaryDirectory() as tmp, FakeOpenAIServer() as server:
+        cache_path = os.path.join(tmp, 'ai.sqlite3')
+        first = AIAnalyzer(api_key='test-key', base_url=server.base_url, cache_path=cache_path)
+        assert first.analyze_news_with_ai("Same article")['cached'] is False
+
+        # A second analyzer (e.g. another worker) reuses the stored analysis
+        second = AIAnalyzer(api_key='test-key', base_url=server.base_url, cache_path=cache_path)
+        result = second.analyze_news_with_ai("Same article")
+        assert result['cached'] is True
+        assert result['ai_analysis']['credibility_score'] == 25
+        assert second.analyze_multiple_articles(["Same article"])[0]['cached'] is True
+        assert server.requests == 1
+        assert second.cache_stats()['hits'] == 2
+        first.close()
+        second.close()
+
+
+if __name__ == "__main__":
+    test_client_is_reused_across_calls()
+    test_client_is_shared_safely_across_threads()
+    test_batch_results_keep_input_order()
+    test_batch_retries_rate_limited_requests()
+    test_token_bucket_limits_rate()
+    test_analyses_are_cached_on_disk()
+    print("✅ All AI analyzer tests passed")
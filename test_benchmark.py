@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Smoke test: every benchmark suite runs once on a tiny input
+Runs offline: python -m pytest test_benchmark.py
+"""
+
+import pytest
+
+import benchmark
+from benchmark import BENCHMARKS
+
+# Keep each suite to a few seconds; the defaults are sized for real measurements
+SMOKE_SIZES = {'cold_start': [1]}
+SMOKE_KWARGS = {
+    'sparse': {'predict_rounds': 5},
+    'domains': {'lookups': 1000},
+    'classifiers': {'single_calls': 5},
+    'forest': {'calls': 10, 'batch_rows': (1, 16)},
+    'hot_paths': {'max_calls': 20, 'predict_calls': 5},
+}
+
+
+@pytest.mark.parametrize('name', sorted(BENCHMARKS))
+def test_benchmark_suite_runs(name, tmp_path, monkeypatch):
+    monkeypatch.setitem(benchmark.MODEL_CONFIG, 'artifact_path', str(tmp_path / 'model'))
+    results = BENCHMARKS[name](SMOKE_SIZES.get(name, [30]), **SMOKE_KWARGS.get(name, {}))
+    assert results
+    assert all(row['benchmark'] == name for row in results)
+
+
+def test_forest_benchmark_restores_the_compiled_inference_setting(monkeypatch):
+    monkeypatch.setitem(benchmark.MODEL_CONFIG, 'compiled_inference', False)
+    BENCHMARKS['forest']([30], **SMOKE_KWARGS['forest'])
+    assert benchmark.MODEL_CONFIG['compiled_inference'] is False
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, '-q']))
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Tests for the in-memory LRU cache and the persistent SQLite cache
+Runs without a server: python -m pytest test_caches.py
+"""
+
+import multiprocessing
+import os
+import sqlite3
+import tempfile
+import time
+
+from cache import LRUCache
+from persistent_cache import SQLiteCache
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(max_size=2)
+    cache.put('a', {'value': 1})
+    cache.put('b', {'value': 2})
+    assert cache.get('a') == {'value': 1}
+    cache.put('c', {'value': 3})
+
+    assert cache.get('b') is None
+    assert cache.get('c') == {'value': 3}
+    stats = cache.stats()
+    assert (stats['hits'], stats['misses'], stats['evictions']) == (2, 1, 1)
+
+
+def test_sqlite_cache_ttl_and_eviction():
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = SQLiteCache(os.path.join(tmp, 'cache.sqlite3'), ttl=0.2, max_entries=2)
+        cache.put('a', [1])
+        cache.put('b', [2])
+        assert cache.get('a') == [1]
+        cache.put('c', [3])
+        # 'b' was least recently used
+        assert cache.get('b') is None
+        assert len(cache) == 2
+
+        time.sleep(0.3)
+        assert cache.get('a') is None
+        stats = cache.stats()
+        assert stats['evictions'] == 1
+        assert stats['expired'] >= 1
+        cache.close()
+
+
+def test_sqlite_cache_reads_do_not_take_the_write_lock():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'cache.sqlite3')
+        cache = SQLiteCache(path, busy_timeout=0.1)
+        cache.put('a', [1])
+        writer = sqlite3.connect(path, isolation_level=None)
+        writer.execute("BEGIN IMMEDIATE")
+        try:
+            # Another process holding the write lock doesn't block lookups
+            assert cache.get('a') == [1]
+            assert cache.get('b') is None
+        finally:
+            writer.execute("ROLLBACK")
+            writer.close()
+        stats = cache.stats()
+        assert (stats['hits'], stats['misses']) == (1, 1)
+        cache.close()
+
+
+def test_sqlite_cache_evicts_in_batches_past_the_slack():
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = SQLiteCache(os.path.join(tmp, 'cache.sqlite3'), max_entries=100, evict_slack=0.05)
+        for i in range(105):
+            cache.put(f'key-{i}', i)
+        assert len(cache) == 105
+        assert cache.get('key-0') == 0
+        cache.put('key-105', 105)
+        # Trimmed back to max_entries, keeping the recently read key
+        assert len(cache) == 100
+        assert cache.get('key-0') == 0 and cache.get('key-1') is None
+        assert cache.stats()['evictions'] == 6
+        cache.close()
+
+
+def _write_entry(path):
+    SQLiteCache(path, namespace='shared').put('key', {'from': 'child'})
+
+
+def test_sqlite_cache_is_shared_between_processes():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'cache.sqlite3')
+        cache = SQLiteCache(path, namespace='shared')
+        process = multiprocessing.get_context('spawn').Process(target=_write_entry, args=(path,))
+        process.start()
+        process.join(30)
+
+        assert process.exitcode == 0
+        assert cache.get('key') == {'from': 'child'}
+        cache.close()
+
+
+if __name__ == "__main__":
+    test_lru_cache_evicts_least_recently_used()
+    test_sqlite_cache_ttl_and_eviction()
+    test_sqlite_cache_reads_do_not_take_the_write_lock()
+    test_sqlite_cache_evicts_in_batches_past_the_slack()
+    test_sqlite_cache_is_shared_between_processes()
+    print("✅ All cache tests passed")
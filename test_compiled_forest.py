@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Parity tests for the compiled random forest inference path
+Runs offline: python -m pytest test_compiled_forest.py
+"""
+
+import tempfile
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from sklearn.ensemble import RandomForestClassifier
+
+from detector import FakeNewsDetector
+from compiled_forest import CompiledForest, compile_forest
+from config import MODEL_CONFIG
+
+FAKE_TEXT = "BREAKING: Scientists discover that drinking hot water with lemon cures all diseases instantly!"
+
+
+def _trained_detector():
+    detector = FakeNewsDetector(mode='batch', classifier='random_forest')
+    detector.train('expanded_dataset.csv')
+    return detector
+
+
+def _feature_matrix(detector, texts):
+    token_lists = [detector.tokenize(text) for text in texts]
+    _, feature_df = detector.featurize(token_lists)
+    return detector.combine_features(detector.vectorizer.transform(token_lists), feature_df.values)
+
+
+def test_probabilities_match_sklearn_exactly():
+    detector = _trained_detector()
+    X = _feature_matrix(detector, pd.read_csv('expanded_dataset.csv')['text'])
+    compiled = CompiledForest(detector.classifier)
+
+    expected = detector.classifier.predict_proba(X)
+    assert np.array_equal(compiled.predict_proba(X), expected)
+    assert np.array_equal(compiled.predict_proba(X, block_size=7), expected)
+    assert np.array_equal(compiled.predict(X), detector.classifier.predict(X))
+
+
+def test_dense_input_with_ties_and_unseen_values():
+    rng = np.random.RandomState(0)
+    X = rng.randint(0, 3, size=(300, 6)).astype(np.float64)
+    y = (X[:, 0] + rng.rand(300) > 1.5).astype(int)
+    forest = RandomForestClassifier(n_estimators=15, random_state=0).fit(X, y)
+    X_test = np.vstack([X[:50], rng.uniform(-1, 4, size=(50, 6))])
+
+    compiled = CompiledForest(forest)
+    assert np.array_equal(compiled.predict_proba(X_test), forest.predict_proba(X_test))
+    assert np.array_equal(compiled.predict_proba(sparse.csr_matrix(X_test)), forest.predict_proba(X_test))
+
+
+def test_detector_uses_compiled_path_for_small_batches():
+    detector = _trained_detector()
+    assert detector.compiled is not None
+    X = _feature_matrix(detector, [FAKE_TEXT])
+    assert np.array_equal(detector._predict_proba(X), detector.classifier.predict_proba(X))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        detector.save(tmp)
+        loaded = FakeNewsDetector()
+        loaded.load(tmp)
+        assert loaded.compiled is not None
+        assert loaded.predict(FAKE_TEXT) == detector.predict(FAKE_TEXT)
+
+
+def test_other_backends_and_disabled_config_are_not_compiled():
+    assert compile_forest(RandomForestClassifier()) is None
+    detector = FakeNewsDetector(mode='batch', classifier='logistic_regression')
+    detector.train()
+    assert detector.compiled is None
+
+    MODEL_CONFIG['compiled_inference'] = False
+    try:
+        assert not _trained_detector().compile()
+    finally:
+        MODEL_CONFIG['compiled_inference'] = True
+
+
+if __name__ == "__main__":
+    test_probabilities_match_sklearn_exactly()
+    test_dense_input_with_ties_and_unseen_values()
+    test_detector_uses_compiled_path_for_small_batches()
+    test_other_backends_and_disabled_config_are_not_compiled()
+    print("✅ All compiled forest tests passed")
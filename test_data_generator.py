@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Tests for the training data generator
+Runs offline: python -m pytest test_data_generator.py
+"""
+
+import random
+
+from data_generator import create_expanded_dataset, generate_real_news_examples
+
+
+def test_every_real_news_template_fills():
+    # Enough draws to hit all 15 templates, including the report/analysis ones
+    examples = generate_real_news_examples(500, random.Random(0))
+    assert len(examples) == 500
+    assert not any('{' in text for text in examples)
+    assert any(' releases ' in text for text in examples)
+    assert any(' publishes ' in text for text in examples)
+
+
+def test_dataset_size_balance_and_seed():
+    df = create_expanded_dataset(1001, seed=3, path=None)
+    assert len(df) == 1001
+    assert set(df.columns) == {'text', 'label'}
+    assert df['label'].sum() == 500
+    assert df.equals(create_expanded_dataset(1001, seed=3, path=None))
+
+
+def test_dataset_is_saved(tmp_path):
+    path = tmp_path / 'generated.csv'
+    create_expanded_dataset(20, seed=1, path=str(path))
+    assert path.read_text(encoding='utf-8').startswith('text,label')
+
+
+if __name__ == "__main__":
+    import pytest
+    raise SystemExit(pytest.main([__file__, '-q']))
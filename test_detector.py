@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Offline tests for the FakeNewsDetector ML pipeline
+Runs without a server: python -m pytest test_detector.py
+"""
+
+import tempfile
+
+import numpy as np
+from scipy import sparse
+
+from detector import FakeNewsDetector
+from classifiers import CLASSIFIER_BACKENDS
+from model_store import read_metadata
+
+FAKE_TEXT = "BREAKING: Scientists discover that drinking hot water with lemon cures all diseases instantly!"
+REAL_TEXT = "NASA's Perseverance rover successfully landed on Mars, beginning its mission to search for signs of ancient life."
+
+
+def _trained_detector():
+    detector = FakeNewsDetector()
+    detector.train()
+    return detector
+
+
+def test_feature_matrix_stays_sparse():
+    """TF-IDF and hand-crafted features are combined without densifying"""
+    detector = _trained_detector()
+    cleaned = detector.preprocess_text(FAKE_TEXT)
+    features = detector.extract_features(cleaned)
+    X = detector.combine_features(detector.vectorizer.transform([cleaned]), [list(features.values())])
+
+    assert sparse.issparse(X) and X.format == 'csr'
+    assert X.shape == (1, len(detector.vectorizer.vocabulary_) + len(features))
+
+
+def test_predict_returns_probabilities():
+    detector = _trained_detector()
+    for text in (FAKE_TEXT, REAL_TEXT):
+        result = detector.predict(text)
+        assert result['prediction'] in ('FAKE', 'REAL')
+        assert abs(result['fake_probability'] + result['real_probability'] - 1.0) < 1e-9
+        assert result['confidence'] == max(result['fake_probability'], result['real_probability'])
+
+
+def test_predict_batch_matches_single_predictions():
+    detector = _trained_detector()
+    texts = [FAKE_TEXT, REAL_TEXT, FAKE_TEXT]
+    results = detector.predict_batch(texts)
+
+    assert len(results) == 3
+    for text, result in zip(texts, results):
+        assert result == detector.predict(text)
+    # Duplicates are scored once but returned as independent copies
+    assert results[0] == results[2] and results[0] is not results[2]
+
+
+def test_saved_artifact_round_trips():
+    detector = _trained_detector()
+    with tempfile.TemporaryDirectory() as tmp:
+        detector.save(tmp)
+        metadata = read_metadata(tmp)
+        assert metadata['model_version'] == detector.model_version
+        assert metadata['feature_schema'] == detector.feature_names
+
+        loaded = FakeNewsDetector()
+        loaded.load(tmp)
+        assert loaded.is_trained
+        assert loaded.model_version == detector.model_version
+        for text in (FAKE_TEXT, REAL_TEXT):
+            assert loaded.predict(text) == detector.predict(text)
+
+
+def test_prediction_cache_is_versioned():
+    detector = _trained_detector()
+    first = detector.predict(FAKE_TEXT)
+    # Same cleaned text, different punctuation/case: served from the cache
+    first['prediction'] = 'annotated by caller'
+    second = detector.predict(FAKE_TEXT.upper() + "!!")
+    assert second['prediction'] in ('FAKE', 'REAL')
+    assert detector.prediction_cache.stats()['hits'] == 1
+
+    old_version = detector.model_version
+    detector.train()
+    assert detector.model_version != old_version
+    assert len(detector.prediction_cache) == 0
+
+
+def test_every_batch_backend_trains_and_predicts():
+    for name in CLASSIFIER_BACKENDS:
+        if name == 'sgd':
+            continue
+        detector = FakeNewsDetector(mode='batch', classifier=name)
+        detector.train()
+        result = detector.predict(FAKE_TEXT)
+        assert result['prediction'] in ('FAKE', 'REAL'), name
+        assert abs(result['fake_probability'] + result['real_probability'] - 1) < 1e-9, name
+
+
+def test_backend_name_round_trips_and_prediction_runs_single_threaded():
+    detector = FakeNewsDetector(mode='batch', classifier='random_forest')
+    detector.train()
+    assert detector.classifier.n_jobs == 1
+    with tempfile.TemporaryDirectory() as tmp:
+        detector.save(tmp)
+        assert read_metadata(tmp)['classifier_backend'] == 'random_forest'
+        loaded = FakeNewsDetector(mode='batch', classifier='complement_nb')
+        loaded.load(tmp)
+        assert loaded.classifier_name == 'random_forest'
+
+
+def test_online_partial_fit_learns_new_words_without_touching_live_model():
+    detector = FakeNewsDetector(mode='online')
+    detector.train()
+    novel = "zorblax quantum crystals reverse aging overnight"
+    before = detector.predict(novel)['fake_probability']
+    coef = detector.classifier.coef_.copy()
+
+    updated = detector
+    for _ in range(5):
+        updated = updated.partial_fit([novel, REAL_TEXT], [1, 0])
+
+    # The model the updates started from keeps serving the same answers
+    assert np.array_equal(detector.classifier.coef_, coef)
+    assert detector.predict(novel)['fake_probability'] == before
+    assert updated.n_updates == 5
+    assert updated.model_version != detector.model_version
+    assert updated.predict(novel)['fake_probability'] > before
+
+
+def test_online_artifact_round_trips_and_keeps_learning():
+    detector = FakeNewsDetector(mode='online')
+    detector.train()
+    detector = detector.partial_fit([FAKE_TEXT], [1])
+    with tempfile.TemporaryDirectory() as tmp:
+        detector.save(tmp)
+        loaded = FakeNewsDetector(mode='batch')
+        loaded.load(tmp)
+        assert loaded.mode == 'online' and loaded.n_updates == 1
+        assert loaded.predict(FAKE_TEXT)['fake_probability'] == detector.predict(FAKE_TEXT)['fake_probability']
+        # Memory-mapped arrays are read-only; updates must work on copies
+        assert loaded.partial_fit([REAL_TEXT], [0]).n_updates == 2
+
+
+def test_partial_fit_requires_online_mode():
+    detector = _trained_detector()
+    try:
+        detector.partial_fit([FAKE_TEXT], [1])
+    except ValueError:
+        return
+    raise AssertionError("batch-mode partial_fit should raise ValueError")
+
+
+if __name__ == "__main__":
+    test_feature_matrix_stays_sparse()
+    test_predict_returns_probabilities()
+    test_predict_batch_matches_single_predictions()
+    test_saved_artifact_round_trips()
+    test_prediction_cache_is_versioned()
+    test_every_batch_backend_trains_and_predicts()
+    test_backend_name_round_trips_and_prediction_runs_single_threaded()
+    test_online_partial_fit_learns_new_words_without_touching_live_model()
+    test_online_artifact_round_trips_and_keeps_learning()
+    test_partial_fit_requires_online_mode()
+    print("✅ All detector tests passed")
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Tests for public-suffix domain extraction and the reputation index
+Runs offline: python -m pytest test_domains.py
+"""
+
+from domains import PublicSuffixTrie, ReputationIndex, get_public_suffixes
+from web_verifier import WebVerifier
+
+
+def test_registrable_domain_uses_public_suffixes():
+    suffixes = get_public_suffixes()
+    assert suffixes.registrable_domain('www.bbc.co.uk') == 'bbc.co.uk'
+    assert suffixes.registrable_domain('news.bbc.co.uk') == 'bbc.co.uk'
+    assert suffixes.registrable_domain('www.reuters.com') == 'reuters.com'
+    assert suffixes.registrable_domain('WWW.Example.ORG.:8080') == 'example.org'
+    assert suffixes.registrable_domain('someone.blogspot.com') == 'someone.blogspot.com'
+    assert suffixes.registrable_domain('co.uk') == 'co.uk'
+    assert suffixes.registrable_domain('127.0.0.1') == '127.0.0.1'
+
+
+def test_wildcard_and_exception_rules():
+    suffixes = PublicSuffixTrie.from_text("// comment\nuk\nco.uk\n*.ck\n!www.ck\n")
+    assert suffixes.registrable_domain('a.b.ck') == 'a.b.ck'
+    assert suffixes.registrable_domain('x.a.b.ck') == 'a.b.ck'
+    assert suffixes.registrable_domain('www.ck') == 'www.ck'
+    assert suffixes.registrable_domain('mail.www.ck') == 'www.ck'
+    assert suffixes.size == 4
+
+
+def test_suffix_file_is_parsed_once_per_path(tmp_path):
+    path = tmp_path / 'public_suffix_list.dat'
+    path.write_text("// comment\nuk\nco.uk\n", encoding='utf-8')
+    suffixes = get_public_suffixes(str(path))
+    assert get_public_suffixes(str(path)) is suffixes
+    assert get_public_suffixes(str(tmp_path / '.' / path.name)) is suffixes
+    assert suffixes is not get_public_suffixes()
+    assert suffixes.registrable_domain('www.bbc.co.uk') == 'bbc.co.uk'
+
+
+def test_reputation_lookup_walks_parent_domains():
+    index = ReputationIndex.from_items([
+        ('bbc.co.uk', 'trusted'), ('abcnews.go.com', 'trusted'), ('infowars.com', 'suspect')
+    ])
+    assert index.lookup('www.bbc.co.uk') == 'trusted'
+    assert index.lookup('www.abcnews.go.com') == 'trusted'
+    assert index.lookup('go.com') is None
+    assert index.lookup('co.uk') is None
+    assert index.lookup('shop.infowars.com') == 'suspect'
+    assert index.lookup('example.com') is None
+
+
+def test_reputation_index_files_and_precedence(tmp_path):
+    listing = tmp_path / 'domains.txt'
+    listing.write_text("# reputation list\nexample.com,trusted\nbad.example  suspect\nplain.example\nexample.com,satire\n")
+    index = ReputationIndex.from_file(str(listing))
+    assert len(index) == 3
+    assert index.lookup('example.com') == 'satire'  # later lines win
+    assert index.lookup('plain.example') == 'suspect'
+
+    compiled = str(tmp_path / 'domains.npz')
+    index.save(compiled)
+    loaded = ReputationIndex.from_file(compiled)
+    assert loaded.lookup('www.bad.example') == 'suspect'
+    assert loaded.nbytes == 9 * len(loaded)
+
+    base = ReputationIndex.from_items([('example.com', 'trusted'), ('other.com', 'trusted')])
+    merged = base.merged(loaded)
+    assert merged.lookup('example.com') == 'satire'
+    assert merged.lookup('other.com') == 'trusted'
+
+
+def test_verifier_labels_multi_label_suffix_domains():
+    verifier = WebVerifier(cache_path='')
+    assert verifier._extract_domain('https://www.bbc.co.uk/news/world') == 'bbc.co.uk'
+    assert verifier._credibility_label('www.bbc.co.uk') == 'trusted'
+    assert verifier._credibility_label('abcnews.go.com') == 'trusted'
+    assert verifier._credibility_label('www.infowars.com') == 'suspect'
+
+
+if __name__ == "__main__":
+    import pytest
+    raise SystemExit(pytest.main([__file__, '-q']))
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Tests for the streaming <title> extractor
+Runs offline: python -m pytest test_html_title.py
+"""
+
+from bs4 import BeautifulSoup
+
+from html_title import read_title
+
+
+def _chunks(data, size=7):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+class CountingChunks:
+    """Iterable of chunks that records how many bytes were pulled"""
+
+    def __init__(self, data, size=1024):
+        self.data = data
+        self.size = size
+        self.consumed = 0
+
+    def __iter__(self):
+        for i in range(0, len(self.data), self.size):
+            chunk = self.data[i:i + self.size]
+            self.consumed += len(chunk)
+            yield chunk
+
+
+def test_title_split_across_chunks_matches_beautifulsoup():
+    page = (b"<!DOCTYPE html><html><head><meta name='x' content='y'>"
+            b"<TITLE lang='en'>\n  Markets &amp; Politics:\n Daily  Briefing </TITLE></head><body>x</body></html>")
+    soup_title = BeautifulSoup(page, 'html.parser').title.string
+    assert read_title(_chunks(page), 'text/html') == ' '.join(soup_title.split())
+    assert read_title(_chunks(page), 'text/html') == 'Markets & Politics: Daily Briefing'
+
+
+def test_stops_reading_at_title_end():
+    page = b"<html><head><title>Early title</title></head><body>" + b"<p>filler</p>" * 100000 + b"</body></html>"
+    chunks = CountingChunks(page)
+    assert read_title(chunks, 'text/html; charset=utf-8') == 'Early title'
+    assert chunks.consumed <= 1024
+
+
+def test_byte_cap_limits_transfer_without_title():
+    page = b"<html><head>" + b"<script>var x = 1;</script>" * 100000 + b"<title>Too late</title>"
+    chunks = CountingChunks(page)
+    assert read_title(chunks, 'text/html', max_bytes=64 * 1024) == ''
+    assert chunks.consumed <= 64 * 1024 + 1024
+
+
+def test_charset_from_header_wins_over_default():
+    page = "<html><head><title>Café société</title></head></html>".encode('latin-1')
+    assert read_title(_chunks(page), 'text/html; charset=ISO-8859-1') == 'Café société'
+
+
+def test_charset_from_meta_tags():
+    title = "Новости дня"
+    page = f'<html><head><meta charset="windows-1251"><title>{title}</title></head></html>'.encode('cp1251')
+    assert read_title(_chunks(page), 'text/html') == title
+
+    page = ('<html><head><meta http-equiv="Content-Type" content="text/html; charset=iso-8859-1">'
+            '<title>Für Ärzte</title></head></html>').encode('latin-1')
+    assert read_title(_chunks(page), 'text/html') == 'Für Ärzte'
+
+
+def test_byte_order_mark_and_utf8_default():
+    page = "<html><head><title>日本のニュース</title></head></html>"
+    assert read_title(_chunks(page.encode('utf-16')), 'text/html') == '日本のニュース'
+    assert read_title(_chunks(page.encode('utf-8')), 'text/html') == '日本のニュース'
+
+
+def test_missing_title_returns_empty_string():
+    assert read_title(_chunks(b"<html><head></head><body>No title</body></html>"), 'text/html') == ''
+    assert read_title([], 'text/html') == ''
+
+
+if __name__ == "__main__":
+    test_title_split_across_chunks_matches_beautifulsoup()
+    test_stops_reading_at_title_end()
+    test_byte_cap_limits_transfer_without_title()
+    test_charset_from_header_wins_over_default()
+    test_charset_from_meta_tags()
+    test_byte_order_mark_and_utf8_default()
+    test_missing_title_returns_empty_string()
+    print("✅ All title extractor tests passed")
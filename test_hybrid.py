@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Offline tests for HybridAnalyzer with a stubbed AI analyzer
+Runs without a server or API key: python -m pytest test_hybrid.py
+"""
+
+import time
+
+from ai_analyzer import HybridAnalyzer
+from detector import FakeNewsDetector
+
+FAKE_TEXT = "BREAKING: Scientists discover that drinking hot water with lemon cures all diseases instantly!"
+
+
+class StubAIAnalyzer:
+    """Stands in for AIAnalyzer without calling the OpenAI API"""
+
+    model = "stub-model"
+
+    def __init__(self, available=True, delay=0.0):
+        self.available = available
+        self.delay = delay
+        self.calls = 0
+
+    def analyze_news_with_ai(self, text):
+        self.calls += 1
+        time.sleep(self.delay)
+        if not self.available:
+            return {"error": "AI analysis failed: stub", "available": False}
+        return {
+            "ai_analysis": {"credibility_score": 20, "is_likely_fake": True, "recommendations": "Check sources"},
+            "raw_response": "{}",
+            "available": True
+        }
+
+
+def _hybrid(ai, **kwargs):
+    detector = FakeNewsDetector()
+    detector.train()
+    return HybridAnalyzer(detector, ai, **kwargs)
+
+
+def test_hybrid_results_are_cached():
+    ai = StubAIAnalyzer()
+    hybrid = _hybrid(ai)
+    first = hybrid.analyze_hybrid(FAKE_TEXT)
+    second = hybrid.analyze_hybrid(FAKE_TEXT)
+    assert first == second
+    assert ai.calls == 1
+    assert hybrid.cache.stats()['hits'] == 1
+
+
+def test_hybrid_cache_skips_failed_ai_calls():
+    ai = StubAIAnalyzer(available=False)
+    hybrid = _hybrid(ai)
+    hybrid.analyze_hybrid(FAKE_TEXT)
+    hybrid.analyze_hybrid(FAKE_TEXT)
+    assert ai.calls == 2
+
+
+def test_retrained_model_invalidates_hybrid_cache():
+    ai = StubAIAnalyzer()
+    hybrid = _hybrid(ai)
+    hybrid.analyze_hybrid(FAKE_TEXT)
+    hybrid.ml_model.train()
+    hybrid.analyze_hybrid(FAKE_TEXT)
+    assert ai.calls == 2
+
+
+def test_slow_ai_falls_back_to_ml_after_deadline():
+    hybrid = _hybrid(StubAIAnalyzer(delay=2.0), ai_timeout=0.2)
+    start = time.perf_counter()
+    result = hybrid.analyze_hybrid(FAKE_TEXT)
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 1.5
+    assert result['ai_timed_out'] is True
+    assert 'timed out' in result['ai_analysis']['error']
+    assert result['prediction'] == result['ml_prediction']['prediction']
+    assert len(hybrid.cache) == 0
+
+
+def test_ml_and_ai_legs_overlap():
+    hybrid = _hybrid(StubAIAnalyzer(delay=0.3), ai_timeout=5)
+    predict = hybrid.ml_model.predict
+
+    def slow_predict(text):
+        time.sleep(0.3)
+        return predict(text)
+
+    # Both legs take 0.3s; run one after the other they would need 0.6s
+    hybrid.ml_model.predict = slow_predict
+    start = time.perf_counter()
+    result = hybrid.analyze_hybrid(FAKE_TEXT)
+    elapsed = time.perf_counter() - start
+
+    assert result['ai_timed_out'] is False
+    assert 'hybrid_score' in result
+    assert elapsed < 0.45
+
+
+if __name__ == "__main__":
+    test_hybrid_results_are_cached()
+    test_hybrid_cache_skips_failed_ai_calls()
+    test_retrained_model_invalidates_hybrid_cache()
+    test_slow_ai_falls_back_to_ml_after_deadline()
+    test_ml_and_ai_legs_overlap()
+    print("✅ All hybrid analyzer tests passed")
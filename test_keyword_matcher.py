@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Tests for the Aho-Corasick keyword matcher and its call sites
+Runs offline: python -m pytest test_keyword_matcher.py
+"""
+
+import json
+import random
+
+from ai_analyzer import AIAnalyzer
+from keyword_matcher import KeywordMatcher, load_lexicons
+from web_verifier import WebVerifier
+
+
+def _brute_force(text, lexicons):
+    text = text.lower()
+    found = []
+    for category, phrases in lexicons.items():
+        for phrase in dict.fromkeys(p.lower() for p in phrases):
+            start = text.find(phrase)
+            while start != -1:
+                found.append((start, start + len(phrase), phrase, category))
+                start = text.find(phrase, start + 1)
+    return sorted(found)
+
+
+def test_matches_agree_with_substring_search():
+    rng = random.Random(0)
+    alphabet = 'abc '
+    lexicons = {
+        'a': [''.join(rng.choice(alphabet) for _ in range(rng.randint(1, 5))) for _ in range(40)],
+        'b': [''.join(rng.choice(alphabet) for _ in range(rng.randint(1, 5))) for _ in range(40)],
+    }
+    matcher = KeywordMatcher(lexicons)
+    for _ in range(200):
+        text = ''.join(rng.choice(alphabet + 'ABC') for _ in range(rng.randint(0, 60)))
+        assert sorted(tuple(m) for m in matcher.find_all(text)) == _brute_force(text, lexicons)
+        counts = matcher.counts(text)
+        for category in lexicons:
+            assert counts[category] == sum(1 for m in _brute_force(text, lexicons) if m[3] == category)
+
+
+def test_overlapping_phrases_and_positions():
+    matcher = KeywordMatcher({'refutes': ['not true', 'true', 'hoax'], 'supports': ['true story']})
+    matches = matcher.find_all("It is NOT TRUE; the true story was a hoax")
+    assert [(m.keyword, m.start) for m in matches] == [
+        ('not true', 6), ('true', 10), ('true', 20), ('true story', 20), ('hoax', 37)
+    ]
+    assert matcher.counts("nothing here") == {'refutes': 0, 'supports': 0}
+
+
+def test_stance_uses_shared_lexicons():
+    verifier = WebVerifier(cache_path='')
+    assert verifier._infer_stance_from_snippet("Fact check: this claim is misleading") == 'refutes'
+    assert verifier._infer_stance_from_snippet("Officials confirmed the report") == 'supports'
+    # Refuting cues win over supporting ones, as before
+    assert verifier._infer_stance_from_snippet("Reuters reports the story is a hoax") == 'refutes'
+    assert verifier._infer_stance_from_snippet("Weather today is sunny") == 'neutral'
+
+
+def test_fallback_parsing_detects_fake_indicators():
+    analyzer = AIAnalyzer(api_key='test', cache_path='')
+    assert analyzer._fallback_parsing("This article looks UNRELIABLE to me")['is_likely_fake'] is True
+    assert analyzer._fallback_parsing("The article appears credible")['is_likely_fake'] is False
+
+
+def test_extra_lexicons_extend_builtins(tmp_path):
+    path = tmp_path / 'lexicons.json'
+    path.write_text(json.dumps({'refutes': ['fabricated'], 'satire': ['the onion']}))
+    lexicons = load_lexicons(str(path))
+    assert 'hoax' in lexicons['refutes'] and 'fabricated' in lexicons['refutes']
+    assert lexicons['satire'] == ['the onion']
+
+
+if __name__ == "__main__":
+    import pytest
+    raise SystemExit(pytest.main([__file__, '-q']))
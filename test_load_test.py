@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Tests for the load-testing harness
+Runs offline: python -m pytest test_load_test.py
+"""
+
+import threading
+import time
+
+import pytest
+from werkzeug.serving import make_server
+
+import app as app_module
+from load_test import (HTTPTransport, InProcessTransport, LoadRequest, generate_requests, parse_mix,
+                       read_log, run_load, stub_backends, write_log)
+
+TEXTS = [
+    "BREAKING: Scientists discover that drinking hot water with lemon cures all diseases instantly!",
+    "NASA's Perseverance rover successfully landed on Mars, beginning its mission to search for signs of ancient life.",
+]
+
+
+@pytest.fixture
+def stubbed_app():
+    with stub_backends(app_module, ai_latency=0.01, search_latency=0.01) as server:
+        yield server
+
+
+def _by_scenario(summaries):
+    return {row['scenario']: row for row in summaries}
+
+
+def test_in_process_mix_reports_every_scenario(stubbed_app):
+    requests_iter = generate_requests(TEXTS, parse_mix('predict=2,predict_ai=1,verify=1'), unique=True)
+    summaries = _by_scenario(run_load(InProcessTransport(app_module.app), requests_iter, concurrency=4, total=40))
+
+    assert set(summaries) == {'predict', 'predict_ai', 'verify', 'all'}
+    overall = summaries['all']
+    assert overall['requests'] == 40 and overall['errors'] == 0
+    assert overall['status_codes'] == {'200': 40}
+    assert overall['p50_ms'] <= overall['p95_ms'] <= overall['p99_ms'] <= overall['max_ms']
+    assert overall['throughput_rps'] > 0
+    # The AI stub was really called, not the real API
+    assert stubbed_app.requests > 0
+
+
+def test_errors_and_exceptions_are_counted():
+    class Flaky:
+        calls = 0
+
+        def send(self, req):
+            self.calls += 1
+            if req.path == '/boom':
+                raise ConnectionError("refused")
+            return 404 if req.path == '/missing' else 200
+
+    requests_iter = iter([LoadRequest('ok', 'GET', '/'), LoadRequest('missing', 'GET', '/missing'),
+                          LoadRequest('boom', 'GET', '/boom'), LoadRequest('ok', 'GET', '/')])
+    summaries = _by_scenario(run_load(Flaky(), requests_iter, concurrency=2))
+    assert summaries['all']['requests'] == 4
+    assert summaries['all']['errors'] == 2
+    assert summaries['missing']['status_codes'] == {'404': 1}
+    assert summaries['boom']['status_codes'] == {'None': 1}
+    assert summaries['ok']['error_rate'] == 0.0
+
+
+def test_rate_limits_the_send_schedule():
+    class Instant:
+        def send(self, req):
+            return 200
+
+    start = time.perf_counter()
+    summaries = run_load(Instant(), generate_requests(TEXTS, {'predict': 1}), concurrency=4, rate=100, total=30)
+    assert time.perf_counter() - start >= 0.28
+    assert summaries[-1]['requests'] == 30
+
+
+def test_recorded_requests_replay_in_order_and_time(tmp_path, stubbed_app):
+    record = []
+    run_load(InProcessTransport(app_module.app), generate_requests(TEXTS, parse_mix('predict=1,verify=1')),
+             concurrency=2, total=10, record=record)
+    path = tmp_path / 'run.jsonl'
+    write_log(str(path), record)
+    replay = read_log(str(path))
+    assert [(r.name, r.path, r.body) for r in replay] == [(r.name, r.path, r.body) for r in record]
+    assert all(r.offset is not None for r in replay)
+
+    summaries = run_load(InProcessTransport(app_module.app), iter(replay), concurrency=2, speed=4)
+    assert summaries[-1]['requests'] == 10 and summaries[-1]['errors'] == 0
+
+
+def test_http_transport_against_running_server(stubbed_app):
+    server = make_server('127.0.0.1', 0, app_module.app, threaded=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        transport = HTTPTransport(f"http://127.0.0.1:{server.server_port}")
+        summaries = _by_scenario(run_load(transport, generate_requests(TEXTS, parse_mix('predict=1')),
+                                          concurrency=2, total=10))
+    finally:
+        server.shutdown()
+    assert summaries['predict']['requests'] == 10
+    assert summaries['predict']['errors'] == 0
+
+
+def test_unknown_scenario_is_rejected():
+    with pytest.raises(ValueError):
+        parse_mix('predict=1,upload=2')
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, '-q']))
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Tests for stage timers, the Prometheus /metrics endpoint and per-response timings
+Runs offline: python -m pytest test_metrics.py
+"""
+
+import time
+
+import pytest
+
+import app as app_module
+import metrics
+from ai_analyzer import HybridAnalyzer
+from app import app
+from load_test import stub_backends
+from metrics import Registry, stage
+
+FAKE_TEXT = "BREAKING: Scientists discover that drinking hot water with lemon cures all diseases instantly!"
+
+
+def _sample(text, line_start):
+    """Value of the first exposition line starting with line_start"""
+    for line in text.splitlines():
+        if line.startswith(line_start):
+            return float(line.rsplit(' ', 1)[1])
+    return None
+
+
+def test_registry_renders_prometheus_text():
+    registry = Registry()
+    requests = registry.counter('demo_requests_total', 'Requests', ('path',))
+    latency = registry.histogram('demo_seconds', 'Latency', (0.1, 1.0), ('path',))
+    requests.inc(path='/a')
+    requests.inc(2, path='say "hi"\n')
+    for value in (0.05, 0.1, 0.5, 3.0):
+        latency.observe(value, path='/a')
+
+    text = registry.render()
+    assert '# TYPE demo_requests_total counter' in text
+    assert 'demo_requests_total{path="/a"} 1.0' in text
+    assert 'demo_requests_total{path="say \\"hi\\"\\n"} 2.0' in text
+    assert '# TYPE demo_seconds histogram' in text
+    # Buckets are cumulative and inclusive of their upper bound
+    assert 'demo_seconds_bucket{path="/a",le="0.1"} 2' in text
+    assert 'demo_seconds_bucket{path="/a",le="1.0"} 3' in text
+    assert 'demo_seconds_bucket{path="/a",le="+Inf"} 4' in text
+    assert 'demo_seconds_count{path="/a"} 4' in text
+    assert _sample(text, 'demo_seconds_sum') == pytest.approx(3.65)
+    assert text.endswith('\n')
+
+
+def test_registering_a_name_twice_returns_the_same_metric():
+    registry = Registry()
+    assert registry.counter('x_total', 'X') is registry.counter('x_total', 'X')
+    with pytest.raises(ValueError):
+        registry.histogram('x_total', 'X', (1.0,))
+
+
+def test_stage_timer_feeds_histogram_and_request_timings():
+    before = metrics.STAGE_SECONDS.count(stage='unit_test_stage')
+    with stage('unit_test_stage'):
+        pass
+    assert metrics.stop_timings() is None
+    metrics.start_timings()
+    with stage('unit_test_stage'):
+        pass
+    with stage('unit_test_stage'):
+        pass
+    timings = metrics.stop_timings()
+    assert set(timings) == {'unit_test_stage'} and timings['unit_test_stage'] >= 0
+    assert metrics.STAGE_SECONDS.count(stage='unit_test_stage') == before + 3
+
+
+def test_timings_block_is_opt_in_and_covers_the_pipeline():
+    client = app.test_client()
+    with stub_backends(app_module, ai_latency=0.01):
+        plain = client.post('/predict', json={'text': FAKE_TEXT, 'use_ai': False}).get_json()
+        assert 'timings' not in plain
+
+        response = client.post('/predict?timings=1', json={'text': FAKE_TEXT + " hybrid", 'use_ai': True})
+        timed = response.get_json()
+        # Re-serialized the way jsonify does it (sorted keys, same encoder)
+        assert response.get_data(as_text=True) == app.json.dumps(timed)
+        stages = timed['timings']['stages_ms']
+        assert {'tokenize', 'featurize', 'vectorize', 'classify', 'hybrid_ml', 'hybrid_ai_wait', 'ai_request'} <= set(stages)
+        assert timed['timings']['total_ms'] >= stages['hybrid_ai_wait']
+
+        verified = client.post('/verify?timings=1', json={'text': FAKE_TEXT}).get_json()
+        assert 'search' in verified['timings']['stages_ms'] or verified['cached']
+
+        # The next request on the same thread does not inherit a timings block
+        assert 'timings' not in client.post('/predict', json={'text': FAKE_TEXT, 'use_ai': False}).get_json()
+
+
+def test_metrics_endpoint_counts_requests_and_cache_hits():
+    client = app.test_client()
+    text = client.get('/metrics').get_data(as_text=True)
+    before_requests = _sample(text, 'fnd_http_requests_total{endpoint="/predict/batch",status="200"}') or 0
+    before_hits = _sample(text, 'fnd_cache_lookups_total{cache="prediction",result="hit"}') or 0
+
+    client.post('/predict/batch', json=[FAKE_TEXT])
+    client.post('/predict/batch', json=[FAKE_TEXT])
+    response = client.get('/metrics')
+    assert response.headers['Content-Type'] == metrics.CONTENT_TYPE
+    text = response.get_data(as_text=True)
+    assert _sample(text, 'fnd_http_requests_total{endpoint="/predict/batch",status="200"}') == before_requests + 2
+    assert _sample(text, 'fnd_cache_lookups_total{cache="prediction",result="hit"}') >= before_hits + 1
+    assert 'fnd_stage_seconds_bucket{stage="tokenize"' in text
+
+
+class SlowAI:
+    model = "stub-model"
+
+    def __init__(self, delay):
+        self.delay = delay
+
+    def analyze_news_with_ai(self, text):
+        time.sleep(self.delay)
+        return {"error": "AI analysis failed: stub", "available": False}
+
+
+def test_ai_timeout_and_unavailable_count_fallbacks():
+    detector = app_module.get_detector()
+    timeouts = metrics.AI_FAILURES.value(reason='timeout')
+    fallbacks = {reason: metrics.HYBRID_FALLBACKS.value(reason=reason) for reason in ('timeout', 'ai_unavailable')}
+
+    assert HybridAnalyzer(detector, SlowAI(0.3), ai_timeout=0.05).analyze_hybrid(FAKE_TEXT)['ai_timed_out']
+    HybridAnalyzer(detector, SlowAI(0.0)).analyze_hybrid(FAKE_TEXT)
+
+    assert metrics.AI_FAILURES.value(reason='timeout') == timeouts + 1
+    assert metrics.HYBRID_FALLBACKS.value(reason='timeout') == fallbacks['timeout'] + 1
+    assert metrics.HYBRID_FALLBACKS.value(reason='ai_unavailable') == fallbacks['ai_unavailable'] + 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, '-q']))
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Tests for the admin-gated request profiling hook
+Runs offline: python -m pytest test_profiling.py
+"""
+
+import pstats
+import time
+
+import pytest
+
+import app as app_module
+import profiling
+from app import app
+from load_test import stub_backends
+from profiling import SamplingProfiler, profile_call
+
+FAKE_TEXT = "BREAKING: Scientists discover that drinking hot water with lemon cures all diseases instantly!"
+TOKEN = 'test-admin-token'
+
+
+@pytest.fixture
+def profiled_app(tmp_path, monkeypatch):
+    """The app with profiling enabled, restored afterwards"""
+    monkeypatch.setitem(profiling.PROFILING_CONFIG, 'admin_token', TOKEN)
+    monkeypatch.setitem(profiling.PROFILING_CONFIG, 'output_dir', str(tmp_path / 'profiles'))
+    for endpoint in ('predict_news', 'verify_on_web'):
+        monkeypatch.setitem(app.view_functions, endpoint, app.view_functions[endpoint])
+    assert profiling.install(app, ('predict_news', 'verify_on_web'))
+    return app.test_client()
+
+
+def _busy(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        sum(range(200))
+    return 'done'
+
+
+def test_disabled_profiling_wraps_nothing(monkeypatch):
+    monkeypatch.setitem(profiling.PROFILING_CONFIG, 'admin_token', None)
+    view = app.view_functions['predict_news']
+    assert profiling.install(app, ('predict_news',)) is False
+    assert app.view_functions['predict_news'] is view
+    # ?profile= is ignored rather than rejected when profiling is off
+    response = app.test_client().post('/predict?profile=cprofile', json={'text': FAKE_TEXT, 'use_ai': False})
+    assert response.status_code == 200 and 'profile' not in response.get_json()
+
+
+def test_cprofile_returns_summary_and_stores_pstats(profiled_app, tmp_path):
+    response = profiled_app.post('/predict?profile=cprofile', json={'text': FAKE_TEXT, 'use_ai': False},
+                                 headers={'X-Admin-Token': TOKEN})
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body['prediction'] in ('FAKE', 'REAL')
+    profile = body['profile']
+    assert profile['mode'] == 'cprofile' and response.headers['X-Profile-Id'] == profile['id']
+    assert any('predict_batch' in row['function'] for row in profile['top'])
+    stats = pstats.Stats(profile['file'])
+    assert stats.total_calls > 0
+
+
+def test_sampling_profile_is_flamegraph_folded(profiled_app):
+    with stub_backends(app_module, search_latency=0.02):
+        response = profiled_app.post('/verify?profile=sample', json={'text': FAKE_TEXT},
+                                     headers={'X-Admin-Token': TOKEN})
+    assert response.status_code == 200
+    profile = response.get_json()['profile']
+    assert profile['mode'] == 'sample' and profile['file'].endswith('.folded')
+    with open(profile['file'], encoding='utf-8') as fh:
+        for line in fh:
+            stack, count = line.rsplit(' ', 1)
+            assert int(count) > 0 and stack
+
+
+def test_bad_token_or_mode_is_rejected(profiled_app):
+    missing = profiled_app.post('/predict?profile=cprofile', json={'text': FAKE_TEXT, 'use_ai': False})
+    assert missing.status_code == 403
+    wrong = profiled_app.post('/predict?profile=cprofile', json={'text': FAKE_TEXT},
+                              headers={'X-Admin-Token': 'nope'})
+    assert wrong.status_code == 403
+    unknown = profiled_app.post('/predict?profile=perf', json={'text': FAKE_TEXT},
+                                headers={'X-Admin-Token': TOKEN})
+    assert unknown.status_code == 400
+    # Unprofiled requests are untouched
+    plain = profiled_app.post('/predict', json={'text': FAKE_TEXT, 'use_ai': False})
+    assert plain.status_code == 200 and 'profile' not in plain.get_json()
+
+
+def test_profiled_training_job_carries_the_profile(profiled_app, tmp_path, monkeypatch):
+    monkeypatch.setitem(app_module.MODEL_CONFIG, 'artifact_path', str(tmp_path / 'model'))
+    response = profiled_app.post('/train?profile=sample', headers={'X-Admin-Token': TOKEN})
+    assert response.status_code == 202
+    job_id = response.get_json()['job_id']
+    deadline = time.monotonic() + 60
+    while True:
+        status = profiled_app.get(f'/train/{job_id}').get_json()
+        if status['status'] in ('succeeded', 'failed', 'cancelled') or time.monotonic() > deadline:
+            break
+        time.sleep(0.05)
+    assert status['status'] == 'succeeded'
+    assert status['result']['profile']['mode'] == 'sample'
+    assert status['result']['profile']['samples'] > 0
+    assert profiled_app.post('/train?profile=sample').status_code == 403
+
+
+def test_sampler_attributes_time_to_the_hot_function():
+    sampler = SamplingProfiler(interval=0.001).start()
+    _busy(0.15)
+    sampler.stop()
+    top = sampler.top(5)
+    assert sampler.samples > 10
+    assert top[0]['function'].startswith('_busy') and top[0]['self_percent'] > 50
+    assert top[0]['inclusive_percent'] > 90
+
+
+def test_old_profiles_are_pruned(tmp_path, monkeypatch):
+    monkeypatch.setitem(profiling.PROFILING_CONFIG, 'output_dir', str(tmp_path))
+    monkeypatch.setitem(profiling.PROFILING_CONFIG, 'max_stored', 3)
+    for _ in range(5):
+        result, profile = profile_call('cprofile', 'unit', _busy, 0.001)
+        assert result == 'done'
+    assert len(list(tmp_path.iterdir())) == 3
+    with pytest.raises(ValueError):
+        profile_call('perf', 'unit', _busy, 0)
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, '-q']))
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Parity tests: the lexicon sentiment engine against TextBlob
+Runs without a server: python -m pytest test_sentiment.py
+"""
+
+import os
+import random
+import shutil
+import tempfile
+
+import pandas as pd
+from textblob import TextBlob
+
+import featurizer
+from config import FEATURE_CONFIG
+from featurizer import tokenize
+from sentiment import default_lexicon_path, get_lexicon
+
+# Negations, intensifiers and "-ly" modifiers exercise the sequential rules
+TRICKY_TEXTS = [
+    "This is not good",
+    "Not a very good idea at all",
+    "Really not bad news",
+    "Very very good results!",
+    "Never really happy",
+    "It is terribly bad, and hardly not good",
+    "no",
+    "",
+    "Scientists confirm the amazing miracle cure is absolutely FALSE",
+]
+
+
+def _assert_parity(texts):
+    lexicon = get_lexicon()
+    cleaned = [' '.join(tokenize(t)) for t in texts]
+    scores = lexicon.score_batch([t.split() for t in cleaned])
+    for text, score in zip(cleaned, scores):
+        expected = tuple(TextBlob(text).sentiment)
+        assert score == expected, f"{text!r}: {score} != {expected}"
+
+
+def test_parity_on_tricky_sentences():
+    _assert_parity(TRICKY_TEXTS)
+
+
+def test_parity_on_dataset():
+    _assert_parity(list(pd.read_csv('expanded_dataset.csv')['text']))
+
+
+def test_parity_on_random_lexicon_sentences():
+    words = list(get_lexicon().index) + ['not', 'no', 'never', 'the', 'a', 'is', 'news']
+    rng = random.Random(7)
+    texts = [' '.join(rng.choice(words) for _ in range(rng.randint(1, 30))) for _ in range(500)]
+    _assert_parity(texts)
+
+
+def test_batch_without_lexicon_words():
+    assert get_lexicon().score_batch([['zorblax', 'qwerty'], []]) == [(0.0, 0.0), (0.0, 0.0)]
+
+
+def test_custom_lexicon_is_loaded_once_per_path():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'custom-sentiment.xml')
+        shutil.copy(default_lexicon_path(), path)
+        lexicon = get_lexicon(path)
+        assert get_lexicon(path) is lexicon
+        assert get_lexicon(os.path.join(tmp, '.', 'custom-sentiment.xml')) is lexicon
+        assert lexicon is not get_lexicon()
+
+        previous = FEATURE_CONFIG.get('sentiment_lexicon_path')
+        FEATURE_CONFIG['sentiment_lexicon_path'] = path
+        try:
+            assert featurizer.sentiment_lexicon() is lexicon
+        finally:
+            FEATURE_CONFIG['sentiment_lexicon_path'] = previous
+
+
+if __name__ == "__main__":
+    test_parity_on_tricky_sentences()
+    test_parity_on_dataset()
+    test_parity_on_random_lexicon_sentences()
+    test_batch_without_lexicon_words()
+    test_custom_lexicon_is_loaded_once_per_path()
+    print("✅ Sentiment engine matches TextBlob")
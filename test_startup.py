@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Tests for lazy startup: importing app loads no model, ML libraries or AI/search client
+Runs offline: python -m pytest test_startup.py
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+import app as app_module
+
+FRESH_PROCESS = """
+import json, sys
+import app
+client = app.app.test_client()
+health = client.get('/health').get_json()
+imported = sorted(m for m in ('openai', 'duckduckgo_search', 'nltk', 'sklearn', 'pandas') if m in sys.modules)
+loaded_at_import = app.detector is not None
+prediction = client.post('/predict', json={'text': 'Scientists publish peer reviewed study', 'use_ai': False})
+print(json.dumps({
+    'health': health,
+    'imported': imported,
+    'loaded_at_import': loaded_at_import,
+    'prediction_status': prediction.status_code,
+    'loaded_after_predict': app.detector is not None and app.detector.is_trained,
+    'imported_after_ml_predict': sorted(m for m in ('openai', 'duckduckgo_search') if m in sys.modules),
+}))
+"""
+
+
+def test_import_loads_nothing_until_first_use():
+    output = subprocess.run([sys.executable, '-c', FRESH_PROCESS], capture_output=True, text=True,
+                            check=True, timeout=300).stdout
+    state = json.loads(output.strip().splitlines()[-1])
+    assert state['imported'] == [] and state['loaded_at_import'] is False
+    assert state['health']['status'] == 'healthy'
+    assert state['health']['model_loaded'] is False and state['health']['cache']['prediction'] is None
+    assert state['prediction_status'] == 200 and state['loaded_after_predict']
+    # An ML-only prediction never touches the AI or search clients
+    assert state['imported_after_ml_predict'] == []
+
+
+HEALTH_ONLY = """
+import json, app
+print(json.dumps(app.app.test_client().get('/health').get_json()))
+"""
+
+
+@pytest.mark.parametrize('api_key', [None, 'sk-test'])
+def test_health_reports_ai_from_the_key_before_it_loads(api_key):
+    env = {name: value for name, value in os.environ.items() if name != 'OPENAI_API_KEY'}
+    if api_key:
+        env['OPENAI_API_KEY'] = api_key
+    output = subprocess.run([sys.executable, '-c', HEALTH_ONLY], capture_output=True, text=True,
+                            check=True, timeout=120, env=env).stdout
+    health = json.loads(output.strip().splitlines()[-1])
+    assert health['ai_available'] is bool(api_key)
+    assert health['hybrid_available'] is bool(api_key)
+
+
+def test_lazy_components_are_created_once():
+    assert app_module.get_web_verifier() is app_module.get_web_verifier()
+    assert app_module.get_ai_analyzer() is app_module.get_ai_analyzer()
+    hybrid = app_module.get_hybrid_analyzer()
+    if hybrid is not None:
+        assert hybrid.ml_model is app_module.get_detector()
+    health = app_module.app.test_client().get('/health').get_json()
+    assert health['model_loaded']
+    assert health['ai_available'] == bool(app_module.ai_analyzer and app_module.ai_analyzer.api_key)
+
+
+def test_warm_up_loads_the_model_in_the_background():
+    app_module.start_warm_up().join(120)
+    assert app_module.detector is not None and app_module.detector.is_trained
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, '-q']))
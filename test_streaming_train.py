@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Tests for chunked dataset reading and out-of-core training
+Runs offline: python -m pytest test_streaming_train.py
+"""
+
+import pandas as pd
+import pytest
+
+from detector import FakeNewsDetector
+from streaming_train import iter_chunks, labeled_rows
+
+FAKE_TEXT = "BREAKING: Scientists discover that drinking hot water with lemon cures all diseases instantly!"
+
+
+def _dataset():
+    return pd.read_csv('expanded_dataset.csv')
+
+
+def test_csv_is_read_in_bounded_chunks(tmp_path):
+    path = tmp_path / 'data.csv'
+    _dataset().to_csv(path, index=False)
+    chunks = list(iter_chunks(str(path), 16))
+    assert all(len(chunk) <= 16 for chunk, _ in chunks)
+    assert sum(len(chunk) for chunk, _ in chunks) == len(_dataset())
+    assert chunks[-1][1] == 1.0
+
+
+def test_labeled_rows_accepts_label_names_and_drops_bad_rows():
+    chunk = pd.DataFrame({
+        'text': ["real story", "fake story", None, "  ", "unknown label", "float label"],
+        'label': ['REAL', 'fake', 1, 0, 'maybe', 1.0],
+    })
+    assert labeled_rows(chunk) == (["real story", "fake story", "float label"], [0, 1, 1])
+
+
+@pytest.mark.parametrize('fmt', ['csv', 'jsonl'])
+def test_streaming_training_produces_a_working_model(tmp_path, fmt):
+    path = tmp_path / f'data.{fmt}'
+    df = pd.concat([_dataset()] * 5, ignore_index=True).sample(frac=1, random_state=0)
+    if fmt == 'csv':
+        df.to_csv(path, index=False)
+    else:
+        df.to_json(path, orient='records', lines=True)
+
+    detector = FakeNewsDetector(mode='online')
+    stages = []
+    report = detector.train_streaming(str(path), chunksize=50, progress=lambda stage, fraction: stages.append(fraction))
+
+    assert report['rows'] == len(df)
+    assert report['chunks'] == -(-len(df) // 50)
+    assert report['rows_per_s'] > 0
+    assert report['progressive_accuracy'] is not None
+    assert stages == sorted(stages) and stages[-1] <= 0.95
+    assert detector.is_trained and detector.model_version
+    assert detector.predict(FAKE_TEXT)['prediction'] in ('FAKE', 'REAL')
+
+
+def test_parquet_input(tmp_path):
+    pytest.importorskip('pyarrow')
+    path = tmp_path / 'data.parquet'
+    _dataset().to_parquet(path)
+    detector = FakeNewsDetector(mode='online')
+    assert detector.train_streaming(str(path), chunksize=20)['rows'] == len(_dataset())
+
+
+def test_streaming_training_requires_online_mode(tmp_path):
+    path = tmp_path / 'data.csv'
+    _dataset().to_csv(path, index=False)
+    with pytest.raises(ValueError):
+        FakeNewsDetector(mode='batch').train_streaming(str(path))
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, '-q']))
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Offline tests for WebVerifier with a stubbed search engine and a local page server
+Runs without network access: python -m pytest test_web_verifier.py
+"""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from fake_search import StaticSearchBackend
+from web_verifier import WebVerifier
+
+CLAIM = "Scientists confirm that drinking lemon water cures all diseases"
+
+
+class PageServer:
+    """Serves /<name>?delay=<seconds> as a tiny HTML page titled <name>"""
+
+    def __init__(self):
+        self.connections = 0
+        self._lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            disable_nagle_algorithm = True
+
+            def setup(self):
+                super().setup()
+                with server._lock:
+                    server.connections += 1
+
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                path, _, query = self.path.partition('?')
+                if query.startswith('delay='):
+                    time.sleep(float(query[len('delay='):]))
+                body = f"<html><head><title>{path.strip('/')}</title></head><body>x</body></html>".encode()
+                try:
+                    self.send_response(200)
+                    self.send_header('Content-Type', 'text/html; charset=utf-8')
+                    self.send_header('Content-Length', str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                except (BrokenPipeError, ConnectionResetError):
+                    # A verifier past its deadline has already given up on this page
+                    pass
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def url(self, name, delay=0.0):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/{name}?delay={delay}"
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def test_title_fetches_run_in_parallel_and_keep_rank_order():
+    pages = PageServer()
+    try:
+        hits = [{'href': pages.url(f'page{i}', delay=0.3), 'title': '', 'body': ''} for i in range(6)]
+        hits.insert(2, {'href': 'https://www.reuters.com/a', 'title': 'Ranked title', 'body': ''})
+        verifier = WebVerifier(fetch_workers=8, deadline=5, search_backend=StaticSearchBackend(hits), cache_path='')
+        start = time.perf_counter()
+        result = verifier.verify(CLAIM)
+        elapsed = time.perf_counter() - start
+
+        titles = [source['title'] for source in result['sources']]
+        assert titles == ['page0', 'page1', 'Ranked title', 'page2', 'page3', 'page4', 'page5']
+        # Six 0.3s fetches one after another would take 1.8s
+        assert elapsed < 1.0
+    finally:
+        pages.stop()
+
+
+def test_deadline_bounds_whole_verification():
+    pages = PageServer()
+    try:
+        hits = [
+            {'href': pages.url('fast'), 'title': '', 'body': ''},
+            {'href': pages.url('slow', delay=3), 'title': '', 'body': ''},
+        ]
+        verifier = WebVerifier(fetch_workers=4, deadline=0.5, search_backend=StaticSearchBackend(hits), cache_path='')
+        start = time.perf_counter()
+        result = verifier.verify(CLAIM)
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 1.5
+        assert [source['title'] for source in result['sources']] == ['fast', '(No title)']
+        assert 'summary' in result
+    finally:
+        pages.stop()
+
+
+def test_deadline_bounds_a_slow_search():
+    backend = StaticSearchBackend(latency=3)
+    verifier = WebVerifier(deadline=0.3, search_backend=backend, cache_path='')
+    start = time.perf_counter()
+    result = verifier.verify(CLAIM)
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 1.0
+    assert 'timed out' in result['error']
+    assert len(verifier.search_cache) == 0
+
+
+def test_no_title_fetches_once_the_search_used_the_budget():
+    pages = PageServer()
+    try:
+        hits = [{'href': pages.url('late'), 'title': '', 'body': ''}]
+
+        class OverrunVerifier(WebVerifier):
+            def search(self, query, timeout=None):
+                # Answers just after the deadline passes
+                time.sleep(timeout + 0.05)
+                return hits, False
+
+        result = OverrunVerifier(deadline=0.2, search_backend=StaticSearchBackend(), cache_path='').verify(CLAIM)
+        assert [source['title'] for source in result['sources']] == ['(No title)']
+        assert pages.connections == 0
+    finally:
+        pages.stop()
+
+
+def test_sessions_reuse_connections_per_host():
+    pages = PageServer()
+    try:
+        hits = [{'href': pages.url(f'page{i}'), 'title': '', 'body': ''} for i in range(4)]
+        verifier = WebVerifier(fetch_workers=1, deadline=5, search_backend=StaticSearchBackend(hits), cache_path='')
+        for i in range(3):
+            verifier.verify(f"{CLAIM} {i}")
+
+        # One worker thread, one kept-alive connection for all twelve fetches
+        assert pages.connections == 1
+    finally:
+        pages.stop()
+
+
+def test_search_results_are_cached_by_normalized_query():
+    backend = StaticSearchBackend()
+    verifier = WebVerifier(search_backend=backend, cache_path='')
+
+    first = verifier.verify(CLAIM)
+    second = verifier.verify("  " + CLAIM.upper().replace(' ', '   ') + " ")
+    assert backend.calls == 1
+    assert first['cached'] is False and second['cached'] is True
+    assert second['sources'] == first['sources']
+
+    # max_results is part of the key
+    verifier.max_results = 2
+    assert verifier.verify(CLAIM)['cached'] is False
+    assert backend.calls == 2
+
+
+def test_search_cache_expires_after_ttl():
+    backend = StaticSearchBackend()
+    verifier = WebVerifier(search_backend=backend, cache_path='')
+    verifier.search_cache_ttl = 0.2
+
+    verifier.verify(CLAIM)
+    verifier.verify(CLAIM)
+    time.sleep(0.3)
+    assert verifier.verify(CLAIM)['cached'] is False
+    assert backend.calls == 2
+
+
+def test_failed_searches_are_not_cached():
+    def flaky(query):
+        raise RuntimeError("ratelimited")
+
+    verifier = WebVerifier(search_backend=StaticSearchBackend(results_fn=flaky), cache_path='')
+    assert 'error' in verifier.verify(CLAIM)
+    verifier.search_backend = StaticSearchBackend()
+    assert verifier.verify(CLAIM)['cached'] is False
+
+
+def test_disk_tier_is_shared_between_verifiers(tmp_path):
+    path = str(tmp_path / 'search.sqlite3')
+    first_backend, second_backend = StaticSearchBackend(), StaticSearchBackend()
+    WebVerifier(search_backend=first_backend, cache_path=path).verify(CLAIM)
+
+    other = WebVerifier(search_backend=second_backend, cache_path=path)
+    result = other.verify(CLAIM)
+    assert result['cached'] is True
+    assert second_backend.calls == 0
+    assert other.cache_stats()['disk']['hits'] == 1
+    # Promoted into the memory tier
+    other.verify(CLAIM)
+    assert other.cache_stats()['memory']['hits'] == 1
+
+
+if __name__ == "__main__":
+    import pytest
+    raise SystemExit(pytest.main([__file__, '-q']))
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Background training jobs for the Fake News Detection System
+Runs training off the request thread and tracks status, progress and cancellation
+"""
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+QUEUED = 'queued'
+RUNNING = 'running'
+SUCCEEDED = 'succeeded'
+FAILED = 'failed'
+CANCELLED = 'cancelled'
+FINISHED_STATES = (SUCCEEDED, FAILED, CANCELLED)
+
+
+class TrainingCancelled(Exception):
+    """Raised from a progress report once the job has been asked to stop"""
+
+
+class TrainingJob:
+    """State of one training run; report() doubles as the cancellation checkpoint"""
+
+    def __init__(self):
+        self.job_id = uuid.uuid4().hex
+        self.status = QUEUED
+        self.stage = None
+        self.progress = 0.0
+        self.result = None
+        self.error = None
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self._cancel_requested = threading.Event()
+        self._lock = threading.Lock()
+
+    @property
+    def cancel_requested(self) -> bool:
+        return self._cancel_requested.is_set()
+
+    def report(self, stage: str, progress: float) -> None:
+        """Record progress (0-1) for a stage; raises TrainingCancelled if cancellation was requested"""
+        with self._lock:
+            self.stage = stage
+            self.progress = round(max(self.progress, min(1.0, progress)), 4)
+        if self.cancel_requested:
+            raise TrainingCancelled(f"Cancelled during {stage}")
+
+    def _finish(self, status: str, result: Optional[Dict] = None, error: Optional[str] = None) -> None:
+        with self._lock:
+            self.status = status
+            self.result = result
+            self.error = error
+            self.finished_at = time.time()
+            if status == SUCCEEDED:
+                self.progress = 1.0
+
+    def to_dict(self) -> Dict:
+        with self._lock:
+            return {
+                'job_id': self.job_id,
+                'status': self.status,
+                'stage': self.stage,
+                'progress': self.progress,
+                'cancel_requested': self.cancel_requested,
+                'result': self.result,
+                'error': self.error,
+                'created_at': self.created_at,
+                'started_at': self.started_at,
+                'finished_at': self.finished_at,
+            }
+
+
+class TrainingJobManager:
+    """
+    Runs training functions on a small worker pool (one at a time by default,
+    so jobs queue up rather than compete for CPU). Keeps the most recent
+    `history` jobs for status queries.
+    """
+
+    def __init__(self, max_workers: int = 1, history: int = 50):
+        self.history = history
+        self._jobs: 'OrderedDict[str, TrainingJob]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='training')
+
+    def submit(self, fn: Callable[[TrainingJob], Dict]) -> TrainingJob:
+        """Queue fn(job); its return value becomes the job result"""
+        job = TrainingJob()
+        with self._lock:
+            self._jobs[job.job_id] = job
+            # Forget the oldest finished jobs beyond the history limit
+            for job_id in [j for j, old in self._jobs.items() if old.status in FINISHED_STATES]:
+                if len(self._jobs) <= self.history:
+                    break
+                del self._jobs[job_id]
+        self._executor.submit(self._run, job, fn)
+        return job
+
+    def _run(self, job: TrainingJob, fn: Callable[[TrainingJob], Dict]) -> None:
+        if job.cancel_requested:
+            job._finish(CANCELLED, error='Cancelled before start')
+            return
+        with job._lock:
+            job.status = RUNNING
+            job.started_at = time.time()
+        try:
+            result = fn(job)
+        except TrainingCancelled as e:
+            job._finish(CANCELLED, error=str(e))
+        except Exception as e:
+            job._finish(FAILED, error=str(e))
+        else:
+            job._finish(SUCCEEDED, result=result)
+
+    def get(self, job_id: str) -> Optional[TrainingJob]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def jobs(self) -> List[TrainingJob]:
+        with self._lock:
+            return list(self._jobs.values())
+
+    def cancel(self, job_id: str) -> Optional[TrainingJob]:
+        """Ask a job to stop; a running job stops at its next progress report"""
+        job = self.get(job_id)
+        if job is not None and job.status not in FINISHED_STATES:
+            job._cancel_requested.set()
+        return job
@@ -1,128 +1,269 @@
-#!/usr/bin/env python3
-from typing import List, Dict, Tuple
-from urllib.parse import urlparse
-import re
-
-from duckduckgo_search import DDGS
-import requests
-from bs4 import BeautifulSoup
-
-TRUSTED_DOMAINS = {
-    'reuters.com', 'apnews.com', 'bbc.com', 'bbc.co.uk', 'nytimes.com', 'washingtonpost.com',
-    'theguardian.com', 'npr.org', 'associatedpress.com', 'factcheck.org', 'snopes.com', 'politifact.com',
-    'fullfact.org', 'afp.com', 'apnews.com', 'bloomberg.com', 'wsj.com', 'aljazeera.com', 'cbsnews.com',
-    'abcnews.go.com', 'nbcnews.com', 'sciencemag.org', 'nature.com', 'who.int', 'cdc.gov', 'europa.eu'
-}
-
-SUSPECT_DOMAINS = {
-    'beforeitsnews.com', 'worldtruth.tv', 'yournewswire.com', 'infowars.com', 'naturalnews.com'
-}
-
-class WebVerifier:
-    def __init__(self, max_results: int = 8, fetch_timeout: int = 6):
-        self.max_results = max_results
-        self.fetch_timeout = fetch_timeout
-
-    def _extract_domain(self, url: str) -> str:
-        try:
-            netloc = urlparse(url).netloc.lower()
-            # keep last two parts for domain.com, handle co.uk etc.
-            parts = netloc.split('.')
-            if len(parts) >= 2:
-                return '.'.join(parts[-2:])
-            return netloc
-        except Exception:
-            return ''
-
-    def _credibility_label(self, domain: str) -> str:
-        if domain in TRUSTED_DOMAINS:
-            return 'trusted'
-        if domain in SUSPECT_DOMAINS:
-            return 'suspect'
-        return 'unknown'
-
-    def _score_overall(self, items: List[Dict]) -> Dict:
-        trusted = sum(1 for i in items if i['credibility'] == 'trusted')
-        suspect = sum(1 for i in items if i['credibility'] == 'suspect')
-        total = max(1, len(items))
-        support_score = sum(1 for i in items if i.get('stance') == 'supports')
-        refute_score = sum(1 for i in items if i.get('stance') == 'refutes')
-        neutral = total - support_score - refute_score
-
-        # credibility score based on trusted vs suspect ratio
-        credibility = max(0, min(100, int(60 + (trusted - suspect) * 10)))
-
-        # verdict
-        if refute_score > support_score and trusted > 0:
-            verdict = 'LIKELY_FAKE'
-        elif support_score > refute_score and trusted > 0:
-            verdict = 'LIKELY_REAL'
-        else:
-            verdict = 'INCONCLUSIVE'
-
-        return {
-            'credibility_score': credibility,
-            'verdict': verdict,
-            'counts': {
-                'trusted': trusted,
-                'suspect': suspect,
-                'neutral': neutral,
-                'support': support_score,
-                'refute': refute_score
-            }
-        }
-
-    def _infer_stance_from_snippet(self, snippet: str) -> str:
-        text = snippet.lower()
-        refute_keywords = ['false', 'fake', 'hoax', 'debunk', 'not true', 'misleading', 'no evidence']
-        support_keywords = ['confirms', 'confirmed', 'announced', 'reports', 'evidence shows', 'official']
-        if any(k in text for k in refute_keywords):
-            return 'refutes'
-        if any(k in text for k in support_keywords):
-            return 'supports'
-        return 'neutral'
-
-    def _safe_fetch_title(self, url: str) -> str:
-        try:
-            r = requests.get(url, timeout=self.fetch_timeout, headers={'User-Agent': 'Mozilla/5.0'})
-            if r.ok and 'text/html' in r.headers.get('Content-Type', ''):
-                soup = BeautifulSoup(r.text, 'html.parser')
-                title = soup.title.string.strip() if soup.title and soup.title.string else ''
-                return title[:200]
-        except Exception:
-            pass
-        return ''
-
-    def verify(self, text: str) -> Dict:
-        query = text.strip()
-        if len(query) > 220:
-            query = query[:220]
-        results: List[Dict] = []
-        try:
-            with DDGS() as ddgs:
-                for res in ddgs.text(query, max_results=self.max_results, safesearch='moderate', timelimit='y'):  # past year
-                    url = res.get('href') or res.get('url') or ''
-                    title = res.get('title') or ''
-                    snippet = res.get('body') or res.get('snippet') or ''
-                    domain = self._extract_domain(url)
-                    credibility = self._credibility_label(domain)
-                    stance = self._infer_stance_from_snippet(snippet or title)
-                    if not title:
-                        title = self._safe_fetch_title(url)
-                    results.append({
-                        'title': title[:160] if title else '(No title)',
-                        'snippet': snippet[:240] if snippet else '',
-                        'url': url,
-                        'domain': domain,
-                        'credibility': credibility,
-                        'stance': stance
-                    })
-        except Exception as e:
-            return {'error': f'Web verification failed: {e}'}
-
-        summary = self._score_overall(results)
-        return {
-            'query': query,
-            'summary': summary,
-            'sources': results
-        }
+#!/usr/bin/env python3
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout, wait
+from typing import List, Dict, Optional, Tuple
+from urllib.parse import urlparse
+import re
+import threading
+import time
+
+from duckduckgo_search import DDGS
+import requests
+from requests.adapters import HTTPAdapter
+
+from cache import LRUCache, make_cache_key
+from config import VERIFY_CONFIG
+from domains import ReputationIndex, get_public_suffixes
+from html_title import fetch_title
+from keyword_matcher import get_matcher
+from metrics import record_cache, stage
+from persistent_cache import SQLiteCache
+
+TRUSTED_DOMAINS = {
+    'reuters.com', 'apnews.com', 'bbc.com', 'bbc.co.uk', 'nytimes.com', 'washingtonpost.com',
+    'theguardian.com', 'npr.org', 'associatedpress.com', 'factcheck.org', 'snopes.com', 'politifact.com',
+    'fullfact.org', 'afp.com', 'apnews.com', 'bloomberg.com', 'wsj.com', 'aljazeera.com', 'cbsnews.com',
+    'abcnews.go.com', 'nbcnews.com', 'sciencemag.org', 'nature.com', 'who.int', 'cdc.gov', 'europa.eu'
+}
+
+SUSPECT_DOMAINS = {
+    'beforeitsnews.com', 'worldtruth.tv', 'yournewswire.com', 'infowars.com', 'naturalnews.com'
+}
+
+WHITESPACE_RE = re.compile(r'\s+')
+
+
+def normalize_query(query: str) -> str:
+    """Case- and whitespace-insensitive form of a query, used for cache keys"""
+    return WHITESPACE_RE.sub(' ', query).strip().lower()
+
+
+class DDGSearchBackend:
+    """DuckDuckGo text search; yields dicts with href/title/body keys"""
+
+    name = 'ddg'
+
+    def search(self, query: str, max_results: int, timelimit: Optional[str]) -> List[Dict]:
+        with DDGS() as ddgs:
+            return list(ddgs.text(query, max_results=max_results,
+                                  safesearch=VERIFY_CONFIG['safesearch'], timelimit=timelimit))
+
+
+class WebVerifier:
+    def __init__(self, max_results: int = 8, fetch_timeout: int = 6,
+                 fetch_workers: Optional[int] = None, deadline: Optional[float] = None,
+                 search_backend=None, cache_path: Optional[str] = None):
+        self.max_results = max_results
+        self.fetch_timeout = fetch_timeout
+        self.timelimit = VERIFY_CONFIG['timelimit']
+        self.search_backend = search_backend or DDGSearchBackend()
+        # Search results: in-memory LRU tier plus an optional on-disk tier (empty path disables it)
+        self.search_cache_ttl = VERIFY_CONFIG['search_cache_ttl']
+        self.search_cache = LRUCache(VERIFY_CONFIG['search_cache_size'])
+        self.cache_path = VERIFY_CONFIG['search_cache_path'] if cache_path is None else cache_path
+        self._disk_cache = None
+        self._cache_lock = threading.Lock()
+        self.suffixes = get_public_suffixes(VERIFY_CONFIG['public_suffix_path'])
+        self.reputation = self._load_reputation(VERIFY_CONFIG['reputation_path'])
+        # Budget (seconds) for a whole verify() call, search plus title fetches
+        self.deadline = VERIFY_CONFIG['deadline'] if deadline is None else deadline
+        self.fetch_workers = fetch_workers or VERIFY_CONFIG['fetch_workers']
+        self._executor = ThreadPoolExecutor(max_workers=self.fetch_workers, thread_name_prefix='title-fetch')
+        self._local = threading.local()
+
+    def _session(self) -> requests.Session:
+        """Per-thread session so connections to the same host are kept alive and reused"""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=VERIFY_CONFIG['pool_hosts'], pool_maxsize=VERIFY_CONFIG['pool_per_host'])
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            session.headers['User-Agent'] = 'Mozilla/5.0'
+            self._local.session = session
+        return session
+
+    @property
+    def disk_cache(self) -> Optional[SQLiteCache]:
+        if self._disk_cache is None and self.cache_path:
+            with self._cache_lock:
+                if self._disk_cache is None:
+                    self._disk_cache = SQLiteCache(
+                        self.cache_path,
+                        namespace='search_results',
+                        ttl=self.search_cache_ttl,
+                        max_entries=VERIFY_CONFIG['search_cache_max_entries']
+                    )
+        return self._disk_cache
+
+    def cache_stats(self) -> Dict:
+        # Don't create the cache file just to report on it
+        disk = self._disk_cache
+        return {
+            'memory': self.search_cache.stats(),
+            'disk': disk.stats() if disk is not None else None
+        }
+
+    def search(self, query: str, timeout: Optional[float] = None) -> Tuple[List[Dict], bool]:
+        """
+        Search results for a query and whether they came from the cache.
+        With a timeout (seconds) the backend call runs on the worker pool and raises
+        TimeoutError if it has not answered in time; nothing is cached then.
+        """
+        key = make_cache_key(normalize_query(query), self.max_results, self.timelimit)
+        now = time.time()
+        entry = self.search_cache.get(key)
+        if entry is None and self.disk_cache is not None:
+            entry = self.disk_cache.get(key)
+            if entry is not None:
+                self.search_cache.put(key, entry)
+        # The memory tier has no TTL of its own, so check the entry's age here
+        if entry is not None and now - entry['stored_at'] <= self.search_cache_ttl:
+            record_cache('search', True)
+            return entry['results'], True
+
+        record_cache('search', False)
+        with stage('search'):
+            if timeout is None:
+                results = self.search_backend.search(query, self.max_results, self.timelimit)
+            else:
+                future = self._executor.submit(self.search_backend.search, query, self.max_results, self.timelimit)
+                try:
+                    results = future.result(timeout=max(0.0, timeout))
+                except FutureTimeout:
+                    future.cancel()
+                    raise TimeoutError(f'search timed out after {timeout:.1f}s') from None
+        entry = {'stored_at': now, 'results': results}
+        self.search_cache.put(key, entry)
+        if self.disk_cache is not None:
+            self.disk_cache.put(key, entry)
+        return results, False
+
+    def _load_reputation(self, path: Optional[str]) -> ReputationIndex:
+        """Built-in trusted/suspect sets, overridden by an optional reputation list file"""
+        index = ReputationIndex.from_items(
+            [(d, 'trusted') for d in TRUSTED_DOMAINS] + [(d, 'suspect') for d in SUSPECT_DOMAINS],
+            self.suffixes
+        )
+        if path:
+            index = index.merged(ReputationIndex.from_file(path, suffixes=self.suffixes))
+        return index
+
+    def _extract_host(self, url: str) -> str:
+        try:
+            return urlparse(url).netloc.lower()
+        except Exception:
+            return ''
+
+    def _extract_domain(self, url: str) -> str:
+        """Registrable domain of a URL, e.g. bbc.co.uk for https://www.bbc.co.uk/news"""
+        return self.suffixes.registrable_domain(self._extract_host(url))
+
+    def _credibility_label(self, host: str) -> str:
+        return self.reputation.lookup(host) or 'unknown'
+
+    def _score_overall(self, items: List[Dict]) -> Dict:
+        trusted = sum(1 for i in items if i['credibility'] == 'trusted')
+        suspect = sum(1 for i in items if i['credibility'] == 'suspect')
+        total = max(1, len(items))
+        support_score = sum(1 for i in items if i.get('stance') == 'supports')
+        refute_score = sum(1 for i in items if i.get('stance') == 'refutes')
+        neutral = total - support_score - refute_score
+
+        # credibility score based on trusted vs suspect ratio
+        credibility = max(0, min(100, int(60 + (trusted - suspect) * 10)))
+
+        # verdict
+        if refute_score > support_score and trusted > 0:
+            verdict = 'LIKELY_FAKE'
+        elif support_score > refute_score and trusted > 0:
+            verdict = 'LIKELY_REAL'
+        else:
+            verdict = 'INCONCLUSIVE'
+
+        return {
+            'credibility_score': credibility,
+            'verdict': verdict,
+            'counts': {
+                'trusted': trusted,
+                'suspect': suspect,
+                'neutral': neutral,
+                'support': support_score,
+                'refute': refute_score
+            }
+        }
+
+    def _infer_stance_from_snippet(self, snippet: str) -> str:
+        cues = get_matcher('refutes', 'supports').counts(snippet)
+        if cues['refutes']:
+            return 'refutes'
+        if cues['supports']:
+            return 'supports'
+        return 'neutral'
+
+    def _safe_fetch_title(self, url: str, timeout: Optional[float] = None) -> str:
+        try:
+            return fetch_title(self._session(), url, timeout or self.fetch_timeout, VERIFY_CONFIG['title_max_bytes'])[:200]
+        except Exception:
+            return ''
+
+    def _fetch_titles(self, urls: List[str], deadline: float) -> List[str]:
+        """Fetch titles concurrently; anything unfinished at the deadline comes back empty"""
+        remaining = max(0.0, deadline - time.monotonic())
+        timeout = max(0.1, min(self.fetch_timeout, remaining))
+        futures = [self._executor.submit(self._safe_fetch_title, url, timeout) for url in urls]
+        wait(futures, timeout=remaining)
+        titles = []
+        for future in futures:
+            if future.done():
+                titles.append(future.result())
+            else:
+                future.cancel()
+                titles.append('')
+        return titles
+
+    def verify(self, text: str) -> Dict:
+        deadline = time.monotonic() + self.deadline
+        query = text.strip()
+        if len(query) > 220:
+            query = query[:220]
+        results: List[Dict] = []
+        try:
+            hits, cached = self.search(query, timeout=deadline - time.monotonic())
+            with stage('score_sources'):
+                for res in hits:
+                    url = res.get('href') or res.get('url') or ''
+                    title = res.get('title') or ''
+                    snippet = res.get('body') or res.get('snippet') or ''
+                    host = self._extract_host(url)
+                    domain = self.suffixes.registrable_domain(host)
+                    credibility = self._credibility_label(host)
+                    stance = self._infer_stance_from_snippet(snippet or title)
+                    results.append({
+                        'title': title,
+                        'snippet': snippet[:240] if snippet else '',
+                        'url': url,
+                        'domain': domain,
+                        'credibility': credibility,
+                        'stance': stance
+                    })
+        except Exception as e:
+            return {'error': f'Web verification failed: {e}'}
+
+        # Fill in missing titles in parallel, keeping search-rank order; a search that used
+        # up the whole budget leaves them as "(No title)"
+        missing = [item for item in results if not item['title']]
+        if missing and deadline - time.monotonic() > 0:
+            with stage('fetch_titles'):
+                titles = self._fetch_titles([item['url'] for item in missing], deadline)
+            for item, title in zip(missing, titles):
+                item['title'] = title
+        for item in results:
+            item['title'] = item['title'][:160] if item['title'] else '(No title)'
+
+        summary = self._score_overall(results)
+        return {
+            'query': query,
+            'cached': cached,
+            'summary': summary,
+            'sources': results
+        }